@@ -10,14 +10,25 @@ Bu uygulama, Google Gemini AI ile eğitim içeriği oluşturma ve
 
 
 # Gerekli kütüphanelerin içe aktarılması
-import bcrypt
+import json
 import re
 import logging
-import google.generativeai as genai
-from datetime import timedelta
-from flask import Flask, render_template, request, jsonify, g, session
+import time
+from datetime import datetime, timedelta
+from flask import (
+    Flask,
+    Response,
+    render_template,
+    request,
+    jsonify,
+    g,
+    session,
+    stream_with_context,
+)
 
-from auth.auth_manager import get_auth
+from auth.auth_manager import get_auth, get_session_manager
+from auth.bcrypt_executor import BcryptBusyError, get_bcrypt_executor
+from auth.last_login_buffer import get_last_login_buffer
 from auth.flask_auth import (
     login_required,
     optional_auth,
@@ -25,6 +36,7 @@ from auth.flask_auth import (
     get_client_info,
     login_user_session,
     logout_user_session,
+    log_activity,
     get_session_token,
     success_response,
     role_required,
@@ -35,15 +47,88 @@ from config.config_loader import load_config, get_secret_key
 from database.database_connection import (
     init_database,
     initialize_database_schema,
+    register_request_scope,
     get_db,
     get_system_config,
     get_user_settings,
     save_user_settings,
     get_user_gemini_api_key,
+    get_settings_cache,
+)
+from database.activity_log import get_activity_logger
+from database.pagination import (
+    InvalidCursorError,
+    cached_totals,
+    fetch_keyset_page,
+    invalidate_totals,
+    parse_page_args,
+)
+from database.user_counters import (
+    count_assignment,
+    count_assignments,
+    count_education,
+    get_recent_activity,
+    get_user_counters,
+    reconcile_user_counters,
+    record_assignment,
+    record_assignments,
+    record_education,
+)
+from database.maintenance import (
+    SESSION_CLEANUP_BATCH_SIZE,
+    SESSION_CLEANUP_INTERVAL,
+    USER_COUNTERS_RECONCILE_BATCH_SIZE,
+    USER_COUNTERS_RECONCILE_INTERVAL,
+    get_scheduler,
+)
+from database.migrations import apply_migrations
+
+from education.generate_education import generate_education_stream
+from education.evaluate_assignment import (
+    evaluate_assignment,
+    evaluate_assignment_stream,
+    extract_score,
+    EvaluationStreamParser,
+)
+from education.content_search import (
+    SEARCH_BACKFILL_BATCH_SIZE,
+    SEARCH_BACKFILL_INTERVAL,
+    build_search_text,
+    get_content_search,
+)
+from education.evaluation_dedup import (
+    stored_digest,
+    submission_digest,
+    find_recent_evaluation,
+    find_recent_evaluations,
+)
+from education.batch_evaluation import (
+    BatchLimitError,
+    BatchSubmissionError,
+    get_batch_evaluator,
+)
+from education.model_cache import (
+    DEFAULT_MODEL_NAME,
+    build_isolated_model,
+    get_model_cache,
+    key_fingerprint,
+)
+from education.llm_client import CircuitOpenError, get_resilient_caller
+from education.rate_limiter import (
+    RateLimitExceededError,
+    get_rate_limiter,
+    get_usage_recorder,
+)
+from education.response_cache import (
+    get_education_cache,
+    education_cache_key,
+    generate_education_cached,
+)
+from education.job_queue import (
+    get_job_queue,
+    JobQueueFullError,
+    JobLimitError,
 )
-
-from education.generate_education import generate_education
-from education.evaluate_assignment import evaluate_assignment
 
 # Yapılandırma ayarlarını yükle
 config = load_config()
@@ -52,30 +137,270 @@ config = load_config()
 # Gemini modeli alma fonsiyonu
 def get_user_gemini_model(user_id: int):
     """
-    Kullanıcının Gemini modelini ve API anahtarını alır ve modeli başlatır.
+    Kullanıcının Gemini modelini ve anahtar parmak izini model
+    önbelleğinden alır.
 
     Args:
         user_id (int): Kullanıcı ID'si
 
     Returns:
-        tuple: (model, api_key) veya (None, None) hata durumunda
+        tuple: (model, key_fingerprint) veya (None, None) hata durumunda
     """
     try:
-        api_key = get_user_gemini_api_key(user_id)
-        if not api_key:
-            return None, None
-
-        user_settings = get_user_settings(user_id)
-        if not user_settings:
-            return None, None
-
-        model_name = user_settings.get("gemini_model", "gemini-2.5-flash")
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel(model_name)
-        return model, api_key
+        return get_model_cache().get_user_model(user_id)
     except Exception as e:
         print(f"Gemini model oluşturma hatası: {e}")
         return None, None
+    finally:
+        # Ardından Gemini çağrısı yapılacağı için istek kapsamındaki
+        # bağlantı şimdiden havuza geri bırakılır
+        get_db().end_request_scope()
+
+
+# Oluşturulan eğitimi veri tabanına kaydetme fonksiyonu
+def save_education_content(user_id: int, subject: str, content: str) -> int:
+    """
+    Oluşturulan eğitimi veri tabanına kaydetme fonksiyonu
+
+    Kayıt ve kullanıcı sayaçları aynı işlemde yazılır.
+
+    Args:
+        user_id (int): Kullanıcı ID'si
+        subject (str): Ders adı
+        content (str): Eğitim içeriği
+
+    Returns:
+        int: Eklenen kaydın kimliği
+    """
+    db = get_db()
+    generated_at = datetime.now()
+
+    query = """
+        INSERT INTO education_contents
+         (user_id, subject, content, search_text)
+        VALUES (%s, %s, %s, %s)
+        """
+    with db.transaction(dictionary=False) as cursor:
+        cursor.execute(
+            query,
+            (user_id, subject, content, build_search_text(subject, content)),
+        )
+        content_id = cursor.lastrowid
+        count_education(cursor, user_id, generated_at)
+
+    invalidate_totals("education_contents", user_id)
+    record_education(user_id, subject, generated_at)
+    return content_id
+
+
+# Ödev değerlendirmesini veri tabanına kaydetme fonksiyonu
+def save_assignment_evaluation(
+    user_id: int,
+    assignment_text: str,
+    criteria: str,
+    evaluation_result: str,
+    score: float = None,
+) -> int:
+    """
+    Ödev değerlendirmesini veri tabanına kaydetme fonksiyonu
+
+    Kayıt ve kullanıcı sayaçları aynı işlemde yazılır.
+
+    Args:
+        user_id (int): Kullanıcı ID'si
+        assignment_text (str): Ödev metni
+        criteria (str): Değerlendirme kriterleri
+        evaluation_result (str): Değerlendirme raporu
+        score (float, optional): Puan
+
+    Returns:
+        int: Eklenen kaydın kimliği
+    """
+    db = get_db()
+    evaluated_at = datetime.now()
+
+    query = """
+        INSERT INTO assignment_evaluations
+         (user_id, assignment_text, criteria, submission_digest,
+          evaluation_result, score)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        """
+    with db.transaction(dictionary=False) as cursor:
+        cursor.execute(
+            query,
+            (user_id, assignment_text, criteria,
+             stored_digest(assignment_text, criteria, evaluation_result),
+             evaluation_result, score),
+        )
+        evaluation_id = cursor.lastrowid
+        count_assignment(cursor, user_id, score, evaluated_at)
+
+    invalidate_totals("assignment_evaluations", user_id)
+    record_assignment(user_id, assignment_text, evaluated_at)
+    return evaluation_id
+
+
+# Toplu ödev değerlendirmelerini veri tabanına kaydetme fonksiyonu
+def save_assignment_evaluations(
+    user_id: int, criteria: str, items: list
+) -> int:
+    """
+    Toplu ödev değerlendirmelerini veri tabanına kaydetme fonksiyonu
+
+    Tüm değerlendirmeler tek bir executemany çağrısıyla eklenir;
+    kayıtlar ve kullanıcı sayaçları aynı işlemde yazılır.
+
+    Args:
+        user_id (int): Kullanıcı ID'si
+        criteria (str): Değerlendirme kriterleri
+        items (list): assignment_text, evaluation ve score alanlı
+            değerlendirmeler
+
+    Returns:
+        int: Eklenen kayıt sayısı
+    """
+    if not items:
+        return 0
+
+    db = get_db()
+    evaluated_at = datetime.now()
+
+    query = """
+        INSERT INTO assignment_evaluations
+         (user_id, assignment_text, criteria, submission_digest,
+          evaluation_result, score)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        """
+    with db.transaction(dictionary=False) as cursor:
+        cursor.executemany(
+            query,
+            [(user_id, item["assignment_text"], criteria,
+              stored_digest(item["assignment_text"], criteria,
+                            item["evaluation"]),
+              item["evaluation"], item["score"])
+             for item in items],
+        )
+        inserted = cursor.rowcount
+        count_assignments(cursor, user_id,
+                          [item["score"] for item in items], evaluated_at)
+
+    invalidate_totals("assignment_evaluations", user_id)
+    record_assignments(
+        user_id, [item["assignment_text"] for item in items], evaluated_at
+    )
+    return inserted
+
+
+# Arka planda eğitim oluşturma işi fonksiyonu
+def run_education_job(
+    user_id: int, subject: str, model, bypass_cache: bool = False
+) -> dict:
+    """
+    Arka planda eğitim oluşturma işi fonksiyonu
+
+    İş kuyruğu işçisinde çalışır; eğitimi oluşturur ve
+    education_contents tablosuna kaydeder.
+
+    Args:
+        user_id (int): Kullanıcı ID'si
+        subject (str): Ders adı
+        model: Gemini modeli
+        bypass_cache (bool): Önbelleği atlayıp yeniden oluştur
+
+    Returns:
+        dict: Eğitim içeriği, ders adı ve önbellek bilgisi
+    """
+    education_result, cached = generate_education_cached(
+        subject, model=model, bypass_cache=bypass_cache
+    )
+    if education_result.startswith("Hata oluştu:"):
+        raise RuntimeError(education_result)
+
+    try:
+        save_education_content(user_id, subject, education_result)
+    except Exception as db_error:
+        # Veri tabanı hatasını günlüğe yaz, ancak devam et
+        logger.error(f"Eğitim veri tabanına kaydedilemedi: {db_error}")
+
+    return {"education": education_result,
+            "subject": subject,
+            "cached": cached}
+
+
+# Parola işlem havuzu dolu olduğunda yanıt döndürme fonksiyonu
+def password_busy_response():
+    """
+    Parola işlem havuzu dolu olduğunda yanıt döndürme fonksiyonu
+
+    Returns:
+        tuple: 503 yanıtı ve Retry-After başlığı
+    """
+    return (
+        jsonify({"success": False,
+                 "error": "Sunucu şu anda yoğun, lütfen tekrar deneyin"}),
+        503,
+        {"Retry-After": "1"},
+    )
+
+
+# Gemini isteği şimdilik yapılamadığında yanıt döndürme fonksiyonu
+def rate_limited_response(error, status: int = 429):
+    """
+    Gemini isteği şimdilik yapılamadığında yanıt döndürme fonksiyonu
+
+    Args:
+        error: retry_after özniteliği olan RateLimitExceededError veya
+            CircuitOpenError
+        status (int): HTTP durum kodu; devre açıkken 503
+
+    Returns:
+        tuple: Hata yanıtı ve Retry-After başlığı
+    """
+    return (
+        jsonify({"success": False, "error": str(error),
+                 "retry_after": error.retry_after}),
+        status,
+        {"Retry-After": str(error.retry_after)},
+    )
+
+
+# Sunucu gönderimli olay (SSE) iletisi oluşturma fonksiyonu
+def sse_event(event: str, data: dict) -> str:
+    """
+    Sunucu gönderimli olay (SSE) iletisi oluşturma fonksiyonu
+
+    Args:
+        event (str): Olay adı
+        data (dict): JSON olarak gönderilecek veri
+
+    Returns:
+        str: SSE biçiminde ileti
+    """
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+# SSE akışını Flask yanıtına dönüştürme fonksiyonu
+def sse_response(events) -> Response:
+    """
+    SSE akışını Flask yanıtına dönüştürme fonksiyonu
+
+    Args:
+        events: SSE iletileri üreten üreteç
+
+    Returns:
+        Response: text/event-stream yanıtı
+    """
+    # Teardown akış bitince çalışır; bağlantı akış boyunca tutulmaz
+    get_db().end_request_scope()
+    return Response(
+        stream_with_context(events),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 # Günlük yapılandırması
@@ -99,6 +424,9 @@ app.config["PERMANENT_SESSION_LIFETIME"] = timedelta(
 app.config["SESSION_COOKIE_SECURE"] = str(config.get("SESSION_COOKIE_SECURE", "False")).lower() == "true"
 app.config["SESSION_COOKIE_HTTPONLY"] = str(config.get("SESSION_COOKIE_HTTPONLY", "True")).lower() == "true"
 
+# İstek boyunca tek veri tabanı bağlantısı kullan
+register_request_scope(app)
+
 # Veri tabanını başlat
 if not init_database():
     print("HATA: Veri tabanı bağlantısı kurulamadı!")
@@ -127,6 +455,14 @@ if not init_database():
         print(f"Veri tabanı şeması oluşturulurken hata oluştu: {e}")
         exit(1)
 
+# Sonradan eklenen tabloları, sütunları ve dizinleri uygula
+try:
+    apply_migrations()
+except Exception as e:
+    logger.error(f"Veri tabanı geçişleri uygulanamadı: {e}")
+    print(f"HATA: Veri tabanı geçişleri uygulanamadı: {e}")
+    exit(1)
+
 # Google Gemini API'yi yapılandır
 system_api_key = get_system_config("GEMINI_API_KEY")
 if not system_api_key:
@@ -138,6 +474,29 @@ if not system_api_key:
         set_system_config("GEMINI_API_KEY", system_api_key)
         print("Sistem Gemini API anahtarı veri tabanına kaydedildi.")
 
+# Dönemsel bakım işlerini başlat
+maintenance_scheduler = get_scheduler()
+maintenance_scheduler.add_task(
+    "expired_sessions",
+    lambda: get_session_manager().cleanup_expired_sessions(
+        SESSION_CLEANUP_BATCH_SIZE
+    ),
+    SESSION_CLEANUP_INTERVAL,
+)
+maintenance_scheduler.add_task(
+    "user_counters_reconcile",
+    lambda: reconcile_user_counters(USER_COUNTERS_RECONCILE_BATCH_SIZE),
+    USER_COUNTERS_RECONCILE_INTERVAL,
+    run_at_start=True,
+)
+maintenance_scheduler.add_task(
+    "education_search_backfill",
+    lambda: get_content_search().backfill(SEARCH_BACKFILL_BATCH_SIZE),
+    SEARCH_BACKFILL_INTERVAL,
+    run_at_start=True,
+)
+maintenance_scheduler.start()
+
 print("Google Gemini API modülü yüklendi!")
 print("API anahtarları kullanıcı temelinde yönetilecek.")
 
@@ -199,6 +558,7 @@ def api_education():
     Eğitim oluşturma fonksiyonu
     JSON formatında bilgi alır ve eğitim oluşturur.
     Kullanıcı girişi yapmak gereklidir.
+    "no_cache": true gönderilirse önbellek atlanır.
     """
     try:
         # JSON verisini al
@@ -211,7 +571,7 @@ def api_education():
             return jsonify({"error": "Ders adı boş olamaz"}), 400
 
         # Kullanıcının Gemini modelini al
-        model, api_key = get_user_gemini_model(g.current_user["user_id"])
+        model, _ = get_user_gemini_model(g.current_user["user_id"])
         if not model:
             return (
                 jsonify(
@@ -223,32 +583,36 @@ def api_education():
                 400,
             )
 
-        # Eğitim oluştur
-        education_result = generate_education(subject, model=model)
+        # Eğitim oluştur (aynı parametreler için önbellekten)
+        education_result, cached = generate_education_cached(
+            subject, model=model, bypass_cache=bool(data.get("no_cache"))
+        )
 
         # Veri tabanına kaydet (isteğe bağlı)
         try:
-            db = get_db()
-
-            query = """
-                INSERT INTO education_contents (user_id, subject, content)
-                VALUES (%s, %s, %s)
-                """
-            db.execute_insert(
-                query, (g.current_user["user_id"], subject, education_result)
+            save_education_content(
+                g.current_user["user_id"], subject, education_result
             )
         except Exception as db_error:
             # Veri tabanı hatasını günlüğe yaz, ancak devam et
             print(f"Eğitim veri tabanına kaydedilemedi: {db_error}")
 
+        log_activity("education.generate",
+                     {"subject": subject, "cached": cached})
+
         return jsonify(
             {
                 "success": True,
                 "education": education_result,
                 "subject": subject,
+                "cached": cached,
                 "user": g.current_user["username"],
             }
         )
+    except RateLimitExceededError as e:
+        return rate_limited_response(e)
+    except CircuitOpenError as e:
+        return rate_limited_response(e, 503)
     except Exception as e:
         return (
             jsonify(
@@ -261,6 +625,212 @@ def api_education():
         )
 
 
+# Akışlı eğitim oluşturma yönlendirmesi
+@app.route("/api/education/stream", methods=["POST"])
+@login_required
+def api_education_stream():
+    """
+    Akışlı eğitim oluşturma fonksiyonu
+
+    Eğitim içeriğini Gemini'den geldikçe Server-Sent Events ile
+    tarayıcıya iletir ve akış bitince veri tabanına kaydeder.
+
+    Request Body:
+    {
+        "subject": "Python Programlama",
+        "no_cache": false  // isteğe bağlı
+    }
+
+    Events:
+        start: {"subject": "...", "cached": false}
+        chunk: {"text": "..."}
+        done: {"subject": "...", "length": 12345}
+        error: {"error": "..."}
+    """
+    # JSON verisini al
+    data = request.get_json()
+    if not data:
+        return jsonify({"error": "JSON verisi bulunamadı"}), 400
+
+    subject = data.get("subject", "").strip()
+    if not subject:
+        return jsonify({"error": "Ders adı boş olamaz"}), 400
+
+    # Kullanıcının Gemini modelini al
+    user_id = g.current_user["user_id"]
+    model, _ = get_user_gemini_model(user_id)
+    if not model:
+        return (
+            jsonify(
+                {
+                    "error": "Gemini API anahtarı bulunamadı. "
+                    "Lütfen ayarlar sayfasından API anahtarınızı girin."
+                }
+            ),
+            400,
+        )
+
+    # Aynı parametreler için önbellekteki eğitimi kullan
+    education_cache = get_education_cache()
+    cache_key = education_cache_key(subject, model=model)
+    cached_result = None
+    if not data.get("no_cache"):
+        cached_result = education_cache.get(cache_key)
+
+    log_activity("education.generate",
+                 {"subject": subject, "cached": cached_result is not None,
+                  "stream": True})
+
+    def events():
+        yield sse_event("start", {"subject": subject,
+                                  "cached": cached_result is not None})
+
+        if cached_result is not None:
+            education_result = cached_result
+            yield sse_event("chunk", {"text": education_result})
+        else:
+            chunks = []
+            try:
+                for text in generate_education_stream(subject, model=model):
+                    chunks.append(text)
+                    yield sse_event("chunk", {"text": text})
+            except (RateLimitExceededError, CircuitOpenError) as e:
+                yield sse_event("error", {"error": str(e),
+                                          "retry_after": e.retry_after})
+                return
+            except Exception as e:
+                logger.error(f"Akışlı eğitim oluşturma hatası: {e}")
+                yield sse_event("error",
+                                {"error": f"Eğitim oluşturulurken "
+                                          f"hata oluştu: {str(e)}"})
+                return
+
+            education_result = "".join(chunks)
+            education_cache.set(cache_key, subject,
+                                getattr(model, "model_name", ""),
+                                education_result)
+
+        # Veri tabanına kaydet (isteğe bağlı)
+        try:
+            save_education_content(user_id, subject, education_result)
+        except Exception as db_error:
+            # Veri tabanı hatasını günlüğe yaz, ancak devam et
+            logger.error(f"Eğitim veri tabanına kaydedilemedi: {db_error}")
+
+        yield sse_event("done", {"subject": subject,
+                                 "length": len(education_result)})
+
+    return sse_response(events())
+
+
+# Arka planda eğitim oluşturma işi başlatma yönlendirmesi
+@app.route("/api/education/jobs", methods=["POST"])
+@login_required
+def api_education_job_submit():
+    """
+    Arka planda eğitim oluşturma işi başlatma fonksiyonu
+
+    İsteği hemen yanıtlar; eğitim bir işçi havuzunda oluşturulur.
+
+    Request Body:
+    {
+        "subject": "Python Programlama",
+        "no_cache": false  // isteğe bağlı
+    }
+
+    Response (202):
+    {
+        "success": true,
+        "data": {
+            "job_id": "...",
+            "status": "queued"
+        }
+    }
+    """
+    try:
+        # JSON verisini al
+        data = request.get_json()
+        if not data:
+            return jsonify({"error": "JSON verisi bulunamadı"}), 400
+
+        subject = data.get("subject", "").strip()
+        if not subject:
+            return jsonify({"error": "Ders adı boş olamaz"}), 400
+
+        # Kullanıcının Gemini modelini al
+        user_id = g.current_user["user_id"]
+        model, _ = get_user_gemini_model(user_id)
+        if not model:
+            return (
+                jsonify(
+                    {
+                        "error": "Gemini API anahtarı bulunamadı. "
+                        "Lütfen ayarlar sayfasından API anahtarınızı girin."
+                    }
+                ),
+                400,
+            )
+
+        # İşi kuyruğa ekle
+        try:
+            job = get_job_queue().submit(
+                user_id,
+                run_education_job,
+                user_id,
+                subject,
+                model,
+                bypass_cache=bool(data.get("no_cache")),
+                metadata={"subject": subject},
+            )
+        except JobLimitError:
+            return jsonify({"success": False,
+                            "error": "Aynı anda en fazla izin verilen "
+                            "sayıda eğitim oluşturabilirsiniz. "
+                            "Lütfen mevcut işlerin bitmesini bekleyin."}), 429
+        except JobQueueFullError:
+            return jsonify({"success": False,
+                            "error": "Sistem şu anda yoğun. "
+                            "Lütfen daha sonra tekrar deneyin."}), 503
+
+        log_activity("education.job",
+                     {"subject": subject, "job_id": job.id})
+
+        return jsonify({"success": True,
+                        "data": {"job_id": job.id,
+                                 "status": job.status}}), 202
+
+    except Exception as e:
+        logger.error(f"Eğitim işi başlatma hatası: {e}")
+        return jsonify({"success": False,
+                        "error": "Eğitim işi başlatılamadı"}), 500
+
+
+# Eğitim oluşturma işinin durumu ve sonucu yönlendirmesi
+@app.route("/api/education/jobs/<job_id>", methods=["GET"])
+@login_required
+def api_education_job_status(job_id):
+    """
+    Eğitim oluşturma işinin durumunu ve sonucunu getirme fonksiyonu
+
+    Response:
+    {
+        "success": true,
+        "data": {
+            "job_id": "...",
+            "status": "queued" | "running" | "done" | "failed",
+            "subject": "Python Programlama",
+            "result": {"education": "...", "subject": "..."},  // done
+            "error": "..."  // failed
+        }
+    }
+    """
+    job = get_job_queue().get(job_id, user_id=g.current_user["user_id"])
+    if not job:
+        return jsonify({"success": False, "error": "İş bulunamadı"}), 404
+
+    return jsonify({"success": True, "data": job.to_dict()})
+
+
 # Ödev değerlendirme yönlendirmesi
 @app.route("/api/assignment_evaluate", methods=["POST"])
 @login_required
@@ -284,8 +854,30 @@ def api_assignment_evaluate():
         if not criteria:
             return jsonify({"error": "Değerlendirme kriteri boş olamaz"}), 400
 
+        # Aynı gönderim yakın zamanda değerlendirildiyse onu döndür
+        previous = find_recent_evaluation(
+            g.current_user["user_id"],
+            submission_digest(assignment_text, criteria),
+        )
+        if previous:
+            log_activity("assignment.evaluate",
+                         {"evaluation_id": previous["id"],
+                          "deduplicated": True})
+            return jsonify(
+                {
+                    "success": True,
+                    "evaluation": previous["evaluation_result"],
+                    "score": float(previous["score"])
+                    if previous["score"] is not None else None,
+                    "assignment_text": assignment_text,
+                    "criteria": criteria,
+                    "deduplicated": True,
+                    "user": g.current_user["username"],
+                }
+            )
+
         # Kullanıcının Gemini modelini al
-        model, api_key = get_user_gemini_model(g.current_user["user_id"])
+        model, _ = get_user_gemini_model(g.current_user["user_id"])
         if not model:
             return (
                 jsonify(
@@ -303,45 +895,38 @@ def api_assignment_evaluate():
                                                 model=model)
 
         # Veri tabanına kaydet (isteğe bağlı)
+        score = extract_score(evaluation_result)
         try:
-            db = get_db()
-
-            # Puan çıkarmaya çalış (basit regex ile)
-            score_match = re.search(
-                r"(\d+(?:\.\d+)?)\s*(?:puan|point|/)",
-                evaluation_result.lower(),
-            )
-            score = float(score_match.group(1)) if score_match else None
-
-            query = """
-                INSERT INTO assignment_evaluations
-                 (user_id, assignment_text, criteria, evaluation_result, score)
-                VALUES (%s, %s, %s, %s, %s)
-                """
-            db.execute_insert(
-                query,
-                (
-                    g.current_user["user_id"],
-                    assignment_text,
-                    criteria,
-                    evaluation_result,
-                    score,
-                ),
+            save_assignment_evaluation(
+                g.current_user["user_id"],
+                assignment_text,
+                criteria,
+                evaluation_result,
+                score,
             )
         except Exception as db_error:
             # Veri tabanı hatası logla ama devam et
             print(f"Ödev değerlendirmesi veri tabanına"
                   "kaydedilemedi: {db_error}")
 
+        log_activity("assignment.evaluate",
+                     {"score": score, "deduplicated": False})
+
         return jsonify(
             {
                 "success": True,
                 "evaluation": evaluation_result,
+                "score": score,
                 "assignment_text": assignment_text,
                 "criteria": criteria,
+                "deduplicated": False,
                 "user": g.current_user["username"],
             }
         )
+    except RateLimitExceededError as e:
+        return rate_limited_response(e)
+    except CircuitOpenError as e:
+        return rate_limited_response(e, 503)
     except Exception as e:
         return (
             jsonify(
@@ -354,6 +939,307 @@ def api_assignment_evaluate():
         )
 
 
+# Akışlı ödev değerlendirme yönlendirmesi
+@app.route("/api/assignment_evaluate/stream", methods=["POST"])
+@login_required
+def api_assignment_evaluate_stream():
+    """
+    Akışlı ödev değerlendirme fonksiyonu
+
+    Değerlendirme raporunu Server-Sent Events ile iletir. Puan satırı
+    geldiği anda, her bölüm ise tamamlandıkça gönderilir. Akış bitince
+    değerlendirme veri tabanına kaydedilir.
+
+    Request Body:
+    {
+        "assignment_text": "...",
+        "criteria": "..."
+    }
+
+    Events:
+        start: {"deduplicated": false}
+        chunk: {"text": "..."}
+        score: {"score": 85.0}
+        section: {"title": "GÜÇLÜ YÖNLER", "content": "..."}
+        done: {"score": 85.0, "length": 12345}
+        error: {"error": "..."}
+    """
+    # JSON verisini al
+    data = request.get_json()
+    if not data:
+        return jsonify({"error": "JSON verisi bulunamadı"}), 400
+
+    assignment_text = data.get("assignment_text", "").strip()
+    criteria = data.get("criteria", "").strip()
+
+    if not assignment_text:
+        return jsonify({"error": "Ödev metni boş olamaz"}), 400
+    if not criteria:
+        return jsonify({"error": "Değerlendirme kriteri boş olamaz"}), 400
+
+    # Aynı gönderim yakın zamanda değerlendirildiyse onu yeniden gönder
+    user_id = g.current_user["user_id"]
+    previous = find_recent_evaluation(
+        user_id, submission_digest(assignment_text, criteria)
+    )
+    if previous:
+        log_activity("assignment.evaluate",
+                     {"evaluation_id": previous["id"],
+                      "deduplicated": True, "stream": True})
+
+        def replay():
+            yield sse_event("start", {"deduplicated": True})
+            parser = EvaluationStreamParser()
+            text = previous["evaluation_result"]
+            yield sse_event("chunk", {"text": text})
+            for event, payload in parser.feed(text) + parser.finish():
+                yield sse_event(event, payload)
+            yield sse_event("done", {"score": parser.score,
+                                     "length": len(text)})
+
+        return sse_response(replay())
+
+    # Kullanıcının Gemini modelini al
+    model, _ = get_user_gemini_model(user_id)
+    if not model:
+        return (
+            jsonify(
+                {
+                    "error": "Gemini API anahtarı bulunamadı. "
+                    "Lütfen ayarlar sayfasından API anahtarınızı girin."
+                }
+            ),
+            400,
+        )
+
+    log_activity("assignment.evaluate",
+                 {"deduplicated": False, "stream": True})
+
+    def events():
+        yield sse_event("start", {"deduplicated": False})
+
+        parser = EvaluationStreamParser()
+        try:
+            for text in evaluate_assignment_stream(assignment_text,
+                                                   criteria,
+                                                   model=model):
+                yield sse_event("chunk", {"text": text})
+                for event, payload in parser.feed(text):
+                    yield sse_event(event, payload)
+        except (RateLimitExceededError, CircuitOpenError) as e:
+            yield sse_event("error", {"error": str(e),
+                                      "retry_after": e.retry_after})
+            return
+        except Exception as e:
+            logger.error(f"Akışlı ödev değerlendirme hatası: {e}")
+            yield sse_event("error",
+                            {"error": f"Ödev değerlendirilirken "
+                                      f"hata oluştu: {str(e)}"})
+            return
+
+        for event, payload in parser.finish():
+            yield sse_event(event, payload)
+
+        # Veri tabanına kaydet (isteğe bağlı)
+        try:
+            save_assignment_evaluation(user_id, assignment_text, criteria,
+                                       parser.text, parser.score)
+        except Exception as db_error:
+            # Veri tabanı hatası logla ama devam et
+            logger.error(f"Ödev değerlendirmesi veri tabanına "
+                         f"kaydedilemedi: {db_error}")
+
+        yield sse_event("done", {"score": parser.score,
+                                 "length": len(parser.text)})
+
+    return sse_response(events())
+
+
+# Toplu ödev değerlendirme yönlendirmesi
+@app.route("/api/assignment_evaluate/batch", methods=["POST"])
+@login_required
+def api_assignment_evaluate_batch():
+    """
+    Toplu ödev değerlendirme fonksiyonu
+
+    Aynı kriterlerle değerlendirilecek ödevleri JSON dizisi olarak veya
+    yüklenen ZIP/JSONL dosyası ile alır. Ödevler sınırlı bir işçi
+    havuzunda eş zamanlı değerlendirilir, her biri bittikçe Server-Sent
+    Events ile gönderilir. Yakın zamanda değerlendirilmiş gönderimler
+    yeniden değerlendirilmez. Yeni değerlendirmeler akışın sonunda tek
+    bir toplu INSERT ile kaydedilir.
+
+    Request Body (JSON):
+    {
+        "criteria": "...",
+        "submissions": ["...", {"name": "Ali", "assignment_text": "..."}]
+    }
+
+    Request Body (multipart/form-data):
+        criteria: Değerlendirme kriterleri
+        file: .zip (her metin dosyası bir ödev), .jsonl veya .json
+
+    Events:
+        start: {"total": 40, "to_evaluate": 38, "deduplicated": 2}
+        item: {"index": 0, "name": "Ali", "score": 85.0,
+               "evaluation": "...", "deduplicated": false,
+               "completed": 1, "total": 40}
+        item: {"index": 1, "name": "Ayşe", "error": "...",
+               "completed": 2, "total": 40}
+        done: {"evaluated": 37, "failed": 1, "deduplicated": 2,
+               "saved": 37, "avg_score": 78.4, "took_ms": 95000}
+        error: {"error": "...", "evaluated": 12, "saved": 12}
+    """
+    evaluator = get_batch_evaluator()
+    user_id = g.current_user["user_id"]
+
+    try:
+        upload = request.files.get("file")
+        if upload is not None:
+            criteria = request.form.get("criteria", "").strip()
+            submissions = evaluator.parse_upload(upload.filename or "",
+                                                 upload.read())
+        else:
+            data = request.get_json(silent=True)
+            if not data:
+                return jsonify({"error": "JSON verisi bulunamadı"}), 400
+            criteria = str(data.get("criteria", "")).strip()
+            submissions = evaluator.parse_items(data.get("submissions"))
+    except BatchSubmissionError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    if not criteria:
+        return jsonify({"error": "Değerlendirme kriteri boş olamaz"}), 400
+
+    if evaluator.is_active(user_id):
+        return (
+            jsonify({"success": False,
+                     "error": "Devam eden bir toplu değerlendirmeniz var"}),
+            429,
+        )
+
+    # Kullanıcının Gemini modelini al
+    model, api_key = get_user_gemini_model(user_id)
+    if not model:
+        return (
+            jsonify(
+                {
+                    "error": "Gemini API anahtarı bulunamadı. "
+                    "Lütfen ayarlar sayfasından API anahtarınızı girin."
+                }
+            ),
+            400,
+        )
+
+    # Aynı metin birden fazla kez gönderildiyse bir kez değerlendirilir
+    digests = [submission_digest(item["assignment_text"], criteria)
+               for item in submissions]
+    previous = find_recent_evaluations(user_id, digests)
+    pending = {}
+    for index, digest in enumerate(digests):
+        if digest not in previous:
+            pending.setdefault(digest, []).append(index)
+    groups = list(pending.values())
+    unique = [submissions[indexes[0]] for indexes in groups]
+    deduplicated = len(submissions) - sum(len(indexes) for indexes in groups)
+
+    log_activity("assignment.evaluate_batch",
+                 {"count": len(submissions), "to_evaluate": len(unique)})
+
+    def events():
+        started = time.monotonic()
+        total = len(submissions)
+        completed = 0
+        failed = 0
+        results = []
+
+        # Değerlendirilen kayıtları tek seferde kaydet
+        def save():
+            items = [
+                {"assignment_text": submissions[index]["assignment_text"],
+                 "evaluation": result["evaluation"],
+                 "score": result["score"]}
+                for index, result in results
+            ]
+            try:
+                return save_assignment_evaluations(user_id, criteria, items)
+            except Exception as db_error:
+                logger.error(f"Toplu ödev değerlendirmesi veri tabanına "
+                             f"kaydedilemedi: {db_error}")
+                return 0
+
+        yield sse_event("start", {"total": total,
+                                  "to_evaluate": len(unique),
+                                  "deduplicated": deduplicated})
+
+        for index, digest in enumerate(digests):
+            if digest in previous:
+                completed += 1
+                row = previous[digest]
+                yield sse_event("item", {
+                    "index": index,
+                    "name": submissions[index]["name"],
+                    "score": float(row["score"])
+                    if row["score"] is not None else None,
+                    "evaluation": row["evaluation_result"],
+                    "deduplicated": True,
+                    "completed": completed,
+                    "total": total,
+                })
+
+        finished = False
+        try:
+            for position, result in evaluator.run(user_id, unique, criteria,
+                                                  model):
+                for index in groups[position]:
+                    completed += 1
+                    if "error" in result:
+                        failed += 1
+                    else:
+                        results.append((index, result))
+                    yield sse_event("item", {
+                        "index": index,
+                        "name": submissions[index]["name"],
+                        **result,
+                        "deduplicated": False,
+                        "completed": completed,
+                        "total": total,
+                    })
+            finished = True
+        except BatchLimitError as e:
+            yield sse_event("error", {"error": str(e)})
+            return
+        except Exception as e:
+            logger.error(f"Toplu ödev değerlendirme hatası: {e}")
+            saved = save()
+            finished = True
+            yield sse_event("error", {
+                "error": f"Toplu değerlendirme yarıda kaldı: {str(e)}",
+                "evaluated": len(results),
+                "saved": saved,
+            })
+            return
+        finally:
+            # İstemci bağlantıyı kesse de biten değerlendirmeler kaydedilir
+            if not finished:
+                save()
+
+        saved = save()
+        scores = [result["score"] for _, result in results
+                  if result["score"] is not None]
+        yield sse_event("done", {
+            "evaluated": len(results),
+            "failed": failed,
+            "deduplicated": deduplicated,
+            "saved": saved,
+            "avg_score": round(sum(scores) / len(scores), 1)
+            if scores else None,
+            "took_ms": round((time.monotonic() - started) * 1000),
+        })
+
+    return sse_response(events())
+
+
 # Kullanıcı girişi sayfası yönlendirmesi
 @app.route("/login", methods=["GET"])
 def login_page():
@@ -450,6 +1336,7 @@ def auth_login():
 
         # Flask oturumuna kaydet
         login_user_session(user_info, session_token)
+        log_activity("login", user_id=user_info["id"])
 
         logger.info(
             f"Başarılı giriş: {user_info['username']}"
@@ -468,6 +1355,8 @@ def auth_login():
             200,
         )
 
+    except BcryptBusyError:
+        return password_busy_response()
     except Exception as e:
         logger.error(f"Giriş endpoint hatası: {e}")
         return (
@@ -494,6 +1383,8 @@ def auth_logout():
         # Oturum işaretçisini al
         session_token = get_session_token()
 
+        log_activity("logout")
+
         if session_token:
             # Oturumu sonlandır
             auth_manager.logout(session_token)
@@ -560,9 +1451,13 @@ def auth_register():
             return jsonify({"success": False, "error": error_message}), 400
 
         logger.info(f"Yeni kullanıcı kaydedildi: {username}")
+        log_activity("admin.user_create",
+                     {"username": username, "role": role})
 
         return success_response(message="Kayıt başarılı")
 
+    except BcryptBusyError:
+        return password_busy_response()
     except Exception as e:
         logger.error(f"Kayıt endpoint hatası: {e}")
         return (
@@ -654,9 +1549,12 @@ def auth_change_password():
             return jsonify({"success": False, "error": error_message}), 400
 
         logger.info(f"Şifre değiştirildi: {g.current_user['username']}")
+        log_activity("password_change")
 
         return success_response(message="Şifre başarıyla değiştirildi")
 
+    except BcryptBusyError:
+        return password_busy_response()
     except Exception as e:
         logger.error(f"Şifre değiştirme endpoint hatası: {e}")
         return (
@@ -726,60 +1624,134 @@ def auth_check_session():
         500
 
 
+# Geçmiş listelerinde özet görünüm için seçilecek sütunlar
+EDUCATION_SUMMARY_COLUMNS = (
+    "id, subject, LEFT(content, {preview}) AS preview, "
+    "CHAR_LENGTH(content) AS content_length, generated_at, is_favorite"
+)
+ASSIGNMENT_SUMMARY_COLUMNS = (
+    "id, LEFT(assignment_text, {preview}) AS preview, "
+    "CHAR_LENGTH(assignment_text) AS assignment_length, "
+    "CHAR_LENGTH(evaluation_result) AS evaluation_length, "
+    "score, evaluated_at"
+)
+
+
+# Liste görünümü parametrelerini okuma fonksiyonu
+def get_view_args():
+    """
+    Liste görünümü parametrelerini okuma fonksiyonu
+
+    Returns:
+        tuple: (summary, preview) - özet görünüm istenip istenmediği ve
+        önizleme uzunluğu
+    """
+    summary = request.args.get("view", "full") == "summary"
+    preview = max(0, min(int(request.args.get("preview", 200)), 1000))
+    return summary, preview
+
+
+# JSON yanıtını ETag ile koşullu döndürme fonksiyonu
+def conditional_json(payload: dict, etag: str = None):
+    """
+    JSON yanıtını ETag ile koşullu döndürme fonksiyonu
+
+    İstemcinin If-None-Match başlığı ETag ile eşleşirse gövde
+    gönderilmez, 304 döndürülür.
+
+    Args:
+        payload (dict): Yanıt verisi
+        etag (str, optional): Hazır ETag; verilmezse gövdeden hesaplanır
+
+    Returns:
+        Response: JSON veya 304 yanıtı
+    """
+    response = jsonify(payload)
+    if etag:
+        response.set_etag(etag)
+    else:
+        response.add_etag()
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response.make_conditional(request)
+
+
+# İstemcinin ETag'i zaten taşıyıp taşımadığını denetleme fonksiyonu
+def not_modified(etag: str):
+    """
+    İstemcinin ETag'i zaten taşıyıp taşımadığını denetleme fonksiyonu
+
+    Args:
+        etag (str): Kaydın ETag değeri
+
+    Returns:
+        Response | None: Eşleşirse 304 yanıtı, aksi halde None
+    """
+    if etag in request.if_none_match:
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
+    return None
+
+
 # Eğitim oluşturma geçmişi yönlendirmesi
 @app.route("/api/user/education-history", methods=["GET"])
 @login_required
 def user_education_history():
     """
     Kullanıcının eğitim oluşturma geçmişini getirme fonksiyonu
+
+    Query Parameters:
+    - limit (int): Sayfa boyutu (en fazla 50)
+    - cursor (str): Önceki yanıttaki next_cursor değeri
+    - page (int): Eski istemciler için; yalnızca 1 kabul edilir, diğer
+      değerler 400 döndürür
+    - include_total (bool): Toplam sayı eklensin mi (varsayılan: true)
+    - view (str): "full" (varsayılan) veya içerik yerine önizleme ve
+      uzunluk döndüren "summary"
+    - preview (int): Özet görünümde önizleme uzunluğu (varsayılan: 200)
     """
     try:
-        # Sayfalama parametreleri
-        page = int(request.args.get("page", 1))
-        limit = min(int(request.args.get("limit", 10)), 50)
-        offset = (page - 1) * limit
-
-        db = get_db()
-
-        # Toplam kayıt sayısı
-        count_query = """
-            SELECT COUNT(*) as total
-             FROM education_contents
-             WHERE user_id = %s
-        """
-        total_result = db.execute_single(count_query,
-                                         (g.current_user["user_id"],))
-        total = total_result["total"] if total_result else 0
+        limit, cursor, include_total = parse_page_args(request.args)
+        summary, preview = get_view_args()
+        user_id = g.current_user["user_id"]
 
         # Eğitim verilerini getir
-        query = """
-            SELECT id, subject, content, generated_at, is_favorite
-             FROM education_contents
-             WHERE user_id = %s
-             ORDER BY generated_at DESC
-             LIMIT %s OFFSET %s
-        """
+        educations, next_cursor = fetch_keyset_page(
+            "education_contents",
+            EDUCATION_SUMMARY_COLUMNS.format(preview=preview) if summary
+            else "id, subject, content, generated_at, is_favorite",
+            user_id,
+            "generated_at",
+            limit,
+            cursor,
+        )
 
-        educations = db.execute_query(query,
-                                      (g.current_user["user_id"],
-                                       limit, offset))
+        data = {
+            "educations": educations,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
 
-        # Sayfa sayısını hesapla
-        pages = (total + limit - 1) // limit
+        # Toplam kayıt sayısı (önbellekten)
+        if include_total:
+            totals = cached_totals(
+                "education_contents", user_id,
+                lambda: get_db().execute_single(
+                    """SELECT COUNT(*) as total
+                        FROM education_contents
+                        WHERE user_id = %s""",
+                    (user_id,),
+                ),
+            )
+            data["total"] = totals["total"]
+            data["pages"] = (totals["total"] + limit - 1) // limit
 
-        return jsonify(
-            {
-                "success": True,
-                "data": {
-                    "educations": educations,
-                    "total": total,
-                    "page": page,
-                    "limit": limit,
-                    "pages": pages,
-                },
-            }
-        )
+        return conditional_json({"success": True, "data": data})
 
+    except InvalidCursorError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         logger.error(f"Eğitim geçmişi hatası: {e}")
         return jsonify({"success": False,
@@ -787,69 +1759,119 @@ def user_education_history():
         500
 
 
+# Eğitim geçmişinde arama yönlendirmesi
+@app.route("/api/user/education-history/search", methods=["GET"])
+@login_required
+def user_education_search():
+    """
+    Kullanıcının eğitim içeriklerinde tam metin araması yapma fonksiyonu
+
+    Query Parameters:
+    - q (str): Arama ifadesi; kelimeler Türkçe eklerinden arındırılarak
+      aranır ve tümü eşleşmelidir
+    - limit (int): En fazla sonuç sayısı (varsayılan ve üst sınır:
+      search_max_results)
+
+    Her sonuçta içerik yerine eşleşen kelimeleri <mark> ile işaretlenmiş
+    HTML özet döner; took_ms sorgu süresidir.
+    """
+    try:
+        query = request.args.get("q", "").strip()
+        if not query:
+            return jsonify({"success": False,
+                            "error": "Arama ifadesi gerekli"}), 400
+
+        found = get_content_search().search(
+            g.current_user["user_id"], query, request.args.get("limit")
+        )
+        return jsonify({
+            "success": True,
+            "data": {
+                "query": query,
+                "terms": found["terms"],
+                "results": found["results"],
+                "count": len(found["results"]),
+                "took_ms": found["took_ms"],
+            },
+        })
+
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+    except Exception as e:
+        logger.error(f"Eğitim arama hatası: {e}")
+        return jsonify({"success": False,
+                        "error": "Arama yapılamadı"}), 500
+
+
 # Ödev değerlendirme geçmişi yönlendirmesi
 @app.route("/api/user/assignment-history", methods=["GET"])
 @login_required
 def user_assignment_history():
     """
     Kullanıcının ödev değerlendirme geçmişini getirme fonksiyonu
+
+    Query Parameters:
+    - limit (int): Sayfa boyutu (en fazla 50)
+    - cursor (str): Önceki yanıttaki next_cursor değeri
+    - page (int): Eski istemciler için; yalnızca 1 kabul edilir, diğer
+      değerler 400 döndürür
+    - include_total (bool): Toplam sayı ve ortalama puan eklensin mi
+      (varsayılan: true)
+    - view (str): "full" (varsayılan) veya metinler yerine önizleme ve
+      uzunluk döndüren "summary"
+    - preview (int): Özet görünümde önizleme uzunluğu (varsayılan: 200)
     """
     try:
-        # Sayfalama parametreleri
-        page = int(request.args.get("page", 1))
-        limit = min(int(request.args.get("limit", 10)), 50)
-        offset = (page - 1) * limit
-
-        db = get_db()
-
-        # Toplam kayıt sayısı ve istatistikler
-        stats_query = """
-            SELECT
-             COUNT(*) as total,
-             AVG(score) as avg_score
-             FROM assignment_evaluations
-             WHERE user_id = %s
-        """
-        stats_result = db.execute_single(stats_query,
-                                         (g.current_user["user_id"],))
-        total = stats_result["total"] if stats_result else 0
-        avg_score = float(stats_result["avg_score"]) \
-            if stats_result["avg_score"] else 0
+        limit, cursor, include_total = parse_page_args(request.args)
+        summary, preview = get_view_args()
+        user_id = g.current_user["user_id"]
 
         # Ödev verilerini getir
-        query = """
-            SELECT id, assignment_text, criteria, evaluation_result,
-             score, evaluated_at
-             FROM assignment_evaluations
-             WHERE user_id = %s
-             ORDER BY evaluated_at DESC
-             LIMIT %s OFFSET %s
-        """
-
-        assignments = db.execute_query(
-            query, (g.current_user["user_id"], limit, offset)
+        assignments, next_cursor = fetch_keyset_page(
+            "assignment_evaluations",
+            ASSIGNMENT_SUMMARY_COLUMNS.format(preview=preview) if summary
+            else "id, assignment_text, criteria, evaluation_result, score, "
+            "evaluated_at",
+            user_id,
+            "evaluated_at",
+            limit,
+            cursor,
         )
 
-        # Sayfa sayısını hesapla
-        pages = (total + limit - 1) // limit if total > 0 else 0
+        data = {
+            "assignments": assignments,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
 
-        return jsonify(
-            {
-                "success": True,
-                "data": {
-                    "assignments": assignments,
-                    "total": total,
-                    "page": page,
-                    "limit": limit,
-                    "pages": pages,
-                    "stats": {
-                        "avg_score": round(avg_score, 2),
-                        "total_assignments": total,
-                    },
-                },
+        # Toplam kayıt sayısı ve istatistikler (önbellekten)
+        if include_total:
+            totals = cached_totals(
+                "assignment_evaluations", user_id,
+                lambda: get_db().execute_single(
+                    """SELECT
+                        COUNT(*) as total,
+                        AVG(score) as avg_score
+                        FROM assignment_evaluations
+                        WHERE user_id = %s""",
+                    (user_id,),
+                ),
+            )
+            total = totals["total"]
+            avg_score = float(totals["avg_score"]) \
+                if totals["avg_score"] else 0
+            data["total"] = total
+            data["pages"] = (total + limit - 1) // limit if total > 0 else 0
+            data["stats"] = {
+                "avg_score": round(avg_score, 2),
+                "total_assignments": total,
             }
-        )
 
+        return conditional_json({"success": True, "data": data})
+
+    except InvalidCursorError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         logger.error(f"Ödev geçmişi hatası: {e}")
         return jsonify({"success": False,
@@ -857,65 +1879,122 @@ def user_assignment_history():
     500
 
 
+# Tek eğitim kaydını getirme yönlendirmesi
+@app.route("/api/user/education-history/<int:content_id>", methods=["GET"])
+@login_required
+def user_education_detail(content_id):
+    """
+    Kullanıcının tek bir eğitim kaydını tam içeriğiyle getirme fonksiyonu
+
+    Önce yalnızca küçük sütunlar okunur; istemcinin ETag'i güncelse içerik
+    veri tabanından okunmadan 304 döndürülür.
+    """
+    try:
+        db = get_db()
+        user_id = g.current_user["user_id"]
+
+        meta = db.execute_single(
+            """SELECT id, generated_at, is_favorite
+                FROM education_contents
+                WHERE id = %s AND user_id = %s""",
+            (content_id, user_id),
+        )
+        if not meta:
+            return jsonify({"success": False,
+                            "error": "Eğitim bulunamadı"}), 404
+
+        etag = (f"edu-{meta['id']}-{meta['generated_at']:%Y%m%d%H%M%S}"
+                f"-{int(bool(meta['is_favorite']))}")
+        cached_response = not_modified(etag)
+        if cached_response:
+            return cached_response
+
+        education = db.execute_single(
+            """SELECT id, subject, content, generated_at, is_favorite
+                FROM education_contents
+                WHERE id = %s AND user_id = %s""",
+            (content_id, user_id),
+        )
+        return conditional_json({"success": True, "data": education}, etag)
+
+    except Exception as e:
+        logger.error(f"Eğitim kaydı hatası: {e}")
+        return jsonify({"success": False,
+                        "error": "Eğitim kaydı alınamadı"}), 500
+
+
+# Tek ödev değerlendirmesini getirme yönlendirmesi
+@app.route("/api/user/assignment-history/<int:evaluation_id>",
+           methods=["GET"])
+@login_required
+def user_assignment_detail(evaluation_id):
+    """
+    Kullanıcının tek bir ödev değerlendirmesini tam metniyle getirme
+    fonksiyonu
+
+    Değerlendirmeler oluşturulduktan sonra değişmez; ETag kimlik ve
+    zamandan üretilir ve istemcinin kopyası güncelse metinler okunmaz.
+    """
+    try:
+        db = get_db()
+        user_id = g.current_user["user_id"]
+
+        meta = db.execute_single(
+            """SELECT id, evaluated_at
+                FROM assignment_evaluations
+                WHERE id = %s AND user_id = %s""",
+            (evaluation_id, user_id),
+        )
+        if not meta:
+            return jsonify({"success": False,
+                            "error": "Değerlendirme bulunamadı"}), 404
+
+        etag = f"eval-{meta['id']}-{meta['evaluated_at']:%Y%m%d%H%M%S}"
+        cached_response = not_modified(etag)
+        if cached_response:
+            return cached_response
+
+        evaluation = db.execute_single(
+            """SELECT id, assignment_text, criteria, evaluation_result,
+                score, evaluated_at
+                FROM assignment_evaluations
+                WHERE id = %s AND user_id = %s""",
+            (evaluation_id, user_id),
+        )
+        return conditional_json({"success": True, "data": evaluation}, etag)
+
+    except Exception as e:
+        logger.error(f"Değerlendirme kaydı hatası: {e}")
+        return jsonify({"success": False,
+                        "error": "Değerlendirme kaydı alınamadı"}), 500
+
+
 # İstatistik gösterge paneli yönlendirmesi
 @app.route("/api/user/dashboard-stats", methods=["GET"])
 @login_required
 def user_dashboard_stats():
     """
     İstatistik gösterge paneli fonksiyonu
+
+    Sayılar user_counters tablosundan tek bir birincil anahtar aramasıyla,
+    son etkinlikler bellek içi önbellekten okunur.
     """
     try:
         user_id = g.current_user["user_id"]
-        db = get_db()
 
-        # Eğitim sayısı
-        education_count_query = """
-            SELECT COUNT(*) as count
-             FROM education_contents
-             WHERE user_id = %s
-        """
-        education_result = db.execute_single(education_count_query, (user_id,))
-        education_count = education_result["count"] if education_result else 0
-
-        # Ödev sayısı ve ortalama puan
-        assignment_stats_query = """
-            SELECT COUNT(*) as count, AVG(score) as avg_score
-             FROM assignment_evaluations
-             WHERE user_id = %s
-        """
-        assignment_result = db.execute_single(assignment_stats_query,
-                                              (user_id,))
-        assignment_count = assignment_result["count"] \
-            if assignment_result else 0
-        avg_score = (
-            float(assignment_result["avg_score"])
-            if assignment_result["avg_score"]
-            else 0
-        )
+        # Eğitim ve ödev sayıları, ortalama puan (user_counters)
+        counters = get_user_counters(user_id)
 
-        # Son aktiviteler (son 5 kayıt)
-        recent_query = """
-            (SELECT 'education' as type, subject as title, generated_at as date
-             FROM education_contents
-             WHERE user_id = %s)
-             UNION ALL
-             (SELECT 'assignment' as type,
-             CONCAT('Ödev: ', LEFT(assignment_text, 50), '...') as title,
-             evaluated_at as date
-             FROM assignment_evaluations
-             WHERE user_id = %s)
-             ORDER BY date DESC
-             LIMIT 5
-        """
-        recent_activity = db.execute_query(recent_query, (user_id, user_id))
+        # Son aktiviteler (son 5 kayıt, önbellekten)
+        recent_activity = get_recent_activity(user_id)
 
         return jsonify(
             {
                 "success": True,
                 "data": {
-                    "education_count": education_count,
-                    "assignment_count": assignment_count,
-                    "avg_score": round(avg_score, 2),
+                    "education_count": counters["education_count"],
+                    "assignment_count": counters["assignment_count"],
+                    "avg_score": round(counters["avg_score"], 2),
                     "recent_activity": recent_activity,
                 },
             }
@@ -969,8 +2048,8 @@ def admin_get_users():
         if search:
             base_where += (
                 " AND (u.username LIKE %s"
-                "OR u.email LIKE %s "
-                "OR u.full_name LIKE %s)"
+                " OR u.email LIKE %s"
+                " OR u.full_name LIKE %s)"
             )
             search_term = f"%{search}%"
             params.extend([search_term, search_term, search_term])
@@ -980,18 +2059,15 @@ def admin_get_users():
         total_result = db.execute_single(count_query, tuple(params))
         total = total_result["total"] if total_result else 0
 
-        # Kullanıcı listesi
+        # Kullanıcı listesi (sayılar user_counters tablosundan)
         query = f"""
             SELECT u.id, u.username, u.email, u.full_name, u.role,
                    u.is_active, u.created_at, u.last_login,
-                   COUNT(DISTINCT ec.id) as education_count,
-                   COUNT(DISTINCT ae.id) as assignment_count
+                   COALESCE(c.education_count, 0) as education_count,
+                   COALESCE(c.assignment_count, 0) as assignment_count
              FROM users u
-             LEFT JOIN education_contents ec ON u.id = ec.user_id
-             LEFT JOIN assignment_evaluations ae ON u.id = ae.user_id
+             LEFT JOIN user_counters c ON c.user_id = u.id
              {base_where}
-             GROUP BY u.id, u.username, u.email, u.full_name, u.role,
-                     u.is_active, u.created_at, u.last_login
              ORDER BY u.created_at DESC
              LIMIT %s OFFSET %s
         """
@@ -1157,6 +2233,11 @@ def api_save_settings():
             return jsonify({"success": False,
                             "error": "Ayarlar kaydedilemedi"}), 500
 
+        log_activity("settings.update",
+                     {"gemini_api_key": gemini_api_key is not None,
+                      "gemini_model": gemini_model,
+                      "dark_mode": dark_mode})
+
         return jsonify({"success": True,
                         "message": "Ayarlar başarıyla kaydedildi"})
 
@@ -1199,9 +2280,13 @@ def api_test_gemini_key():
             400
 
         # API anahtarını sına
+        get_db().end_request_scope()
         try:
-            genai.configure(api_key=api_key)
-            test_model = genai.GenerativeModel("gemini-2.5-flash")
+            test_model = get_rate_limiter().wrap(
+                build_isolated_model(api_key, DEFAULT_MODEL_NAME),
+                key_fingerprint(api_key),
+                g.current_user["user_id"],
+            )
 
             # Basit bir sınama sorgusu gönder
             response = test_model.generate_content("Test")
@@ -1218,6 +2303,8 @@ def api_test_gemini_key():
                     400,
                 )
 
+        except RateLimitExceededError as e:
+            return rate_limited_response(e)
         except Exception as api_error:
             return (
                 jsonify(
@@ -1301,30 +2388,26 @@ def api_admin_get_users():
         where_clause = " AND ".join(where_conditions)
 
         # Toplam kayıt sayısı
-        count_query = f"SELECT COUNT(*) as total FROM users u "
-        "WHERE {where_clause}"
+        count_query = (f"SELECT COUNT(*) as total FROM users u "
+                       f"WHERE {where_clause}")
         total_result = db.execute_single(count_query, tuple(params))
         total = total_result["total"] if total_result else 0
 
-        # Kullanıcı listesi
+        # Kullanıcı listesi (sayılar user_counters tablosundan)
         query = f"""
             SELECT
                 u.id, u.username, u.email, u.full_name, u.role,
                 u.is_active, u.created_at, u.last_login,
-                COUNT(DISTINCT ec.id) as education_count,
-                COUNT(DISTINCT ae.id) as assignment_count,
+                COALESCE(c.education_count, 0) as education_count,
+                COALESCE(c.assignment_count, 0) as assignment_count,
                 us.gemini_model, us.dark_mode,
                 CASE WHEN us.gemini_api_key IS NOT NULL
                     AND us.gemini_api_key != ''
                     THEN TRUE ELSE FALSE END as has_api_key
             FROM users u
-            LEFT JOIN education_contents ec ON u.id = ec.user_id
-            LEFT JOIN assignment_evaluations ae ON u.id = ae.user_id
+            LEFT JOIN user_counters c ON c.user_id = u.id
             LEFT JOIN user_settings us ON u.id = us.user_id
             WHERE {where_clause}
-            GROUP BY u.id, u.username, u.email, u.full_name, u.role,
-                    u.is_active, u.created_at, u.last_login,
-                    us.gemini_model, us.dark_mode, us.gemini_api_key
             ORDER BY u.created_at DESC
             LIMIT %s OFFSET %s
         """
@@ -1433,6 +2516,9 @@ def api_admin_create_user():
 
         logger.info(f"Admin {g.current_user['username']}"
                     f" tarafından yeni kullanıcı oluşturuldu: {username}")
+        log_activity("admin.user_create",
+                     {"user_id": user_id, "username": username,
+                      "role": role})
 
         return jsonify({
             "success": True,
@@ -1440,6 +2526,8 @@ def api_admin_create_user():
             "data": {"user_id": user_id}
         })
 
+    except BcryptBusyError:
+        return password_busy_response()
     except Exception as e:
         logger.error(f"Admin kullanıcı oluşturma hatası: {e}")
         return jsonify({"success": False,
@@ -1561,10 +2649,8 @@ def api_admin_update_user(user_id):
             password = data["password"]
             if password:
                 # Şifreyi hash'le
-                hashed_password = bcrypt.hashpw(password.encode('utf-8'),
-                                                bcrypt.gensalt())
                 update_fields.append("password_hash = %s")
-                update_params.append(hashed_password.decode('utf-8'))
+                update_params.append(auth_manager.hash_password(password))
 
         if not update_fields:
             return jsonify({"success": False,
@@ -1584,15 +2670,22 @@ def api_admin_update_user(user_id):
 
         db.execute_update(update_query, tuple(update_params))
 
+        # Önbellekteki oturumlar eski rol ve durumu taşımasın
+        get_session_manager().invalidate_user_cache(user_id)
+
         logger.info(f"Admin {g.current_user['username']}"
                     " tarafından kullanıcı güncellendi:"
                     " {existing_user['username']} (ID: {user_id})")
+        log_activity("admin.user_update",
+                     {"user_id": user_id, "fields": sorted(data)})
 
         return jsonify({
             "success": True,
             "message": "Kullanıcı başarıyla güncellendi"
         })
 
+    except BcryptBusyError:
+        return password_busy_response()
     except Exception as e:
         logger.error(f"Admin kullanıcı güncelleme hatası: {e}")
         return jsonify({"success": False,
@@ -1657,6 +2750,9 @@ def api_admin_delete_user(user_id):
             db.execute_delete("DELETE FROM users WHERE id = %s",
                               (user_id,))
 
+            # Silinen kullanıcının önbellekteki oturumlarını kaldır
+            get_session_manager().invalidate_user_cache(user_id)
+
         except Exception as delete_error:
             logger.error(f"Kullanıcı silme işlemi sırasında hata:"
                          " {delete_error}")
@@ -1667,6 +2763,9 @@ def api_admin_delete_user(user_id):
         logger.info(f"Admin {g.current_user['username']} tarafından"
                     " kullanıcı silindi: {existing_user['username']}"
                     " (ID: {user_id})")
+        log_activity("admin.user_delete",
+                     {"user_id": user_id,
+                      "username": existing_user["username"]})
 
         return jsonify({
             "success": True,
@@ -1726,10 +2825,15 @@ def api_admin_activate_user(user_id):
         """
         db.execute_update(update_query, (is_active, user_id))
 
+        # Önbellekteki oturumlar eski durumu taşımasın
+        get_session_manager().invalidate_user_cache(user_id)
+
         status_text = "aktifleştirildi" if is_active else "pasifleştirildi"
         logger.info(f"Admin {g.current_user['username']} tarafından"
                     " kullanıcı {status_text}: {existing_user['username']}"
                     " (ID: {user_id})")
+        log_activity("admin.user_activate",
+                     {"user_id": user_id, "is_active": is_active})
 
         return jsonify({
             "success": True,
@@ -1743,6 +2847,59 @@ def api_admin_activate_user(user_id):
         500
 
 
+# Sistem istatistikleri yönlendirmesi
+@app.route("/api/settings/system-stats", methods=["GET"])
+@login_required
+@role_required("admin")
+def api_admin_system_stats():
+    """
+    İzleme için sistem istatistiklerini getirme fonksiyonu
+
+    Response:
+    {
+        "success": true,
+        "data": {
+            "db_pool": {
+                "in_use": 2,
+                "waiting": 0,
+                "created": 5,
+                "recycled": 1,
+                ...
+            },
+            "session_cache": {"hits": 120, "misses": 4, ...}
+        }
+    }
+    """
+    try:
+        db = get_db()
+
+        return jsonify({
+            "success": True,
+            "data": {
+                "db_pool": db.get_pool_stats(),
+                "session_cache": get_session_manager().session_cache.stats(),
+                "education_jobs": get_job_queue().stats(),
+                "education_cache": get_education_cache().stats(),
+                "model_cache": get_model_cache().stats(),
+                "settings_cache": get_settings_cache().stats(),
+                "bcrypt": get_bcrypt_executor().stats(),
+                "last_login_buffer": get_last_login_buffer().stats(),
+                "maintenance": get_scheduler().stats(),
+                "activity_log": get_activity_logger().stats(),
+                "content_search": get_content_search().stats(),
+                "gemini_rate_limit": get_rate_limiter().stats(),
+                "gemini_usage": get_usage_recorder().stats(),
+                "gemini_calls": get_resilient_caller().stats(),
+                "batch_evaluation": get_batch_evaluator().stats(),
+            }
+        })
+
+    except Exception as e:
+        logger.error(f"Sistem istatistikleri hatası: {e}")
+        return jsonify({"success": False,
+                        "error": "Sistem istatistikleri alınamadı"}), 500
+
+
 # Uygulamayı çalıştır
 if __name__ == "__main__":
     """
@@ -10,17 +10,43 @@ sağlar.
 
 
 # Gerekli kütüphanelerin içe aktarılması
-import bcrypt
 import logging
 import secrets
 
+from auth.bcrypt_executor import BcryptBusyError, get_bcrypt_executor
+from auth.last_login_buffer import get_last_login_buffer
+from config.config_loader import load_config
 from database.database_connection import get_db
+from database.maintenance import delete_in_batches
+from database.memory_cache import TTLCache
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, Tuple
 
 
 logger = logging.getLogger(__name__)
 
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tüm oturum yöneticilerinin paylaştığı oturum doğrulama önbelleği
+session_cache = TTLCache(
+    max_size=int(config.get("SESSION_CACHE_SIZE", 10000)),
+    ttl=float(config.get("SESSION_CACHE_TTL", 30)),
+)
+
+
+# Son giriş zamanının en fazla bu sıklıkta (saniye) yazılması
+LAST_LOGIN_RESOLUTION = 60
+
+# Son giriş zamanını güncelleyen sorgu; yakın zamanda yazılmışsa satıra
+# dokunulmaz
+LAST_LOGIN_QUERY = f"""
+    UPDATE users SET last_login = NOW()
+     WHERE id = %s
+      AND (last_login IS NULL
+           OR last_login < NOW() - INTERVAL {LAST_LOGIN_RESOLUTION} SECOND)
+"""
+
 
 # Kimlik doğrulama hataları için özel durum sınıfı
 class AuthenticationError(Exception):
@@ -37,6 +63,8 @@ class SessionManager:
     def __init__(self):
         self.db = get_db()
         self.session_duration = timedelta(hours=24)  # 24 saat
+        self.session_cache = session_cache
+        self.last_login_buffer = get_last_login_buffer()
 
     # Güvenli oturum işareti oluşturma fonksiyonu
     def generate_session_token(self) -> str:
@@ -55,6 +83,10 @@ class SessionManager:
         """
         Kullanıcı için yeni oturum oluşturma fonksiyonu
 
+        Oturum kaydı her zaman bir işlem içinde yazılır. Son giriş zamanı
+        yazma arabelleği etkinse giriş zamanı işlem onaylandıktan sonra
+        arabelleğe bırakılır; aksi halde aynı işlemde güncellenir.
+
         Args:
             user_id (int): Kullanıcı kimliği
             ip_address (str, optional): IP adresi
@@ -73,12 +105,21 @@ class SessionManager:
                 VALUES (%s, %s, %s, %s, %s)
             """
 
-            self.db.execute_insert(
-                query, (user_id, token, expires_at, ip_address, user_agent)
-            )
+            buffered = self.last_login_buffer.enabled
+            with self.db.transaction(dictionary=False) as cursor:
+                cursor.execute(
+                    query,
+                    (user_id, token, expires_at, ip_address, user_agent),
+                )
 
-            # Kullanıcının son giriş zamanını güncelle
-            self.update_last_login(user_id)
+                # Kullanıcının son giriş zamanını güncelle
+                if not buffered:
+                    cursor.execute(LAST_LOGIN_QUERY, (user_id,))
+
+            # Giriş zamanı yalnızca oturum kaydı onaylandıktan sonra
+            # arabelleğe bırakılır
+            if buffered:
+                self.last_login_buffer.record(user_id)
 
             logger.info(f"Kullanıcı {user_id} için yeni oturum oluşturuldu")
             return token
@@ -92,11 +133,18 @@ class SessionManager:
         """
         Oturum işaretini doğrulama fonksiyonu
 
+        Geçerli oturumlar kısa bir süre için bellekte tutulur; önbellek
+        süresi oturumun expires_at değerini aşmaz.
+
         Args:
             token (str): Oturum işareti
         Returns:
             Dict[str, Any] | None: Kullanıcı bilgileri veya None
         """
+        cached = self.session_cache.get(token)
+        if cached is not None:
+            return dict(cached)
+
         try:
             query = """
                 SELECT s.user_id, s.expires_at, u.username, u.email,
@@ -109,6 +157,13 @@ class SessionManager:
             result = self.db.execute_single(query, (token,))
 
             if result and result["is_active"]:
+                remaining = (
+                    result["expires_at"] - datetime.now()
+                ).total_seconds()
+                self.session_cache.set(
+                    token, dict(result),
+                    ttl=min(self.session_cache.ttl, remaining),
+                )
                 return result
 
             # Süresi dolmuş veya geçersiz token
@@ -133,6 +188,8 @@ class SessionManager:
         Returns:
             bool: İşlem başarılıysa True
         """
+        self.session_cache.delete(token)
+
         try:
             query = "DELETE FROM user_sessions WHERE session_token = %s"
             affected_rows = self.db.execute_update(query, (token,))
@@ -158,6 +215,8 @@ class SessionManager:
         Returns:
             bool: İşlem başarılıysa True
         """
+        self.invalidate_user_cache(user_id)
+
         try:
             query = "DELETE FROM user_sessions WHERE user_id = %s"
             affected_rows = self.db.execute_update(query, (user_id,))
@@ -172,11 +231,33 @@ class SessionManager:
             logger.error(f"Kullanıcı oturumları sonlandırma hatası: {e}")
             return False
 
+    # Kullanıcının önbellekteki oturumlarını geçersiz kılma fonksiyonu
+    def invalidate_user_cache(self, user_id: int) -> int:
+        """
+        Kullanıcının önbellekteki oturumlarını geçersiz kılma fonksiyonu
+
+        Kullanıcı pasifleştirildiğinde, silindiğinde veya bilgileri
+        değiştiğinde çağrılmalıdır.
+
+        Args:
+            user_id (int): Kullanıcı kimliği
+
+        Returns:
+            int: Önbellekten silinen oturum sayısı
+        """
+        return self.session_cache.delete_where(
+            lambda token, user: user["user_id"] == user_id
+        )
+
     # Kullanıcının son giriş zamanını güncelleme fonksiyonu
     def update_last_login(self, user_id: int) -> bool:
         """
         Kullanıcının son giriş zamanını güncelleme fonksiyonu
 
+        Yazma arabelleği etkinse zaman arabelleğe eklenir ve toplu olarak
+        yazılır. Aksi halde son LAST_LOGIN_RESOLUTION saniye içinde
+        yazılmış bir değer yeniden yazılmaz.
+
         Args:
             user_id (int): Kullanıcı ID'si
 
@@ -184,8 +265,10 @@ class SessionManager:
             bool: İşlem başarılıysa True
         """
         try:
-            query = "UPDATE users SET last_login = NOW() WHERE id = %s"
-            self.db.execute_update(query, (user_id,))
+            if self.last_login_buffer.enabled:
+                self.last_login_buffer.record(user_id)
+            else:
+                self.db.execute_update(LAST_LOGIN_QUERY, (user_id,))
             return True
 
         except Exception as e:
@@ -193,16 +276,23 @@ class SessionManager:
             return False
 
     # Süresi dolmuş oturumları temizleme fonksiyonu
-    def cleanup_expired_sessions(self) -> int:
+    def cleanup_expired_sessions(self, batch_size: int = 1000) -> int:
         """
         Süresi dolmuş oturumları temizleme fonksiyonu
 
+        Satırlar tabloyu uzun süre kilitlememek için batch_size
+        büyüklüğünde gruplar halinde silinir.
+
+        Args:
+            batch_size (int): Bir turda silinecek en fazla oturum sayısı
+
         Returns:
             int: Temizlenen oturum sayısı
         """
         try:
-            query = "DELETE FROM user_sessions WHERE expires_at < NOW()"
-            affected_rows = self.db.execute_update(query)
+            affected_rows = delete_in_batches(
+                "user_sessions", "expires_at < NOW()", batch_size=batch_size
+            )
 
             if affected_rows > 0:
                 logger.info(f"{affected_rows} süresi dolmuş oturum temizlendi")
@@ -222,26 +312,32 @@ class UserAuth:
     def __init__(self):
         self.db = get_db()
         self.session_manager = SessionManager()
+        self.bcrypt = get_bcrypt_executor()
 
     # Parolayı güvenli şekilde karıştırma fonksiyonu
     def hash_password(self, password: str) -> str:
         """
         Parolayı güvenli şekilde karıştırma fonksiyonu
 
+        İşlem parola işçi havuzunda çalışır; havuz doluysa
+        BcryptBusyError fırlatılır.
+
         Args:
             password (str): Ham parola
 
         Returns:
             str: Karıştırılmış parola
         """
-        salt = bcrypt.gensalt()
-        return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
+        return self.bcrypt.hash(password)
 
     # Parolayı doğrulama fonksiyonu
     def verify_password(self, password: str, password_hash: str) -> bool:
         """
         Parolayı doğrulama fonksiyonu
 
+        İşlem parola işçi havuzunda çalışır; havuz doluysa
+        BcryptBusyError fırlatılır.
+
         Args:
             password (str): Ham parola
             password_hash (str): Karıştırılmış parola
@@ -250,12 +346,48 @@ class UserAuth:
             bool: Parola doğruysa True
         """
         try:
-            return bcrypt.checkpw(
-                password.encode("utf-8"), password_hash.encode("utf-8")
-            )
+            return self.bcrypt.verify(password, password_hash)
+        except BcryptBusyError:
+            raise
         except Exception:
             return False
 
+    # Parolayı güncel maliyetle arka planda yeniden karıştırma fonksiyonu
+    def rehash_password(self, user_id: int, password: str,
+                        old_hash: str) -> None:
+        """
+        Parolayı güncel maliyetle arka planda yeniden karıştırma fonksiyonu
+
+        Yapılandırılan bcrypt maliyeti değiştiğinde başarılı girişten sonra
+        çağrılır. Giriş yanıtını bekletmemek için karıştırma işçi havuzunda
+        yapılır; havuz doluysa bir sonraki girişe bırakılır.
+
+        Args:
+            user_id (int): Kullanıcı kimliği
+            password (str): Doğrulanmış ham parola
+            old_hash (str): Veri tabanındaki mevcut karıştırma
+        """
+        try:
+            future = self.bcrypt.submit_hash(password)
+        except BcryptBusyError:
+            return
+
+        def store(done):
+            try:
+                self.db.execute_update(
+                    """UPDATE users SET password_hash = %s
+                        WHERE id = %s AND password_hash = %s""",
+                    (done.result(), user_id, old_hash),
+                )
+                logger.info(
+                    f"Kullanıcı {user_id} parolası yeni maliyetle "
+                    "karıştırıldı"
+                )
+            except Exception as e:
+                logger.error(f"Parola yeniden karıştırma hatası: {e}")
+
+        future.add_done_callback(store)
+
     # Kullanıcı girişi yapma fonksiyonu
     def login(
         self,
@@ -299,6 +431,10 @@ class UserAuth:
                 logger.warning(f"Hatalı parola girişi: {user['username']}")
                 return False, None, None
 
+            if self.bcrypt.needs_rehash(user["password_hash"]):
+                self.rehash_password(user["id"], password,
+                                     user["password_hash"])
+
             # Oturum oluştur
             session_token = self.session_manager.create_session(
                 user["id"], ip_address, user_agent
@@ -316,6 +452,8 @@ class UserAuth:
             logger.info(f"Başarılı giriş: {user['username']}")
             return True, session_token, user_info
 
+        except BcryptBusyError:
+            raise
         except Exception as e:
             logger.error(f"Giriş hatası: {e}")
             return False, None, None
@@ -400,6 +538,8 @@ class UserAuth:
 
             return False, "Kullanıcı kaydedilemedi"
 
+        except BcryptBusyError:
+            raise
         except Exception as e:
             logger.error(f"Kullanıcı kaydetme hatası: {e}")
             return False, "Kayıt işlemi sırasında hata oluştu"
@@ -446,6 +586,8 @@ class UserAuth:
 
             return False, "Parola güncellenemedi"
 
+        except BcryptBusyError:
+            raise
         except Exception as e:
             logger.error(f"Parola değiştirme hatası: {e}")
             return False, "Parola değiştirme sırasında hata oluştu"
@@ -0,0 +1,237 @@
+"""
+BTK Hackathon 2025 - Parola Karıştırma İşçi Havuzu Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül bilerek yavaş olan bcrypt karıştırma ve doğrulama işlemlerini
+sınırlı bir işçi havuzunda çalıştırır. Havuz ve kuyruğu dolduğunda yeni
+işler beklemeden reddedilir.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import bcrypt
+import logging
+import threading
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from config.config_loader import load_config
+
+
+logger = logging.getLogger(__name__)
+
+
+# İşçi havuzu dolu olduğunda fırlatılan özel durum sınıfı
+class BcryptBusyError(Exception):
+    """İşçi havuzu dolu olduğunda fırlatılan özel durum sınıfı"""
+
+    pass
+
+
+# Süre ölçümlerini toplayan sınıf
+class _Timing:
+    """Süre ölçümlerini toplayan sınıf"""
+
+    # Yapıcı fonksiyon
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    # Yeni ölçüm ekleme fonksiyonu
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    # Ölçümleri milisaniye olarak döndürme fonksiyonu
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total / self.count * 1000, 2)
+            if self.count else 0.0,
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+# Sınırlı bcrypt işçi havuzu sınıfı
+class BcryptExecutor:
+    """Sınırlı bcrypt işçi havuzu sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        rounds: int = 12,
+        max_workers: int = 4,
+        max_queue: int = 32,
+    ):
+        self.rounds = int(rounds)
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(0, int(max_queue))
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="bcrypt",
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        # İzleme sayaçları
+        self._rejected = 0
+        self._queue_wait = _Timing()
+        self._hash_time = _Timing()
+        self._verify_time = _Timing()
+
+    # İşi havuza gönderme fonksiyonu
+    def _submit(self, timing: _Timing, func: Callable, *args) -> Future:
+        """
+        İşi havuza gönderme fonksiyonu
+
+        Çalışan ve bekleyen işlerin toplamı max_workers + max_queue
+        değerine ulaştıysa BcryptBusyError fırlatılır.
+
+        Parametreler:
+            timing (_Timing): İşin süresinin ekleneceği ölçüm
+            func (Callable): Çalıştırılacak bcrypt fonksiyonu
+
+        Döndürülenler:
+            Future: İşin sonucu
+        """
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise BcryptBusyError("Parola işlem havuzu dolu")
+            self._pending += 1
+
+        queued_at = time.monotonic()
+
+        def run():
+            started_at = time.monotonic()
+            try:
+                return func(*args)
+            finally:
+                finished_at = time.monotonic()
+                with self._lock:
+                    self._pending -= 1
+                    self._queue_wait.add(started_at - queued_at)
+                    timing.add(finished_at - started_at)
+
+        try:
+            return self._executor.submit(run)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+    # Parolayı karıştırma işini başlatma fonksiyonu
+    def submit_hash(self, password: str) -> Future:
+        """
+        Parolayı karıştırma işini başlatma fonksiyonu
+
+        Parametreler:
+            password (str): Ham parola
+
+        Döndürülenler:
+            Future: Karıştırılmış parolayı döndürecek iş
+        """
+        return self._submit(
+            self._hash_time,
+            lambda: bcrypt.hashpw(
+                password.encode("utf-8"), bcrypt.gensalt(self.rounds)
+            ).decode("utf-8"),
+        )
+
+    # Parolayı karıştırma fonksiyonu
+    def hash(self, password: str) -> str:
+        """
+        Parolayı karıştırma fonksiyonu
+
+        Parametreler:
+            password (str): Ham parola
+
+        Döndürülenler:
+            str: Karıştırılmış parola
+        """
+        return self.submit_hash(password).result()
+
+    # Parolayı doğrulama fonksiyonu
+    def verify(self, password: str, password_hash: str) -> bool:
+        """
+        Parolayı doğrulama fonksiyonu
+
+        Parametreler:
+            password (str): Ham parola
+            password_hash (str): Karıştırılmış parola
+
+        Döndürülenler:
+            bool: Parola doğruysa True
+        """
+        return self._submit(
+            self._verify_time,
+            bcrypt.checkpw,
+            password.encode("utf-8"),
+            password_hash.encode("utf-8"),
+        ).result()
+
+    # Karıştırmanın güncel maliyetle yenilenmesi gerekip gerekmediği
+    def needs_rehash(self, password_hash: str) -> bool:
+        """
+        Karıştırmanın güncel maliyetle yenilenmesi gerekip gerekmediğini
+        denetleme fonksiyonu
+
+        Parametreler:
+            password_hash (str): "$2b$12$..." biçiminde karıştırılmış parola
+
+        Döndürülenler:
+            bool: Maliyet yapılandırılan değerden farklıysa True
+        """
+        try:
+            return int(password_hash.split("$")[2]) != self.rounds
+        except (IndexError, ValueError):
+            return False
+
+    # Havuz istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Any]:
+        """
+        Havuz istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: Kuyruk, bekleme ve karıştırma süreleri
+        """
+        with self._lock:
+            return {
+                "rounds": self.rounds,
+                "workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "pending": self._pending,
+                "rejected": self._rejected,
+                "queue_wait": self._queue_wait.to_dict(),
+                "hash": self._hash_time.to_dict(),
+                "verify": self._verify_time.to_dict(),
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnek
+bcrypt_executor = BcryptExecutor(
+    rounds=int(config.get("BCRYPT_ROUNDS", 12)),
+    max_workers=int(config.get("BCRYPT_WORKERS", 4)),
+    max_queue=int(config.get("BCRYPT_MAX_QUEUE", 32)),
+)
+
+
+# Parola işçi havuzu örneğini döndürme fonksiyonu
+def get_bcrypt_executor() -> BcryptExecutor:
+    """
+    Parola işçi havuzu örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        BcryptExecutor: Parola işçi havuzu nesnesi
+    """
+    return bcrypt_executor
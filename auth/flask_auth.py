@@ -15,6 +15,7 @@ from functools import wraps
 from flask import request, jsonify, session, g
 from typing import Optional, Dict, Any, List
 from auth.auth_manager import get_auth, get_session_manager
+from database.activity_log import get_activity_logger
 
 
 logger = logging.getLogger(__name__)
@@ -289,6 +290,41 @@ def logout_user_session() -> None:
     session.clear()
 
 
+# İstekteki kullanıcının etkinliğini günlüğe ekleme fonksiyonu
+def log_activity(
+    action: str, details: Any = None, user_id: Optional[int] = None
+) -> None:
+    """
+    İstekteki kullanıcının etkinliğini günlüğe ekleme fonksiyonu
+
+    Kayıt yalnızca arabelleğe eklenir, veri tabanına arka planda yazılır.
+    Günlük hatası isteği hiçbir zaman etkilemez.
+
+    Parametreler:
+        action (str): Etkinlik adı
+        details (Any, optional): Ek bilgiler
+        user_id (int, optional): Kullanıcı ID'si, verilmezse
+            g.current_user kullanılır
+    """
+    try:
+        if user_id is None:
+            current_user = getattr(g, "current_user", None)
+            if not current_user:
+                return
+            user_id = current_user["user_id"]
+
+        client_info = get_client_info()
+        get_activity_logger().log(
+            user_id,
+            action,
+            details,
+            client_info["ip_address"],
+            client_info["user_agent"],
+        )
+    except Exception as e:
+        logger.error(f"Etkinlik günlüğü ekleme hatası: {e}")
+
+
 # Güvenli şekilde mevcut kullanıcıyı alma fonksiyonu
 def get_current_user_safe() -> Optional[Dict[str, Any]]:
     """
@@ -0,0 +1,211 @@
+"""
+BTK Hackathon 2025 - Son Giriş Zamanı Yazma Arabelleği Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül kullanıcıların son giriş zamanlarını bellekte toplar ve
+belirli aralıklarla tek bir toplu UPDATE sorgusuyla users tablosuna
+yazar. Uygulama kapanırken bekleyen kayıtlar da yazılır.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import atexit
+import logging
+import threading
+import time
+
+from datetime import datetime
+from typing import Dict
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+
+
+logger = logging.getLogger(__name__)
+
+
+# Son giriş zamanı yazma arabelleği sınıfı
+class LastLoginBuffer:
+    """Son giriş zamanı yazma arabelleği sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, flush_interval: float = 5.0, batch_size: int = 500):
+        # Aralık 0 ise arabellek kapalıdır ve yazma anında yapılır
+        self.enabled = float(flush_interval) > 0
+        self.flush_interval = max(0.1, float(flush_interval))
+        self.batch_size = max(1, int(batch_size))
+        self.db = get_db()
+
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # İzleme sayaçları
+        self.recorded = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.flush_errors = 0
+        self.last_flush_ms = 0.0
+
+    # Arka plan yazma iş parçacığını başlatma fonksiyonu
+    def _ensure_started(self) -> None:
+        """
+        Arka plan yazma iş parçacığını başlatma fonksiyonu
+
+        Kilit tutulurken çağrılmalıdır.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="last-login-flush", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    # Kullanıcının giriş zamanını kaydetme fonksiyonu
+    def record(self, user_id: int) -> None:
+        """
+        Kullanıcının giriş zamanını kaydetme fonksiyonu
+
+        Aynı kullanıcının bir aralıktaki birden fazla girişi tek bir
+        yazmaya indirgenir.
+
+        Parametreler:
+            user_id (int): Kullanıcı ID'si
+        """
+        with self._lock:
+            self._pending[user_id] = datetime.now()
+            self.recorded += 1
+            self._ensure_started()
+
+    # Arka plan yazma döngüsü fonksiyonu
+    def _run(self) -> None:
+        """
+        Arka plan yazma döngüsü fonksiyonu
+        """
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    # Bekleyen kayıtları veri tabanına yazma fonksiyonu
+    def flush(self) -> int:
+        """
+        Bekleyen kayıtları veri tabanına yazma fonksiyonu
+
+        Kayıtlar batch_size büyüklüğünde gruplar halinde
+        UPDATE ... CASE sorgusuyla yazılır. Yazılamayan kayıtlar, bu arada
+        gelen daha yeni kayıtları ezmeyecek şekilde arabelleğe geri konur.
+
+        Döndürülenler:
+            int: Yazılan kayıt sayısı
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+
+            started = time.monotonic()
+            items = list(pending.items())
+            written = 0
+            for start in range(0, len(items), self.batch_size):
+                batch = items[start:start + self.batch_size]
+                try:
+                    self._write_batch(batch)
+                    written += len(batch)
+                except Exception as e:
+                    logger.error(f"Son giriş zamanları yazılamadı: {e}")
+                    with self._lock:
+                        self.flush_errors += 1
+                        for user_id, logged_in_at in batch:
+                            self._pending.setdefault(user_id, logged_in_at)
+
+            with self._lock:
+                self.flushed += written
+                self.flushes += 1
+                self.last_flush_ms = round(
+                    (time.monotonic() - started) * 1000, 2
+                )
+            return written
+
+    # Bir grup kaydı tek sorguyla yazma fonksiyonu
+    def _write_batch(self, batch) -> None:
+        """
+        Bir grup kaydı tek sorguyla yazma fonksiyonu
+
+        Parametreler:
+            batch (List[Tuple[int, datetime]]): (user_id, giriş zamanı)
+        """
+        cases = " ".join("WHEN %s THEN %s" for _ in batch)
+        placeholders = ", ".join("%s" for _ in batch)
+
+        params = []
+        for user_id, logged_in_at in batch:
+            params.extend((user_id, logged_in_at))
+        params.extend(user_id for user_id, _ in batch)
+
+        self.db.execute_update(
+            f"""UPDATE users
+                SET last_login = GREATEST(
+                    COALESCE(last_login, '1970-01-01'),
+                    CASE id {cases} END
+                )
+                WHERE id IN ({placeholders})""",
+            tuple(params),
+        )
+
+    # Arabelleği durdurma ve son kayıtları yazma fonksiyonu
+    def stop(self) -> None:
+        """
+        Arabelleği durdurma ve son kayıtları yazma fonksiyonu
+
+        Uygulama kapanırken atexit ile çağrılır.
+        """
+        self._stop.set()
+        if self._thread is not None and \
+                self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval)
+        self.flush()
+
+    # Arabellek istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, float]:
+        """
+        Arabellek istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, float]: Arabellek boyutu ve yazma sayaçları
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "buffer_size": len(self._pending),
+                "flush_interval": self.flush_interval,
+                "recorded": self.recorded,
+                "flushed": self.flushed,
+                "flushes": self.flushes,
+                "flush_errors": self.flush_errors,
+                "last_flush_ms": self.last_flush_ms,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnek
+last_login_buffer = LastLoginBuffer(
+    flush_interval=float(config.get("LAST_LOGIN_FLUSH_INTERVAL", 5)),
+)
+
+
+# Son giriş arabelleği örneğini döndürme fonksiyonu
+def get_last_login_buffer() -> LastLoginBuffer:
+    """
+    Son giriş arabelleği örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        LastLoginBuffer: Son giriş arabelleği nesnesi
+    """
+    return last_login_buffer
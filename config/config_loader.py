@@ -81,6 +81,22 @@ def load_config(config_file: str = "config/config.ini") -> Dict[str, Any]:
                 "DB_COLLATION",
                 fallback="utf8mb4_unicode_ci"
             ),
+            # Veri tabanı bağlantı havuzu yapılandırmaları
+            "DB_POOL_SIZE": config.getint("database",
+                                          "DB_POOL_SIZE",
+                                          fallback=10),
+            "DB_POOL_MAX_LIFETIME": config.getint("database",
+                                                  "DB_POOL_MAX_LIFETIME",
+                                                  fallback=1800),
+            "DB_POOL_MAX_IDLE": config.getint("database",
+                                              "DB_POOL_MAX_IDLE",
+                                              fallback=300),
+            "DB_POOL_TIMEOUT": config.getfloat("database",
+                                               "DB_POOL_TIMEOUT",
+                                               fallback=10.0),
+            "DB_REQUEST_SCOPED": config.getboolean("database",
+                                                   "DB_REQUEST_SCOPED",
+                                                   fallback=True),
             # Mevcut uygulama yapılandırmaları
             "DEBUG": config.getboolean("app",
                                        "DEBUG",
@@ -107,6 +123,295 @@ def load_config(config_file: str = "config/config.ini") -> Dict[str, Any]:
                 "PERMANENT_SESSION_LIFETIME",
                 fallback=3600
             ),
+            # Eğitim oluşturma iş kuyruğu yapılandırmaları
+            "JOB_WORKERS": config.getint("jobs",
+                                         "JOB_WORKERS",
+                                         fallback=4),
+            "JOB_MAX_QUEUE": config.getint("jobs",
+                                           "JOB_MAX_QUEUE",
+                                           fallback=100),
+            "JOB_MAX_PER_USER": config.getint("jobs",
+                                              "JOB_MAX_PER_USER",
+                                              fallback=2),
+            "JOB_RESULT_TTL": config.getint("jobs",
+                                            "JOB_RESULT_TTL",
+                                            fallback=3600),
+            "EDUCATION_PIPELINE": config.getboolean(
+                "jobs",
+                "EDUCATION_PIPELINE",
+                fallback=False
+            ),
+            "EDUCATION_PIPELINE_WORKERS": config.getint(
+                "jobs",
+                "EDUCATION_PIPELINE_WORKERS",
+                fallback=4
+            ),
+            "EVALUATION_CHUNKED": config.getboolean(
+                "jobs",
+                "EVALUATION_CHUNKED",
+                fallback=False
+            ),
+            "EVALUATION_CHUNK_SIZE": config.getint(
+                "jobs",
+                "EVALUATION_CHUNK_SIZE",
+                fallback=6000
+            ),
+            "EVALUATION_CHUNK_WORKERS": config.getint(
+                "jobs",
+                "EVALUATION_CHUNK_WORKERS",
+                fallback=4
+            ),
+            "BATCH_EVALUATION_WORKERS": config.getint(
+                "jobs",
+                "BATCH_EVALUATION_WORKERS",
+                fallback=4
+            ),
+            "BATCH_EVALUATION_MAX_ITEMS": config.getint(
+                "jobs",
+                "BATCH_EVALUATION_MAX_ITEMS",
+                fallback=50
+            ),
+            "BATCH_EVALUATION_MAX_FILE_SIZE": config.getint(
+                "jobs",
+                "BATCH_EVALUATION_MAX_FILE_SIZE",
+                fallback=200000
+            ),
+            "BATCH_EVALUATION_RATE_LIMIT_RETRIES": config.getint(
+                "jobs",
+                "BATCH_EVALUATION_RATE_LIMIT_RETRIES",
+                fallback=5
+            ),
+            # Eğitim yanıt önbelleği yapılandırmaları
+            "EDU_CACHE_ENABLED": config.getboolean("cache",
+                                                   "EDU_CACHE_ENABLED",
+                                                   fallback=True),
+            "EDU_CACHE_TTL": config.getint("cache",
+                                           "EDU_CACHE_TTL",
+                                           fallback=604800),
+            "EDU_CACHE_MEMORY_SIZE": config.getint("cache",
+                                                   "EDU_CACHE_MEMORY_SIZE",
+                                                   fallback=256),
+            "EDU_CACHE_MAX_ENTRIES": config.getint("cache",
+                                                   "EDU_CACHE_MAX_ENTRIES",
+                                                   fallback=5000),
+            "MODEL_CACHE_SIZE": config.getint(
+                "cache",
+                "MODEL_CACHE_SIZE",
+                fallback=64
+            ),
+            "MODEL_CACHE_TTL": config.getint(
+                "cache",
+                "MODEL_CACHE_TTL",
+                fallback=300
+            ),
+            "HISTORY_COUNT_CACHE_SIZE": config.getint(
+                "cache",
+                "HISTORY_COUNT_CACHE_SIZE",
+                fallback=4096
+            ),
+            "HISTORY_COUNT_CACHE_TTL": config.getint(
+                "cache",
+                "HISTORY_COUNT_CACHE_TTL",
+                fallback=60
+            ),
+            "RECENT_ACTIVITY_CACHE_SIZE": config.getint(
+                "cache",
+                "RECENT_ACTIVITY_CACHE_SIZE",
+                fallback=4096
+            ),
+            "RECENT_ACTIVITY_CACHE_TTL": config.getint(
+                "cache",
+                "RECENT_ACTIVITY_CACHE_TTL",
+                fallback=300
+            ),
+            "EVAL_DEDUP_WINDOW_MINUTES": config.getint(
+                "cache",
+                "EVAL_DEDUP_WINDOW_MINUTES",
+                fallback=1440
+            ),
+            # Oturum doğrulama önbelleği yapılandırmaları
+            "SESSION_CACHE_SIZE": config.getint(
+                "security",
+                "SESSION_CACHE_SIZE",
+                fallback=10000
+            ),
+            "SESSION_CACHE_TTL": config.getint(
+                "security",
+                "SESSION_CACHE_TTL",
+                fallback=30
+            ),
+            # Kullanıcı ayarları önbelleği yapılandırmaları
+            "SETTINGS_CACHE_SIZE": config.getint(
+                "security",
+                "SETTINGS_CACHE_SIZE",
+                fallback=1024
+            ),
+            "SETTINGS_CACHE_TTL": config.getint(
+                "security",
+                "SETTINGS_CACHE_TTL",
+                fallback=60
+            ),
+            # Parola karıştırma yapılandırmaları
+            "BCRYPT_ROUNDS": config.getint(
+                "security",
+                "BCRYPT_ROUNDS",
+                fallback=12
+            ),
+            "BCRYPT_WORKERS": config.getint(
+                "security",
+                "BCRYPT_WORKERS",
+                fallback=4
+            ),
+            "BCRYPT_MAX_QUEUE": config.getint(
+                "security",
+                "BCRYPT_MAX_QUEUE",
+                fallback=32
+            ),
+            # Son giriş zamanı yazma arabelleği
+            "LAST_LOGIN_FLUSH_INTERVAL": config.getfloat(
+                "security",
+                "LAST_LOGIN_FLUSH_INTERVAL",
+                fallback=5
+            ),
+            # Dönemsel bakım yapılandırmaları
+            "SESSION_CLEANUP_INTERVAL": config.getint(
+                "maintenance",
+                "SESSION_CLEANUP_INTERVAL",
+                fallback=900
+            ),
+            "SESSION_CLEANUP_BATCH_SIZE": config.getint(
+                "maintenance",
+                "SESSION_CLEANUP_BATCH_SIZE",
+                fallback=1000
+            ),
+            "USER_COUNTERS_RECONCILE_INTERVAL": config.getint(
+                "maintenance",
+                "USER_COUNTERS_RECONCILE_INTERVAL",
+                fallback=3600
+            ),
+            "USER_COUNTERS_RECONCILE_BATCH_SIZE": config.getint(
+                "maintenance",
+                "USER_COUNTERS_RECONCILE_BATCH_SIZE",
+                fallback=500
+            ),
+            # Etkinlik günlüğü yapılandırmaları
+            "ACTIVITY_LOG_CAPACITY": config.getint(
+                "activity",
+                "ACTIVITY_LOG_CAPACITY",
+                fallback=10000
+            ),
+            "ACTIVITY_LOG_BATCH_SIZE": config.getint(
+                "activity",
+                "ACTIVITY_LOG_BATCH_SIZE",
+                fallback=200
+            ),
+            "ACTIVITY_LOG_FLUSH_INTERVAL": config.getfloat(
+                "activity",
+                "ACTIVITY_LOG_FLUSH_INTERVAL",
+                fallback=2
+            ),
+            # İçerik arama yapılandırmaları
+            "SEARCH_MAX_RESULTS": config.getint(
+                "search",
+                "SEARCH_MAX_RESULTS",
+                fallback=20
+            ),
+            "SEARCH_BACKFILL_INTERVAL": config.getint(
+                "search",
+                "SEARCH_BACKFILL_INTERVAL",
+                fallback=300
+            ),
+            "SEARCH_BACKFILL_BATCH_SIZE": config.getint(
+                "search",
+                "SEARCH_BACKFILL_BATCH_SIZE",
+                fallback=200
+            ),
+            # Gemini istek sınırı yapılandırmaları
+            "GEMINI_KEY_RPM": config.getint(
+                "gemini",
+                "GEMINI_KEY_RPM",
+                fallback=60
+            ),
+            "GEMINI_KEY_TPM": config.getint(
+                "gemini",
+                "GEMINI_KEY_TPM",
+                fallback=1000000
+            ),
+            "GEMINI_USER_RPM": config.getint(
+                "gemini",
+                "GEMINI_USER_RPM",
+                fallback=10
+            ),
+            "GEMINI_USER_TPM": config.getint(
+                "gemini",
+                "GEMINI_USER_TPM",
+                fallback=250000
+            ),
+            "GEMINI_RATE_MAX_WAIT": config.getfloat(
+                "gemini",
+                "GEMINI_RATE_MAX_WAIT",
+                fallback=10
+            ),
+            "GEMINI_OUTPUT_TOKEN_ESTIMATE": config.getint(
+                "gemini",
+                "GEMINI_OUTPUT_TOKEN_ESTIMATE",
+                fallback=4096
+            ),
+            "GEMINI_RATE_MAX_BUCKETS": config.getint(
+                "gemini",
+                "GEMINI_RATE_MAX_BUCKETS",
+                fallback=8192
+            ),
+            "GEMINI_USAGE_FLUSH_INTERVAL": config.getfloat(
+                "gemini",
+                "GEMINI_USAGE_FLUSH_INTERVAL",
+                fallback=30
+            ),
+            "GEMINI_RETRY_MAX_ATTEMPTS": config.getint(
+                "gemini",
+                "GEMINI_RETRY_MAX_ATTEMPTS",
+                fallback=4
+            ),
+            "GEMINI_RETRY_BASE_DELAY": config.getfloat(
+                "gemini",
+                "GEMINI_RETRY_BASE_DELAY",
+                fallback=0.5
+            ),
+            "GEMINI_RETRY_MAX_DELAY": config.getfloat(
+                "gemini",
+                "GEMINI_RETRY_MAX_DELAY",
+                fallback=8
+            ),
+            "GEMINI_CALL_DEADLINE": config.getfloat(
+                "gemini",
+                "GEMINI_CALL_DEADLINE",
+                fallback=120
+            ),
+            "GEMINI_HEDGE_PERCENTILE": config.getfloat(
+                "gemini",
+                "GEMINI_HEDGE_PERCENTILE",
+                fallback=0
+            ),
+            "GEMINI_HEDGE_MIN_SAMPLES": config.getint(
+                "gemini",
+                "GEMINI_HEDGE_MIN_SAMPLES",
+                fallback=20
+            ),
+            "GEMINI_HEDGE_WORKERS": config.getint(
+                "gemini",
+                "GEMINI_HEDGE_WORKERS",
+                fallback=8
+            ),
+            "GEMINI_BREAKER_THRESHOLD": config.getint(
+                "gemini",
+                "GEMINI_BREAKER_THRESHOLD",
+                fallback=5
+            ),
+            "GEMINI_BREAKER_COOLDOWN": config.getfloat(
+                "gemini",
+                "GEMINI_BREAKER_COOLDOWN",
+                fallback=30
+            ),
         }
 
     except Exception as e:
@@ -145,11 +450,75 @@ def get_default_config(config_file: str =
         "DB_NAME": "btk_hackathon_2025",
         "DB_CHARSET": "utf8mb4",
         "DB_COLLATION": "utf8mb4_unicode_ci",
+        "DB_POOL_SIZE": 10,
+        "DB_POOL_MAX_LIFETIME": 1800,
+        "DB_POOL_MAX_IDLE": 300,
+        "DB_POOL_TIMEOUT": 10.0,
+        "DB_REQUEST_SCOPED": True,
         "GEMINI_API_KEY": "",
         "GEMINI_MODEL": "gemini-2.5-flash",
         "SESSION_COOKIE_SECURE": True,
         "SESSION_COOKIE_HTTPONLY": True,
         "PERMANENT_SESSION_LIFETIME": 3600,
+        "SESSION_CACHE_SIZE": 10000,
+        "SESSION_CACHE_TTL": 30,
+        "SETTINGS_CACHE_SIZE": 1024,
+        "SETTINGS_CACHE_TTL": 60,
+        "BCRYPT_ROUNDS": 12,
+        "BCRYPT_WORKERS": 4,
+        "BCRYPT_MAX_QUEUE": 32,
+        "LAST_LOGIN_FLUSH_INTERVAL": 5,
+        "JOB_WORKERS": 4,
+        "JOB_MAX_QUEUE": 100,
+        "JOB_MAX_PER_USER": 2,
+        "JOB_RESULT_TTL": 3600,
+        "EDUCATION_PIPELINE": False,
+        "EDUCATION_PIPELINE_WORKERS": 4,
+        "EVALUATION_CHUNKED": False,
+        "EVALUATION_CHUNK_SIZE": 6000,
+        "EVALUATION_CHUNK_WORKERS": 4,
+        "BATCH_EVALUATION_WORKERS": 4,
+        "BATCH_EVALUATION_MAX_ITEMS": 50,
+        "BATCH_EVALUATION_MAX_FILE_SIZE": 200000,
+        "BATCH_EVALUATION_RATE_LIMIT_RETRIES": 5,
+        "EDU_CACHE_ENABLED": True,
+        "EDU_CACHE_TTL": 604800,
+        "EDU_CACHE_MEMORY_SIZE": 256,
+        "EDU_CACHE_MAX_ENTRIES": 5000,
+        "EVAL_DEDUP_WINDOW_MINUTES": 1440,
+        "MODEL_CACHE_SIZE": 64,
+        "MODEL_CACHE_TTL": 300,
+        "HISTORY_COUNT_CACHE_SIZE": 4096,
+        "HISTORY_COUNT_CACHE_TTL": 60,
+        "RECENT_ACTIVITY_CACHE_SIZE": 4096,
+        "RECENT_ACTIVITY_CACHE_TTL": 300,
+        "SESSION_CLEANUP_INTERVAL": 900,
+        "SESSION_CLEANUP_BATCH_SIZE": 1000,
+        "USER_COUNTERS_RECONCILE_INTERVAL": 3600,
+        "USER_COUNTERS_RECONCILE_BATCH_SIZE": 500,
+        "ACTIVITY_LOG_CAPACITY": 10000,
+        "ACTIVITY_LOG_BATCH_SIZE": 200,
+        "ACTIVITY_LOG_FLUSH_INTERVAL": 2,
+        "SEARCH_MAX_RESULTS": 20,
+        "SEARCH_BACKFILL_INTERVAL": 300,
+        "SEARCH_BACKFILL_BATCH_SIZE": 200,
+        "GEMINI_KEY_RPM": 60,
+        "GEMINI_KEY_TPM": 1000000,
+        "GEMINI_USER_RPM": 10,
+        "GEMINI_USER_TPM": 250000,
+        "GEMINI_RATE_MAX_WAIT": 10,
+        "GEMINI_OUTPUT_TOKEN_ESTIMATE": 4096,
+        "GEMINI_RATE_MAX_BUCKETS": 8192,
+        "GEMINI_USAGE_FLUSH_INTERVAL": 30,
+        "GEMINI_RETRY_MAX_ATTEMPTS": 4,
+        "GEMINI_RETRY_BASE_DELAY": 0.5,
+        "GEMINI_RETRY_MAX_DELAY": 8,
+        "GEMINI_CALL_DEADLINE": 120,
+        "GEMINI_HEDGE_PERCENTILE": 0,
+        "GEMINI_HEDGE_MIN_SAMPLES": 20,
+        "GEMINI_HEDGE_WORKERS": 8,
+        "GEMINI_BREAKER_THRESHOLD": 5,
+        "GEMINI_BREAKER_COOLDOWN": 30,
     }
 
     config = configparser.ConfigParser()
@@ -169,6 +538,20 @@ def get_default_config(config_file: str =
     config.set("database", "DB_NAME", defaults["DB_NAME"])
     config.set("database", "DB_CHARSET", defaults["DB_CHARSET"])
     config.set("database", "DB_COLLATION", defaults["DB_COLLATION"])
+    config.set("database", "DB_POOL_SIZE", str(defaults["DB_POOL_SIZE"]))
+    config.set(
+        "database", "DB_POOL_MAX_LIFETIME",
+        str(defaults["DB_POOL_MAX_LIFETIME"])
+    )
+    config.set(
+        "database", "DB_POOL_MAX_IDLE", str(defaults["DB_POOL_MAX_IDLE"])
+    )
+    config.set(
+        "database", "DB_POOL_TIMEOUT", str(defaults["DB_POOL_TIMEOUT"])
+    )
+    config.set(
+        "database", "DB_REQUEST_SCOPED", str(defaults["DB_REQUEST_SCOPED"])
+    )
 
     config.add_section("security")
     config.set(
@@ -184,6 +567,225 @@ def get_default_config(config_file: str =
         "PERMANENT_SESSION_LIFETIME",
         str(defaults["PERMANENT_SESSION_LIFETIME"]),
     )
+    config.set(
+        "security", "SESSION_CACHE_SIZE", str(defaults["SESSION_CACHE_SIZE"])
+    )
+    config.set(
+        "security", "SESSION_CACHE_TTL", str(defaults["SESSION_CACHE_TTL"])
+    )
+    config.set(
+        "security", "SETTINGS_CACHE_SIZE",
+        str(defaults["SETTINGS_CACHE_SIZE"])
+    )
+    config.set(
+        "security", "SETTINGS_CACHE_TTL", str(defaults["SETTINGS_CACHE_TTL"])
+    )
+    config.set("security", "BCRYPT_ROUNDS", str(defaults["BCRYPT_ROUNDS"]))
+    config.set("security", "BCRYPT_WORKERS", str(defaults["BCRYPT_WORKERS"]))
+    config.set(
+        "security", "BCRYPT_MAX_QUEUE", str(defaults["BCRYPT_MAX_QUEUE"])
+    )
+    config.set(
+        "security", "LAST_LOGIN_FLUSH_INTERVAL",
+        str(defaults["LAST_LOGIN_FLUSH_INTERVAL"])
+    )
+
+    config.add_section("jobs")
+    config.set("jobs", "JOB_WORKERS", str(defaults["JOB_WORKERS"]))
+    config.set("jobs", "JOB_MAX_QUEUE", str(defaults["JOB_MAX_QUEUE"]))
+    config.set("jobs", "JOB_MAX_PER_USER", str(defaults["JOB_MAX_PER_USER"]))
+    config.set("jobs", "JOB_RESULT_TTL", str(defaults["JOB_RESULT_TTL"]))
+    config.set(
+        "jobs", "EDUCATION_PIPELINE",
+        str(defaults["EDUCATION_PIPELINE"])
+    )
+    config.set(
+        "jobs", "EDUCATION_PIPELINE_WORKERS",
+        str(defaults["EDUCATION_PIPELINE_WORKERS"])
+    )
+    config.set(
+        "jobs", "EVALUATION_CHUNKED", str(defaults["EVALUATION_CHUNKED"])
+    )
+    config.set(
+        "jobs", "EVALUATION_CHUNK_SIZE",
+        str(defaults["EVALUATION_CHUNK_SIZE"])
+    )
+    config.set(
+        "jobs", "EVALUATION_CHUNK_WORKERS",
+        str(defaults["EVALUATION_CHUNK_WORKERS"])
+    )
+    config.set(
+        "jobs", "BATCH_EVALUATION_WORKERS",
+        str(defaults["BATCH_EVALUATION_WORKERS"])
+    )
+    config.set(
+        "jobs", "BATCH_EVALUATION_MAX_ITEMS",
+        str(defaults["BATCH_EVALUATION_MAX_ITEMS"])
+    )
+    config.set(
+        "jobs", "BATCH_EVALUATION_MAX_FILE_SIZE",
+        str(defaults["BATCH_EVALUATION_MAX_FILE_SIZE"])
+    )
+    config.set(
+        "jobs", "BATCH_EVALUATION_RATE_LIMIT_RETRIES",
+        str(defaults["BATCH_EVALUATION_RATE_LIMIT_RETRIES"])
+    )
+
+    config.add_section("cache")
+    config.set(
+        "cache", "EDU_CACHE_ENABLED", str(defaults["EDU_CACHE_ENABLED"])
+    )
+    config.set("cache", "EDU_CACHE_TTL", str(defaults["EDU_CACHE_TTL"]))
+    config.set(
+        "cache", "EDU_CACHE_MEMORY_SIZE",
+        str(defaults["EDU_CACHE_MEMORY_SIZE"])
+    )
+    config.set(
+        "cache", "EDU_CACHE_MAX_ENTRIES",
+        str(defaults["EDU_CACHE_MAX_ENTRIES"])
+    )
+    config.set(
+        "cache", "EVAL_DEDUP_WINDOW_MINUTES",
+        str(defaults["EVAL_DEDUP_WINDOW_MINUTES"])
+    )
+    config.set(
+        "cache", "MODEL_CACHE_SIZE", str(defaults["MODEL_CACHE_SIZE"])
+    )
+    config.set(
+        "cache", "MODEL_CACHE_TTL", str(defaults["MODEL_CACHE_TTL"])
+    )
+    config.set(
+        "cache", "HISTORY_COUNT_CACHE_SIZE",
+        str(defaults["HISTORY_COUNT_CACHE_SIZE"])
+    )
+    config.set(
+        "cache", "HISTORY_COUNT_CACHE_TTL",
+        str(defaults["HISTORY_COUNT_CACHE_TTL"])
+    )
+    config.set(
+        "cache", "RECENT_ACTIVITY_CACHE_SIZE",
+        str(defaults["RECENT_ACTIVITY_CACHE_SIZE"])
+    )
+    config.set(
+        "cache", "RECENT_ACTIVITY_CACHE_TTL",
+        str(defaults["RECENT_ACTIVITY_CACHE_TTL"])
+    )
+
+    config.add_section("maintenance")
+    config.set(
+        "maintenance", "SESSION_CLEANUP_INTERVAL",
+        str(defaults["SESSION_CLEANUP_INTERVAL"])
+    )
+    config.set(
+        "maintenance", "SESSION_CLEANUP_BATCH_SIZE",
+        str(defaults["SESSION_CLEANUP_BATCH_SIZE"])
+    )
+    config.set(
+        "maintenance", "USER_COUNTERS_RECONCILE_INTERVAL",
+        str(defaults["USER_COUNTERS_RECONCILE_INTERVAL"])
+    )
+    config.set(
+        "maintenance", "USER_COUNTERS_RECONCILE_BATCH_SIZE",
+        str(defaults["USER_COUNTERS_RECONCILE_BATCH_SIZE"])
+    )
+
+    config.add_section("activity")
+    config.set(
+        "activity", "ACTIVITY_LOG_CAPACITY",
+        str(defaults["ACTIVITY_LOG_CAPACITY"])
+    )
+    config.set(
+        "activity", "ACTIVITY_LOG_BATCH_SIZE",
+        str(defaults["ACTIVITY_LOG_BATCH_SIZE"])
+    )
+    config.set(
+        "activity", "ACTIVITY_LOG_FLUSH_INTERVAL",
+        str(defaults["ACTIVITY_LOG_FLUSH_INTERVAL"])
+    )
+
+    config.add_section("search")
+    config.set(
+        "search", "SEARCH_MAX_RESULTS",
+        str(defaults["SEARCH_MAX_RESULTS"])
+    )
+    config.set(
+        "search", "SEARCH_BACKFILL_INTERVAL",
+        str(defaults["SEARCH_BACKFILL_INTERVAL"])
+    )
+    config.set(
+        "search", "SEARCH_BACKFILL_BATCH_SIZE",
+        str(defaults["SEARCH_BACKFILL_BATCH_SIZE"])
+    )
+
+    config.add_section("gemini")
+    config.set(
+        "gemini", "GEMINI_KEY_RPM",
+        str(defaults["GEMINI_KEY_RPM"])
+    )
+    config.set(
+        "gemini", "GEMINI_KEY_TPM",
+        str(defaults["GEMINI_KEY_TPM"])
+    )
+    config.set(
+        "gemini", "GEMINI_USER_RPM",
+        str(defaults["GEMINI_USER_RPM"])
+    )
+    config.set(
+        "gemini", "GEMINI_USER_TPM",
+        str(defaults["GEMINI_USER_TPM"])
+    )
+    config.set(
+        "gemini", "GEMINI_RATE_MAX_WAIT",
+        str(defaults["GEMINI_RATE_MAX_WAIT"])
+    )
+    config.set(
+        "gemini", "GEMINI_OUTPUT_TOKEN_ESTIMATE",
+        str(defaults["GEMINI_OUTPUT_TOKEN_ESTIMATE"])
+    )
+    config.set(
+        "gemini", "GEMINI_RATE_MAX_BUCKETS",
+        str(defaults["GEMINI_RATE_MAX_BUCKETS"])
+    )
+    config.set(
+        "gemini", "GEMINI_USAGE_FLUSH_INTERVAL",
+        str(defaults["GEMINI_USAGE_FLUSH_INTERVAL"])
+    )
+    config.set(
+        "gemini", "GEMINI_RETRY_MAX_ATTEMPTS",
+        str(defaults["GEMINI_RETRY_MAX_ATTEMPTS"])
+    )
+    config.set(
+        "gemini", "GEMINI_RETRY_BASE_DELAY",
+        str(defaults["GEMINI_RETRY_BASE_DELAY"])
+    )
+    config.set(
+        "gemini", "GEMINI_RETRY_MAX_DELAY",
+        str(defaults["GEMINI_RETRY_MAX_DELAY"])
+    )
+    config.set(
+        "gemini", "GEMINI_CALL_DEADLINE",
+        str(defaults["GEMINI_CALL_DEADLINE"])
+    )
+    config.set(
+        "gemini", "GEMINI_HEDGE_PERCENTILE",
+        str(defaults["GEMINI_HEDGE_PERCENTILE"])
+    )
+    config.set(
+        "gemini", "GEMINI_HEDGE_MIN_SAMPLES",
+        str(defaults["GEMINI_HEDGE_MIN_SAMPLES"])
+    )
+    config.set(
+        "gemini", "GEMINI_HEDGE_WORKERS",
+        str(defaults["GEMINI_HEDGE_WORKERS"])
+    )
+    config.set(
+        "gemini", "GEMINI_BREAKER_THRESHOLD",
+        str(defaults["GEMINI_BREAKER_THRESHOLD"])
+    )
+    config.set(
+        "gemini", "GEMINI_BREAKER_COOLDOWN",
+        str(defaults["GEMINI_BREAKER_COOLDOWN"])
+    )
 
     with open(config_file, "w") as configfile:
         config.write(configfile)
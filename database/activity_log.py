@@ -0,0 +1,283 @@
+"""
+BTK Hackathon 2025 - Kullanıcı Etkinlik Günlüğü Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül kullanıcı etkinliklerini bellek içi bir halka arabellekte
+toplar ve arka planda user_activity_logs tablosuna toplu olarak yazar.
+İstek iş parçacığı yalnızca arabelleğe ekleme yapar, veri tabanını
+beklemez.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import atexit
+import json
+import logging
+import threading
+import time
+
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from mysql.connector import IntegrityError
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+
+
+logger = logging.getLogger(__name__)
+
+# Etkinlik kaydı ekleme sorgusu
+INSERT_QUERY = """INSERT INTO user_activity_logs
+    (user_id, action, details, ip_address, user_agent, created_at)
+    VALUES (%s, %s, %s, %s, %s, %s)"""
+
+
+# Etkinlik günlüğü yazıcısı sınıfı
+class ActivityLogger:
+    """Etkinlik günlüğü yazıcısı sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        capacity: int = 10000,
+        batch_size: int = 200,
+        flush_interval: float = 2.0,
+    ):
+        self.capacity = max(1, int(capacity))
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = max(0.1, float(flush_interval))
+        self.db = get_db()
+
+        # Dolu arabelleğe eklenen kayıt en eski kaydı düşürür
+        self._buffer: deque = deque(maxlen=self.capacity)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # İzleme sayaçları
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.requeued = 0
+        self.last_flush_ms = 0.0
+
+    # Arka plan yazma iş parçacığını başlatma fonksiyonu
+    def _ensure_started(self) -> None:
+        """
+        Arka plan yazma iş parçacığını başlatma fonksiyonu
+
+        Kilit tutulurken çağrılmalıdır.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="activity-log-flush", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    # Etkinliği arabelleğe ekleme fonksiyonu
+    def log(
+        self,
+        user_id: int,
+        action: str,
+        details: Any = None,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """
+        Etkinliği arabelleğe ekleme fonksiyonu
+
+        Arabellek doluysa en eski kayıt düşürülür ve dropped sayacı
+        artırılır; çağıran hiçbir zaman beklemez.
+
+        Parametreler:
+            user_id (int): Kullanıcı ID'si
+            action (str): Etkinlik adı, ör. "login", "education.generate"
+            details (Any, optional): Ek bilgiler; sözce değilse JSON olarak
+                saklanır
+            ip_address (str, optional): IP adresi
+            user_agent (str, optional): Kullanıcı aracısı
+        """
+        if user_id is None:
+            return
+        if details is not None and not isinstance(details, str):
+            details = json.dumps(details, ensure_ascii=False, default=str)
+
+        record = (user_id, action[:100], details, ip_address, user_agent,
+                  datetime.now())
+        with self._lock:
+            if len(self._buffer) == self.capacity:
+                self.dropped += 1
+            self._buffer.append(record)
+            self.enqueued += 1
+            full = len(self._buffer) >= self.batch_size
+            self._ensure_started()
+        if full:
+            self._wakeup.set()
+
+    # Arka plan yazma döngüsü fonksiyonu
+    def _run(self) -> None:
+        """
+        Arka plan yazma döngüsü fonksiyonu
+        """
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    # Arabellekteki kayıtları veri tabanına yazma fonksiyonu
+    def flush(self) -> int:
+        """
+        Arabellekteki kayıtları veri tabanına yazma fonksiyonu
+
+        Kayıtlar batch_size büyüklüğünde gruplar halinde execute_many ile
+        yazılır. Bir kayıt bütünlük hatası verirse (ör. kullanıcı
+        silinmişse) grup tek tek yazılır ve yalnızca hatalı kayıtlar
+        atılır. Bağlantı hatası gibi diğer hatalarda grup arabelleğin
+        başına geri konur ve bir sonraki turda yeniden denenir.
+
+        Döndürülenler:
+            int: Yazılan kayıt sayısı
+        """
+        with self._flush_lock:
+            started = time.monotonic()
+            written = 0
+            while True:
+                with self._lock:
+                    count = min(self.batch_size, len(self._buffer))
+                    batch = [self._buffer.popleft() for _ in range(count)]
+                if not batch:
+                    break
+
+                try:
+                    self.db.execute_many(INSERT_QUERY, batch)
+                    written += len(batch)
+                except IntegrityError as e:
+                    logger.warning(f"Etkinlik günlüğü grubu yazılamadı, "
+                                   f"kayıtlar tek tek yazılıyor: {e}")
+                    written += self._write_rows(batch)
+                except Exception as e:
+                    logger.error(f"Etkinlik günlüğü yazılamadı: {e}")
+                    self._requeue(batch)
+                    break
+
+            with self._lock:
+                self.written += written
+                if written:
+                    self.last_flush_ms = round(
+                        (time.monotonic() - started) * 1000, 2
+                    )
+            return written
+
+    # Kayıtları tek tek yazma fonksiyonu
+    def _write_rows(self, batch: List[tuple]) -> int:
+        """
+        Kayıtları tek tek yazma fonksiyonu
+
+        Bütünlük hatası veren kayıtlar atılır; bağlantı hatası olursa
+        kalan kayıtlar arabelleğe geri konur.
+
+        Parametreler:
+            batch (List[tuple]): Etkinlik kayıtları
+
+        Döndürülenler:
+            int: Yazılan kayıt sayısı
+        """
+        written = 0
+        for position, record in enumerate(batch):
+            try:
+                self.db.execute_update(INSERT_QUERY, record)
+                written += 1
+            except IntegrityError as e:
+                logger.error(f"Etkinlik kaydı atıldı (user_id="
+                             f"{record[0]}, action={record[1]}): {e}")
+                with self._lock:
+                    self.failed += 1
+            except Exception as e:
+                logger.error(f"Etkinlik günlüğü yazılamadı: {e}")
+                self._requeue(batch[position:])
+                break
+        return written
+
+    # Yazılamayan kayıtları arabelleğin başına geri koyma fonksiyonu
+    def _requeue(self, batch: List[tuple]) -> None:
+        """
+        Yazılamayan kayıtları arabelleğin başına geri koyma fonksiyonu
+
+        Arabellekte yer yoksa grubun en eski kayıtları düşürülür; yeni
+        gelen kayıtlar korunur.
+
+        Parametreler:
+            batch (List[tuple]): Etkinlik kayıtları
+        """
+        with self._lock:
+            overflow = len(batch) - (self.capacity - len(self._buffer))
+            if overflow > 0:
+                self.dropped += overflow
+                batch = batch[overflow:]
+            self._buffer.extendleft(reversed(batch))
+            self.requeued += len(batch)
+
+    # Yazıcıyı durdurma ve son kayıtları yazma fonksiyonu
+    def stop(self) -> None:
+        """
+        Yazıcıyı durdurma ve son kayıtları yazma fonksiyonu
+
+        Uygulama kapanırken atexit ile çağrılır.
+        """
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None and \
+                self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval)
+        self.flush()
+
+    # Yazıcı istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Any]:
+        """
+        Yazıcı istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: Arabellek boyutu, yazılan ve düşürülen kayıtlar
+        """
+        with self._lock:
+            return {
+                "buffer_size": len(self._buffer),
+                "capacity": self.capacity,
+                "enqueued": self.enqueued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "requeued": self.requeued,
+                "last_flush_ms": self.last_flush_ms,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnek
+activity_logger = ActivityLogger(
+    capacity=int(config.get("ACTIVITY_LOG_CAPACITY", 10000)),
+    batch_size=int(config.get("ACTIVITY_LOG_BATCH_SIZE", 200)),
+    flush_interval=float(config.get("ACTIVITY_LOG_FLUSH_INTERVAL", 2)),
+)
+
+
+# Etkinlik günlüğü yazıcısı örneğini döndürme fonksiyonu
+def get_activity_logger() -> ActivityLogger:
+    """
+    Etkinlik günlüğü yazıcısı örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        ActivityLogger: Etkinlik günlüğü yazıcısı nesnesi
+    """
+    return activity_logger
@@ -0,0 +1,244 @@
+"""
+BTK Hackathon 2025 - MariaDB Bağlantı Havuzu Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül MariaDB bağlantılarını sınırlı boyutta, iş parçacığı güvenli
+bir havuzda tutar ve yeniden kullanır.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import logging
+import mysql.connector
+import threading
+import time
+
+from mysql.connector import Error
+from typing import Any, Dict, List
+
+
+logger = logging.getLogger(__name__)
+
+
+# Havuzdan bağlantı alınamadığında fırlatılan özel durum sınıfı
+class PoolTimeoutError(Error):
+    """Havuzdan bağlantı alınamadığında fırlatılan özel durum sınıfı"""
+
+    pass
+
+
+# Havuzdaki tek bir bağlantıyı ve zaman bilgilerini tutan sınıf
+class PooledConnection:
+    """Havuzdaki tek bir bağlantıyı ve zaman bilgilerini tutan sınıf"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, connection):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.broken = False
+
+
+# Veri tabanı bağlantı havuzu sınıfı
+class ConnectionPool:
+    """Veri tabanı bağlantı havuzu sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        pool_size: int = 10,
+        max_lifetime: int = 1800,
+        max_idle: int = 300,
+        checkout_timeout: float = 10.0,
+    ):
+        self.config = config
+        self.pool_size = max(1, int(pool_size))
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.checkout_timeout = checkout_timeout
+
+        self._idle: List[PooledConnection] = []
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+        # İzleme sayaçları
+        self._open = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._created = 0
+        self._recycled = 0
+        self._timeouts = 0
+
+    # Yeni bağlantı oluşturma fonksiyonu
+    def _create(self) -> PooledConnection:
+        """
+        Yeni bağlantı oluşturma fonksiyonu
+
+        Döndürülenler:
+            PooledConnection: Yeni havuz bağlantısı
+        """
+        connection = mysql.connector.connect(**self.config)
+        with self._lock:
+            self._created += 1
+        return PooledConnection(connection)
+
+    # Bağlantıyı sessizce kapatma fonksiyonu
+    def _close(self, entry: PooledConnection) -> None:
+        """
+        Bağlantıyı sessizce kapatma fonksiyonu
+
+        Parametreler:
+            entry (PooledConnection): Kapatılacak bağlantı
+        """
+        try:
+            entry.connection.close()
+        except Exception as e:
+            logger.debug(f"Havuz bağlantısı kapatılırken hata: {e}")
+
+    # Bağlantının yeniden kullanılabilir olup olmadığını denetleme fonksiyonu
+    def _is_usable(self, entry: PooledConnection) -> bool:
+        """
+        Bağlantının yeniden kullanılabilir olup olmadığını denetleme
+        fonksiyonu
+
+        Ömrünü veya boşta kalma süresini aşan bağlantılar geri dönüştürülür,
+        kalan bağlantılar ping ile sağlık denetiminden geçirilir.
+
+        Parametreler:
+            entry (PooledConnection): Denetlenecek bağlantı
+
+        Döndürülenler:
+            bool: Bağlantı kullanılabilirse True
+        """
+        now = time.monotonic()
+        if self.max_lifetime and now - entry.created_at > self.max_lifetime:
+            return False
+        if self.max_idle and now - entry.last_used > self.max_idle:
+            return False
+
+        try:
+            entry.connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    # Havuzdan bağlantı alma fonksiyonu
+    def acquire(self) -> PooledConnection:
+        """
+        Havuzdan bağlantı alma fonksiyonu
+
+        Boşta bağlantı yoksa ve havuz doluysa checkout_timeout süresince
+        bekler.
+
+        Döndürülenler:
+            PooledConnection: Kullanıma hazır bağlantı
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+
+        while True:
+            entry = None
+            with self._available:
+                while not self._idle and self._open >= self.pool_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            msg="Veri tabanı bağlantı havuzu dolu, "
+                                "bağlantı alınamadı"
+                        )
+                    self._waiting += 1
+                    try:
+                        self._available.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+
+                if self._idle:
+                    entry = self._idle.pop()
+                else:
+                    self._open += 1
+                self._in_use += 1
+
+            if entry is None:
+                try:
+                    return self._create()
+                except Exception:
+                    with self._available:
+                        self._open -= 1
+                        self._in_use -= 1
+                        self._available.notify()
+                    raise
+
+            if self._is_usable(entry):
+                return entry
+
+            # Sağlıksız veya süresi dolmuş bağlantıyı geri dönüştür
+            self._close(entry)
+            with self._available:
+                self._open -= 1
+                self._in_use -= 1
+                self._recycled += 1
+                self._available.notify()
+
+    # Bağlantıyı havuza geri bırakma fonksiyonu
+    def release(self, entry: PooledConnection) -> None:
+        """
+        Bağlantıyı havuza geri bırakma fonksiyonu
+
+        Parametreler:
+            entry (PooledConnection): Bırakılacak bağlantı
+        """
+        reusable = not entry.broken
+        if reusable:
+            try:
+                reusable = entry.connection.is_connected()
+                if reusable and entry.connection.in_transaction:
+                    entry.connection.rollback()
+            except Exception:
+                reusable = False
+
+        if not reusable:
+            self._close(entry)
+
+        with self._available:
+            self._in_use -= 1
+            if reusable:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            else:
+                self._open -= 1
+                self._recycled += 1
+            self._available.notify()
+
+    # Havuzdaki boşta bağlantıları kapatma fonksiyonu
+    def close_all(self) -> None:
+        """
+        Havuzdaki boşta bağlantıları kapatma fonksiyonu
+        """
+        with self._available:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+        for entry in idle:
+            self._close(entry)
+
+    # Havuz istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, int]:
+        """
+        Havuz istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, int]: Havuz istatistikleri
+        """
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "open": self._open,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "created": self._created,
+                "recycled": self._recycled,
+                "timeouts": self._timeouts,
+            }
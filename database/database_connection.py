@@ -18,10 +18,13 @@ import textwrap
 
 from contextlib import contextmanager
 from cryptography.fernet import Fernet
+from flask import g, has_app_context
 from mysql.connector import Error
 from typing import Optional, Dict, Any, List, Tuple
 
 from config.config_loader import load_config
+from database.connection_pool import ConnectionPool
+from database.memory_cache import TTLCache
 
 
 # Logging yapılandırması
@@ -60,6 +63,20 @@ class DatabaseConnection:
             "raise_on_warnings": True,
         }
 
+        # Bağlantı havuzu
+        self.pool = ConnectionPool(
+            self.config,
+            pool_size=int(config.get("DB_POOL_SIZE", 10)),
+            max_lifetime=int(config.get("DB_POOL_MAX_LIFETIME", 1800)),
+            max_idle=int(config.get("DB_POOL_MAX_IDLE", 300)),
+            checkout_timeout=float(config.get("DB_POOL_TIMEOUT", 10)),
+        )
+
+        # İstek boyunca tek bağlantı kullanımı
+        self.request_scoped = str(
+            config.get("DB_REQUEST_SCOPED", "True")
+        ).lower() == "true"
+
     # Veri tabanı bağlantısını sınama fonksiyonu
     def test_connection(self) -> bool:
         """
@@ -84,21 +101,70 @@ class DatabaseConnection:
         """
         Bağlam yöneticisi olarak veri tabanı bağlantısı sağlama fonksiyonu
 
+        Bağlantılar her seferinde yeniden kurulmaz, havuzdan alınır ve
+        iş bitince havuza geri bırakılır. İstek kapsamı etkinse bir Flask
+        isteği içindeki ilk sorguda alınan bağlantı flask.g üzerinde
+        saklanır ve istek sonuna kadar tüm sorgularda yeniden kullanılır.
+        end_request_scope çağrıldıktan sonra istek içindeki sorgular da
+        bağlantıyı hemen geri bırakır.
+
         Yields:
             mysql.connector.connection: Veri tabanı bağlantısı
         """
-        connection = None
+        scoped = self.request_scoped and has_app_context() \
+            and not g.get("_db_scope_ended", False)
+        entry = None
         try:
-            connection = mysql.connector.connect(**self.config)
-            yield connection
+            if scoped:
+                entry = g.get("_db_connection")
+                if entry is None:
+                    entry = self.pool.acquire()
+                    g._db_connection = entry
+            else:
+                entry = self.pool.acquire()
+            yield entry.connection
         except Error as e:
             logger.error(f"Veri tabanı bağlantı hatası: {e}")
-            if connection:
-                connection.rollback()
+            if entry:
+                try:
+                    entry.connection.rollback()
+                except Exception:
+                    entry.broken = True
             raise
         finally:
-            if connection and connection.is_connected():
-                connection.close()
+            if entry and (not scoped or entry.broken):
+                if scoped:
+                    g.pop("_db_connection", None)
+                self.pool.release(entry)
+
+    # İstek kapsamındaki bağlantıyı havuza geri bırakma fonksiyonu
+    def release_request_connection(self, exception=None) -> None:
+        """
+        İstek kapsamındaki bağlantıyı havuza geri bırakma fonksiyonu
+
+        Flask teardown kancası olarak çağrılır.
+
+        Parametreler:
+            exception (Exception, optional): İstek sırasında oluşan hata
+        """
+        entry = g.pop("_db_connection", None)
+        if entry:
+            self.pool.release(entry)
+
+    # İstek kapsamındaki bağlantıyı erken bırakma fonksiyonu
+    def end_request_scope(self) -> None:
+        """
+        İstek kapsamındaki bağlantıyı erken bırakma fonksiyonu
+
+        Gemini çağrısı veya SSE akışı gibi uzun süren işlerden önce
+        çağrılır. Bağlantı hemen havuza geri bırakılır ve isteğin geri
+        kalanındaki sorgular bağlantıyı yalnızca sorgu süresince tutar;
+        böylece yavaş istekler havuzu tüketmez.
+        """
+        if not has_app_context():
+            return
+        g._db_scope_ended = True
+        self.release_request_connection()
 
     # Bağlam yöneticisi olarak imleç sağlama fonksiyonu
     @contextmanager
@@ -124,6 +190,35 @@ class DatabaseConnection:
             finally:
                 cursor.close()
 
+    # Bağlam yöneticisi olarak işlem (transaction) sağlama fonksiyonu
+    @contextmanager
+    def transaction(self, dictionary=True):
+        """
+        Bağlam yöneticisi olarak işlem (transaction) sağlama fonksiyonu
+
+        Bloktaki tüm sorgular aynı bağlantı üzerinde tek bir işlem olarak
+        çalışır. Blok hatasız biterse işlem onaylanır, aksi halde geri
+        alınır.
+
+        Parametreler:
+            dictionary (bool): Sonuçları sözlük olarak döndürür
+
+        Yields:
+            mysql.connector.cursor: Veri tabanı imleci
+        """
+        with self.get_connection() as connection:
+            cursor = connection.cursor(dictionary=dictionary)
+            try:
+                connection.start_transaction()
+                yield cursor
+                connection.commit()
+            except Exception as e:
+                connection.rollback()
+                logger.error(f"İşlem geri alındı: {e}")
+                raise
+            finally:
+                cursor.close()
+
     # SELECT sorgusu çalıştırır ve sonuçları döndürme fonksiyonu
     def execute_query(
         self, query: str, params: Optional[Tuple] = None
@@ -263,6 +358,18 @@ class DatabaseConnection:
             raise
 
 
+    # Bağlantı havuzu istatistiklerini döndürme fonksiyonu
+    def get_pool_stats(self) -> Dict[str, int]:
+        """
+        Bağlantı havuzu istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, int]: Kullanımdaki, bekleyen, oluşturulan ve geri
+            dönüştürülen bağlantı sayıları
+        """
+        return self.pool.stats()
+
+
 # Tekil örnek
 db = DatabaseConnection()
 
@@ -287,6 +394,18 @@ def init_database():
         return False
 
 
+# İstek kapsamlı bağlantı yönetimini Flask uygulamasına kaydetme fonksiyonu
+def register_request_scope(app) -> None:
+    """
+    İstek kapsamlı bağlantı yönetimini Flask uygulamasına kaydetme
+    fonksiyonu
+
+    Parametreler:
+        app (Flask): Flask uygulaması
+    """
+    app.teardown_appcontext(db.release_request_connection)
+
+
 # Veri tabanı örneğini döndürme fonksiyonu
 def get_db():
     """
@@ -298,6 +417,40 @@ def get_db():
     return db
 
 
+# Kullanıcı ayarları değiştiğinde çağrılacak fonksiyonlar
+_settings_listeners: List = []
+
+
+# Ayar değişikliği dinleyicisi kaydetme fonksiyonu
+def register_settings_listener(callback) -> None:
+    """
+    Ayar değişikliği dinleyicisi kaydetme fonksiyonu
+
+    Kullanıcı ayarları kaydedildiğinde callback(user_id), sistem
+    varsayılan Gemini anahtarı değiştiğinde callback(None) çağrılır.
+
+    Parametreler:
+        callback (Callable): Çağrılacak fonksiyon
+    """
+    if callback not in _settings_listeners:
+        _settings_listeners.append(callback)
+
+
+# Ayar değişikliğini dinleyicilere bildirme fonksiyonu
+def _notify_settings_changed(user_id: Optional[int]) -> None:
+    """
+    Ayar değişikliğini dinleyicilere bildirme fonksiyonu
+
+    Parametreler:
+        user_id (int | None): Ayarları değişen kullanıcı, None ise tümü
+    """
+    for callback in list(_settings_listeners):
+        try:
+            callback(user_id)
+        except Exception as e:
+            logger.error(f"Ayar dinleyicisi hatası: {e}")
+
+
 # SQL enjektesine karşı sözcesi güvenli hale getirme fonksiyonu
 def escape_string(
         value: str
@@ -485,7 +638,8 @@ def initialize_database_schema():
     Başlangıç veri tabanı şemasını MariaDB'ye uygulama fonksiyonu
 
     Kurulum sırasında çağrıldığında Veri tabanı ve
-     tüm tablolar otomatik olarak oluşturulur.
+     tüm tablolar otomatik olarak oluşturulur. Sonradan eklenen tablolar,
+     sütunlar ve dizinler database/migrations.py ile uygulanır.
     """
 
     config = load_config()
@@ -516,7 +670,8 @@ def initialize_database_schema():
             INDEX idx_username (username),
             INDEX idx_email (email),
             INDEX idx_role (role),
-            INDEX idx_is_active (is_active)
+            INDEX idx_is_active (is_active),
+            INDEX idx_created_at (created_at)
         ) ENGINE=InnoDB CHARACTER SET {db_charset} COLLATE {db_collation};
 
         CREATE TABLE IF NOT EXISTS user_sessions (
@@ -538,13 +693,16 @@ def initialize_database_schema():
             user_id INT NOT NULL,
             subject VARCHAR(200) NOT NULL,
             content TEXT NOT NULL,
+            search_text MEDIUMTEXT NULL,
             generated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             is_favorite BOOLEAN DEFAULT FALSE,
             FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
             INDEX idx_user_id (user_id),
             INDEX idx_subject (subject),
             INDEX idx_generated_at (generated_at),
-            INDEX idx_is_favorite (is_favorite)
+            INDEX idx_is_favorite (is_favorite),
+            INDEX idx_user_generated (user_id, generated_at, id),
+            FULLTEXT INDEX ft_search_text (search_text)
         ) ENGINE=InnoDB CHARACTER SET {db_charset} COLLATE {db_collation};
 
         CREATE TABLE IF NOT EXISTS assignment_evaluations (
@@ -552,13 +710,16 @@ def initialize_database_schema():
             user_id INT NOT NULL,
             assignment_text TEXT NOT NULL,
             criteria TEXT NOT NULL,
+            submission_digest CHAR(64),
             evaluation_result TEXT NOT NULL,
             score DECIMAL(5,2),
             evaluated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
             INDEX idx_user_id (user_id),
             INDEX idx_evaluated_at (evaluated_at),
-            INDEX idx_score (score)
+            INDEX idx_score (score),
+            INDEX idx_user_digest (user_id, submission_digest, evaluated_at),
+            INDEX idx_user_evaluated (user_id, evaluated_at, id)
         ) ENGINE=InnoDB CHARACTER SET {db_charset} COLLATE {db_collation};
 
         CREATE TABLE IF NOT EXISTS user_activity_logs (
@@ -699,24 +860,6 @@ def initialize_database_schema():
              'integer',
              'Yedek dosyaları saklama süresi')
         ON DUPLICATE KEY UPDATE config_value = VALUES(config_value);
-
-        CREATE VIEW user_stats AS
-        SELECT
-            u.id,
-            u.username,
-            u.full_name,
-            u.role,
-            u.created_at,
-            u.last_login,
-            COUNT(DISTINCT ec.id) AS education_count,
-            COUNT(DISTINCT ae.id) AS assignment_count,
-            AVG(ae.score) AS avg_assignment_score
-        FROM users u
-        LEFT JOIN education_contents ec ON u.id = ec.user_id
-        LEFT JOIN assignment_evaluations ae ON u.id = ae.user_id
-        WHERE u.is_active = TRUE
-        GROUP BY u.id, u.username, u.full_name, u.role, u.created_at,
-                u.last_login;
     """
     )
 
@@ -816,6 +959,9 @@ def set_system_config(
                 (key, value, config_type),
             )
 
+        if key == "GEMINI_API_KEY":
+            _notify_settings_changed(None)
+
         return success
 
     except Exception as e:
@@ -846,6 +992,133 @@ def get_system_config(key: str) -> Optional[str]:
         return None
 
 
+# Kullanıcı ayarları önbelleği sınıfı
+class UserSettingsCache:
+    """Kullanıcı ayarları önbelleği sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, max_size: int = 1024, ttl: int = 60):
+        # Çözülmüş API anahtarı bellekte yalnızca ttl süresince kalır
+        self.cache = TTLCache(max_size=max_size, ttl=ttl)
+
+        # İzleme sayaçları
+        self.db_loads = 0
+        self.db_saved = 0
+        self.decrypts = 0
+        self.decrypts_saved = 0
+
+    # Kullanıcı ayarlarını veri tabanından yükleme fonksiyonu
+    def _load(self, user_id: int) -> Dict[str, Any]:
+        """
+        Kullanıcı ayarlarını veri tabanından yükleme fonksiyonu
+
+        Parametreler:
+            user_id (int): Kullanıcı ID'si
+
+        Döndürülenler:
+            Dict[str, Any]: Çözülmüş ayar satırı
+        """
+        result = db.fetch_one(
+            """SELECT gemini_api_key, gemini_model, dark_mode
+                FROM user_settings WHERE user_id = %s""",
+            (user_id,),
+        )
+        self.db_loads += 1
+
+        if not result:
+            return {
+                "gemini_api_key": None,
+                "gemini_model": "gemini-2.5-flash",
+                "dark_mode": False,
+                "api_key_unreadable": False,
+            }
+
+        api_key = result["gemini_api_key"]
+        api_key_decrypted = None
+        if api_key:
+            self.decrypts += 1
+            try:
+                api_key_decrypted = fernet.decrypt(api_key.encode()).decode()
+            except Exception:
+                api_key_decrypted = None
+        return {
+            "gemini_api_key": api_key_decrypted,
+            "gemini_model": result["gemini_model"],
+            "dark_mode": bool(result["dark_mode"]),
+            "api_key_unreadable": bool(api_key) and not api_key_decrypted,
+        }
+
+    # Kullanıcı ayarlarını önbellekten veya veri tabanından alma fonksiyonu
+    def get(self, user_id: int) -> Dict[str, Any]:
+        """
+        Kullanıcı ayarlarını önbellekten veya veri tabanından alma fonksiyonu
+
+        Parametreler:
+            user_id (int): Kullanıcı ID'si
+
+        Döndürülenler:
+            Dict[str, Any]: Ayarların kopyası
+        """
+        row = self.cache.get(user_id)
+        if row is None:
+            row = self._load(user_id)
+            self.cache.set(user_id, row)
+        else:
+            self.db_saved += 1
+            if row["gemini_api_key"]:
+                self.decrypts_saved += 1
+        return dict(row)
+
+    # Kullanıcının önbellek kaydını silme fonksiyonu
+    def invalidate(self, user_id: Optional[int] = None) -> None:
+        """
+        Kullanıcının önbellek kaydını silme fonksiyonu
+
+        Parametreler:
+            user_id (int, optional): Kullanıcı ID'si, None ise tümü
+        """
+        if user_id is None:
+            self.cache.clear()
+        else:
+            self.cache.delete(user_id)
+
+    # Önbellek istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Any]:
+        """
+        Önbellek istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: Önbellek ve tasarruf sayaçları
+        """
+        stats = self.cache.stats()
+        stats.update({
+            "db_loads": self.db_loads,
+            "db_round_trips_saved": self.db_saved,
+            "decrypts": self.decrypts,
+            "decrypts_saved": self.decrypts_saved,
+        })
+        return stats
+
+
+# Kullanıcı ayarları önbelleği tekil örneği
+_settings_config = load_config()
+settings_cache = UserSettingsCache(
+    max_size=int(_settings_config.get("SETTINGS_CACHE_SIZE", 1024)),
+    ttl=int(_settings_config.get("SETTINGS_CACHE_TTL", 60)),
+)
+
+
+# Kullanıcı ayarları önbelleği örneğini döndürme fonksiyonu
+def get_settings_cache() -> UserSettingsCache:
+    """
+    Kullanıcı ayarları önbelleği örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        UserSettingsCache: Ayar önbelleği nesnesi
+    """
+    return settings_cache
+
+
 # Kullanıcı ayarlarını alma fonksiyonu
 def get_user_settings(user_id: int) -> Optional[Dict]:
     """
@@ -858,36 +1131,13 @@ def get_user_settings(user_id: int) -> Optional[Dict]:
         Optional[Dict]: Kullanıcı ayarları veya None
     """
     try:
-        result = db.fetch_one(
-            """SELECT gemini_api_key, gemini_model, dark_mode
-                FROM user_settings WHERE user_id = %s""",
-            (user_id,),
+        settings = settings_cache.get(user_id)
+        settings.pop("api_key_unreadable", None)
+        settings["gemini_api_key_masked"] = (
+            mask_api_key(settings["gemini_api_key"])
+            if settings["gemini_api_key"] else None
         )
-        if result:
-            api_key = result["gemini_api_key"]
-            if api_key:
-                try:
-                    api_key_decrypted = fernet.decrypt(api_key.encode()).decode()
-                    api_key_masked = mask_api_key(api_key_decrypted)
-                except Exception:
-                    api_key_decrypted = None
-                    api_key_masked = None
-            else:
-                api_key_decrypted = None
-                api_key_masked = None
-            return {
-                "gemini_api_key": api_key_decrypted,
-                "gemini_api_key_masked": api_key_masked,
-                "gemini_model": result["gemini_model"],
-                "dark_mode": bool(result["dark_mode"]),
-            }
-        else:
-            return {
-                "gemini_api_key": None,
-                "gemini_api_key_masked": None,
-                "gemini_model": "gemini-2.5-flash",
-                "dark_mode": False,
-            }
+        return settings
     except Exception as e:
         logger.error(f"Kullanıcı ayarları alma hatası: {e}")
         return None
@@ -939,6 +1189,8 @@ def save_user_settings(
                 gemini_model or "gemini-2.5-flash",
                 dark_mode if dark_mode is not None else False,
             ))
+        settings_cache.invalidate(user_id)
+        _notify_settings_changed(user_id)
         return True
     except Exception as e:
         logger.error(f"Kullanıcı ayarları kaydetme hatası: {e}")
@@ -961,16 +1213,11 @@ def get_user_gemini_api_key(user_id: int) -> Optional[str]:
     """
     try:
         # Önce kullanıcının kendi anahtarını denetle
-        result = db.fetch_one(
-            "SELECT gemini_api_key FROM user_settings WHERE user_id = %s AND gemini_api_key IS NOT NULL",
-            (user_id,),
-        )
-
-        if result and result["gemini_api_key"]:
-            try:
-                return fernet.decrypt(result["gemini_api_key"].encode()).decode()
-            except Exception:
-                return None
+        settings = settings_cache.get(user_id)
+        if settings["gemini_api_key"]:
+            return settings["gemini_api_key"]
+        if settings["api_key_unreadable"]:
+            return None
         return get_system_config("GEMINI_API_KEY")
     except Exception as e:
         logger.error(f"Kullanıcı Gemini API anahtarı alma hatası: {e}")
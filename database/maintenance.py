@@ -0,0 +1,272 @@
+"""
+BTK Hackathon 2025 - Veri Tabanı Bakım Zamanlayıcısı Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül süresi dolan oturumların temizlenmesi gibi dönemsel bakım
+işlerini arka planda, belirli aralıklarla çalıştırır.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import logging
+import threading
+import time
+
+from typing import Any, Callable, Dict, List, Optional
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+
+
+logger = logging.getLogger(__name__)
+
+
+# Büyük tabloda satırları küçük gruplar halinde silme fonksiyonu
+def delete_in_batches(
+    table: str,
+    condition: str,
+    params: tuple = (),
+    batch_size: int = 1000,
+    pause: float = 0.0,
+) -> int:
+    """
+    Büyük tabloda satırları küçük gruplar halinde silme fonksiyonu
+
+    Her tur DELETE ... LIMIT ile en fazla batch_size satır siler; böylece
+    tek bir uzun işlemin tabloyu uzun süre kilitlemesi önlenir.
+
+    Parametreler:
+        table (str): Tablo adı
+        condition (str): WHERE koşulu
+        params (tuple): Koşul parametreleri
+        batch_size (int): Bir turda silinecek en fazla satır sayısı
+        pause (float): Turlar arasında beklenecek süre (saniye)
+
+    Döndürülenler:
+        int: Silinen toplam satır sayısı
+    """
+    db = get_db()
+    query = f"DELETE FROM {table} WHERE {condition} LIMIT %s"
+
+    total = 0
+    while True:
+        removed = db.execute_update(query, tuple(params) + (batch_size,))
+        total += removed
+        if removed < batch_size:
+            return total
+        if pause:
+            time.sleep(pause)
+
+
+# Zamanlanmış tek bir bakım işini temsil eden sınıf
+class MaintenanceTask:
+    """Zamanlanmış tek bir bakım işini temsil eden sınıf"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, name: str, func: Callable[[], Any], interval: float):
+        self.name = name
+        self.func = func
+        self.interval = float(interval)
+        self.next_run = time.monotonic() + self.interval
+
+        # Son çalıştırma bilgileri
+        self.runs = 0
+        self.failures = 0
+        self.total_rows = 0
+        self.last_rows = None
+        self.last_duration_ms = None
+        self.last_error = None
+        self.last_run_at = None
+
+    # İşi sözlük olarak döndürme fonksiyonu
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        İşi sözlük olarak döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: İş bilgileri ve son çalıştırma sonuçları
+        """
+        return {
+            "interval": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "total_rows": self.total_rows,
+            "last_rows": self.last_rows,
+            "last_duration_ms": self.last_duration_ms,
+            "last_error": self.last_error,
+            "last_run_at": self.last_run_at,
+        }
+
+
+# Bakım zamanlayıcısı sınıfı
+class MaintenanceScheduler:
+    """Bakım zamanlayıcısı sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self):
+        self._tasks: List[MaintenanceTask] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    # Zamanlayıcıya iş ekleme fonksiyonu
+    def add_task(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: float,
+        run_at_start: bool = False,
+    ) -> None:
+        """
+        Zamanlayıcıya iş ekleme fonksiyonu
+
+        Parametreler:
+            name (str): İş adı
+            func (Callable): Çalıştırılacak fonksiyon; etkilenen satır
+                sayısını döndürürse istatistiklere eklenir
+            interval (float): Çalıştırma aralığı (saniye), 0 ise iş
+                eklenmez
+            run_at_start (bool): True ise ilk çalıştırma aralık
+                beklenmeden yapılır
+        """
+        if interval <= 0:
+            logger.info(f"Bakım işi kapalı: {name}")
+            return
+
+        task = MaintenanceTask(name, func, interval)
+        if run_at_start:
+            task.next_run = time.monotonic()
+
+        with self._lock:
+            if any(t.name == name for t in self._tasks):
+                return
+            self._tasks.append(task)
+        self._wakeup.set()
+
+    # İşi çalıştırma ve sonuçlarını kaydetme fonksiyonu
+    def _run_task(self, task: MaintenanceTask) -> None:
+        """
+        İşi çalıştırma ve sonuçlarını kaydetme fonksiyonu
+
+        Parametreler:
+            task (MaintenanceTask): Çalıştırılacak iş
+        """
+        started = time.monotonic()
+        try:
+            result = task.func()
+            task.last_error = None
+        except Exception as e:
+            result = None
+            task.failures += 1
+            task.last_error = str(e)
+            logger.error(f"Bakım işi başarısız oldu ({task.name}): {e}")
+
+        task.runs += 1
+        task.last_duration_ms = round((time.monotonic() - started) * 1000, 2)
+        task.last_run_at = time.time()
+        task.last_rows = result if isinstance(result, int) else None
+        if task.last_rows:
+            task.total_rows += task.last_rows
+            logger.info(
+                f"Bakım işi {task.name}: {task.last_rows} satır, "
+                f"{task.last_duration_ms} ms"
+            )
+
+    # Zamanlayıcı döngüsü fonksiyonu
+    def _loop(self) -> None:
+        """
+        Zamanlayıcı döngüsü fonksiyonu
+        """
+        while True:
+            with self._lock:
+                tasks = list(self._tasks)
+
+            now = time.monotonic()
+            for task in tasks:
+                if task.next_run <= now:
+                    self._run_task(task)
+                    task.next_run = time.monotonic() + task.interval
+
+            with self._lock:
+                next_run = min(
+                    (task.next_run for task in self._tasks), default=None
+                )
+            timeout = None if next_run is None \
+                else max(0.0, next_run - time.monotonic())
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+    # Zamanlayıcıyı başlatma fonksiyonu
+    def start(self) -> None:
+        """
+        Zamanlayıcıyı başlatma fonksiyonu
+        """
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._loop, name="db-maintenance", daemon=True
+            )
+            self._thread.start()
+
+    # İşi hemen çalıştırma fonksiyonu
+    def run_now(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        İşi hemen çalıştırma fonksiyonu
+
+        Parametreler:
+            name (str): İş adı
+
+        Döndürülenler:
+            Dict[str, Any] | None: İşin son çalıştırma bilgileri veya iş
+            bulunamazsa None
+        """
+        with self._lock:
+            task = next((t for t in self._tasks if t.name == name), None)
+        if task is None:
+            return None
+        self._run_task(task)
+        return task.to_dict()
+
+    # Zamanlayıcı istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Zamanlayıcı istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Dict[str, Any]]: İş adına göre çalıştırma bilgileri
+        """
+        with self._lock:
+            return {task.name: task.to_dict() for task in self._tasks}
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Bakım ayarları
+SESSION_CLEANUP_INTERVAL = float(config.get("SESSION_CLEANUP_INTERVAL", 900))
+SESSION_CLEANUP_BATCH_SIZE = int(
+    config.get("SESSION_CLEANUP_BATCH_SIZE", 1000)
+)
+USER_COUNTERS_RECONCILE_INTERVAL = float(
+    config.get("USER_COUNTERS_RECONCILE_INTERVAL", 3600)
+)
+USER_COUNTERS_RECONCILE_BATCH_SIZE = int(
+    config.get("USER_COUNTERS_RECONCILE_BATCH_SIZE", 500)
+)
+
+# Tekil örnek
+scheduler = MaintenanceScheduler()
+
+
+# Bakım zamanlayıcısı örneğini döndürme fonksiyonu
+def get_scheduler() -> MaintenanceScheduler:
+    """
+    Bakım zamanlayıcısı örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        MaintenanceScheduler: Bakım zamanlayıcısı nesnesi
+    """
+    return scheduler
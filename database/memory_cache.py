@@ -0,0 +1,156 @@
+"""
+BTK Hackathon 2025 - Bellek İçi Önbellek Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül süre sınırlı (TTL) ve boyut sınırlı (LRU), iş parçacığı
+güvenli bir bellek içi önbellek sağlar.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+# Süre ve boyut sınırlı önbellek sınıfı
+class TTLCache:
+    """Süre ve boyut sınırlı önbellek sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        self.max_size = max(1, int(max_size))
+        self.ttl = ttl
+
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # İzleme sayaçları
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    # Önbellekten değer alma fonksiyonu
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Önbellekten değer alma fonksiyonu
+
+        Parametreler:
+            key (Hashable): Anahtar
+            default (Any): Kayıt yoksa döndürülecek değer
+
+        Döndürülenler:
+            Any: Önbellekteki değer veya default
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    # Önbelleğe değer yazma fonksiyonu
+    def set(
+        self, key: Hashable, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """
+        Önbelleğe değer yazma fonksiyonu
+
+        Parametreler:
+            key (Hashable): Anahtar
+            value (Any): Değer
+            ttl (float, optional): Saniye cinsinden geçerlilik süresi,
+                verilmezse önbelleğin varsayılan süresi kullanılır
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is not None and ttl <= 0:
+            return
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    # Önbellekten kayıt silme fonksiyonu
+    def delete(self, key: Hashable) -> bool:
+        """
+        Önbellekten kayıt silme fonksiyonu
+
+        Parametreler:
+            key (Hashable): Anahtar
+
+        Döndürülenler:
+            bool: Kayıt silindiyse True
+        """
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    # Koşula uyan kayıtları silme fonksiyonu
+    def delete_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """
+        Koşula uyan kayıtları silme fonksiyonu
+
+        Parametreler:
+            predicate (Callable): (anahtar, değer) alıp bool döndüren
+                fonksiyon
+
+        Döndürülenler:
+            int: Silinen kayıt sayısı
+        """
+        with self._lock:
+            keys = [
+                key for key, (value, _) in self._data.items()
+                if predicate(key, value)
+            ]
+            for key in keys:
+                del self._data[key]
+            return len(keys)
+
+    # Önbelleği temizleme fonksiyonu
+    def clear(self) -> None:
+        """
+        Önbelleği temizleme fonksiyonu
+        """
+        with self._lock:
+            self._data.clear()
+
+    # Önbellekteki kayıt sayısını döndürme fonksiyonu
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    # Önbellek istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, int]:
+        """
+        Önbellek istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, int]: Boyut, isabet ve ıskalama sayaçları
+        """
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
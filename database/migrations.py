@@ -0,0 +1,170 @@
+"""
+BTK Hackathon 2025 - Veri Tabanı Geçişleri Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül ilk kurulumdan sonra şemaya eklenen tabloları, sütunları ve
+dizinleri var olan veri tabanlarına uygular. Tüm komutlar tekrar
+çalıştırılabilir (IF NOT EXISTS, OR REPLACE) olduğundan geçişler her
+başlangıçta, veri tabanı bağlantısı kurulduktan sonra çalıştırılır.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import logging
+
+from typing import List, Tuple
+
+import mysql.connector
+
+from database.database_connection import get_db
+
+
+logger = logging.getLogger(__name__)
+
+
+# Geçişlerden biri başarısız olduğunda fırlatılan özel durum sınıfı
+class MigrationError(Exception):
+    """Geçişlerden biri başarısız olduğunda fırlatılan özel durum sınıfı"""
+
+    pass
+
+
+# Sırayla uygulanacak geçişler: (ad, SQL)
+MIGRATIONS: List[Tuple[str, str]] = [
+    (
+        "users.idx_created_at",
+        "CREATE INDEX IF NOT EXISTS idx_created_at ON users (created_at)",
+    ),
+    (
+        "education_cache",
+        """CREATE TABLE IF NOT EXISTS education_cache (
+            cache_key CHAR(64) PRIMARY KEY,
+            model_name VARCHAR(100) NOT NULL,
+            subject VARCHAR(200) NOT NULL,
+            content MEDIUMTEXT NOT NULL,
+            content_size INT NOT NULL,
+            hit_count INT DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            expires_at TIMESTAMP NOT NULL,
+            INDEX idx_created_at (created_at),
+            INDEX idx_expires_at (expires_at)
+        ) ENGINE=InnoDB""",
+    ),
+    (
+        "assignment_evaluations.submission_digest",
+        """ALTER TABLE assignment_evaluations
+            ADD COLUMN IF NOT EXISTS submission_digest CHAR(64)
+                AFTER criteria""",
+    ),
+    (
+        "assignment_evaluations.idx_user_digest",
+        """CREATE INDEX IF NOT EXISTS idx_user_digest
+            ON assignment_evaluations
+                (user_id, submission_digest, evaluated_at)""",
+    ),
+    (
+        "education_contents.idx_user_generated",
+        """CREATE INDEX IF NOT EXISTS idx_user_generated
+            ON education_contents (user_id, generated_at, id)""",
+    ),
+    (
+        "education_contents.search_text",
+        """ALTER TABLE education_contents
+            ADD COLUMN IF NOT EXISTS search_text MEDIUMTEXT NULL
+                AFTER content""",
+    ),
+    (
+        "education_contents.ft_search_text",
+        """CREATE FULLTEXT INDEX IF NOT EXISTS ft_search_text
+            ON education_contents (search_text)""",
+    ),
+    (
+        "assignment_evaluations.idx_user_evaluated",
+        """CREATE INDEX IF NOT EXISTS idx_user_evaluated
+            ON assignment_evaluations (user_id, evaluated_at, id)""",
+    ),
+    (
+        "user_counters",
+        """CREATE TABLE IF NOT EXISTS user_counters (
+            user_id INT PRIMARY KEY,
+            education_count INT NOT NULL DEFAULT 0,
+            assignment_count INT NOT NULL DEFAULT 0,
+            score_sum DECIMAL(14,2) NOT NULL DEFAULT 0,
+            score_n INT NOT NULL DEFAULT 0,
+            last_education_at TIMESTAMP NULL DEFAULT NULL,
+            last_assignment_at TIMESTAMP NULL DEFAULT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                ON UPDATE CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+        ) ENGINE=InnoDB""",
+    ),
+    (
+        "gemini_usage",
+        """CREATE TABLE IF NOT EXISTS gemini_usage (
+            user_id INT NOT NULL,
+            key_fingerprint CHAR(16) NOT NULL,
+            request_count BIGINT NOT NULL DEFAULT 0,
+            last_used TIMESTAMP NULL DEFAULT NULL,
+            PRIMARY KEY (user_id, key_fingerprint),
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+            INDEX idx_last_used (last_used)
+        ) ENGINE=InnoDB""",
+    ),
+    (
+        "user_stats",
+        """CREATE OR REPLACE VIEW user_stats AS
+        SELECT
+            u.id,
+            u.username,
+            u.full_name,
+            u.role,
+            u.created_at,
+            u.last_login,
+            COALESCE(c.education_count, 0) AS education_count,
+            COALESCE(c.assignment_count, 0) AS assignment_count,
+            c.score_sum / NULLIF(c.score_n, 0) AS avg_assignment_score
+        FROM users u
+        LEFT JOIN user_counters c ON c.user_id = u.id
+        WHERE u.is_active = TRUE""",
+    ),
+]
+
+
+# Geçişleri uygulama fonksiyonu
+def apply_migrations() -> int:
+    """
+    Geçişleri uygulama fonksiyonu
+
+    Komutlar ayrı bir bağlantıda çalıştırılır; havuz bağlantıları
+    uyarıları hata saydığından "zaten var" notları geçişi durdururdu.
+    Tablolar veri tabanının varsayılan karakter kümesiyle oluşturulur.
+    Bir komut başarısız olursa sonraki komutlar çalıştırılmaz.
+
+    Döndürülenler:
+        int: Çalıştırılan geçiş sayısı
+    """
+    connection_config = dict(get_db().config)
+    connection_config["raise_on_warnings"] = False
+
+    try:
+        connection = mysql.connector.connect(**connection_config)
+    except mysql.connector.Error as e:
+        raise MigrationError(f"Geçiş bağlantısı kurulamadı: {e}") from e
+
+    try:
+        cursor = connection.cursor()
+        for name, statement in MIGRATIONS:
+            try:
+                cursor.execute(statement)
+            except mysql.connector.Error as e:
+                raise MigrationError(f"Geçiş başarısız oldu ({name}): {e}") \
+                    from e
+            logger.debug(f"Geçiş uygulandı: {name}")
+        cursor.close()
+    finally:
+        connection.close()
+
+    logger.info(f"Veri tabanı geçişleri uygulandı: {len(MIGRATIONS)} komut")
+    return len(MIGRATIONS)
@@ -0,0 +1,198 @@
+"""
+BTK Hackathon 2025 - İmleç Tabanlı Sayfalama Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül geçmiş listelerini OFFSET yerine (zaman, id) anahtarına göre
+sayfalar. Her sayfa bir önceki sayfanın son satırından devam ettiği için
+derin sayfalarda satır atlanıp okunmaz. Toplam sayılar isteğe bağlıdır
+ve kısa süreli önbellekte tutulur.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import base64
+import json
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+from database.memory_cache import TTLCache
+
+
+# Geçersiz imleç için özel durum sınıfı
+class InvalidCursorError(ValueError):
+    """Geçersiz imleç için özel durum sınıfı"""
+
+    pass
+
+
+# Sayfanın son satırından imleç üretme fonksiyonu
+def encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """
+    Sayfanın son satırından imleç üretme fonksiyonu
+
+    Parametreler:
+        timestamp (datetime): Son satırın zaman değeri
+        row_id (int): Son satırın kimliği
+
+    Döndürülenler:
+        str: URL güvenli, istemci için anlamsız imleç
+    """
+    payload = json.dumps(
+        [timestamp.isoformat(), int(row_id)], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+# İmleci çözme fonksiyonu
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    İmleci çözme fonksiyonu
+
+    Parametreler:
+        cursor (str): encode_cursor ile üretilmiş imleç
+
+    Döndürülenler:
+        Tuple[datetime, int]: (zaman, id)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except Exception:
+        raise InvalidCursorError("Geçersiz sayfa imleci")
+
+
+# Sayfalama parametrelerini okuma fonksiyonu
+def parse_page_args(
+    args: Mapping[str, str],
+) -> Tuple[int, Optional[str], bool]:
+    """
+    Sayfalama parametrelerini okuma fonksiyonu
+
+    Eski istemcilerin gönderdiği page parametresi yalnızca ilk sayfa için
+    kabul edilir; diğer sayfalar imleçle istenmelidir.
+
+    Parametreler:
+        args (Mapping[str, str]): İstek sorgu parametreleri
+
+    Döndürülenler:
+        Tuple[int, str | None, bool]: (limit, cursor, include_total)
+    """
+    page = args.get("page")
+    if page is not None and page.strip() != "1":
+        raise InvalidCursorError(
+            "page parametresi desteklenmiyor; sonraki sayfalar için "
+            "yanıttaki next_cursor değerini cursor olarak gönderin"
+        )
+
+    limit = max(1, min(int(args.get("limit", 10)), 50))
+    cursor = args.get("cursor") or None
+    include_total = args.get("include_total", "true").lower() \
+        in ["true", "1", "yes"]
+    return limit, cursor, include_total
+
+
+# Kullanıcının kayıtlarından bir sayfa getirme fonksiyonu
+def fetch_keyset_page(
+    table: str,
+    columns: str,
+    user_id: int,
+    time_column: str,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Kullanıcının kayıtlarından bir sayfa getirme fonksiyonu
+
+    Kayıtlar (time_column, id) anahtarına göre yeniden eskiye sıralanır.
+    Sorgu (user_id, time_column, id) bileşik dizinini kullanır.
+
+    Parametreler:
+        table (str): Tablo adı
+        columns (str): Seçilecek sütunlar; time_column ve id içermelidir
+        user_id (int): Kullanıcı ID'si
+        time_column (str): Sıralama zaman sütunu
+        limit (int): Sayfa boyutu
+        cursor (str, optional): Önceki sayfanın next_cursor değeri
+
+    Döndürülenler:
+        Tuple[List[Dict], str | None]: (satırlar, sonraki sayfa imleci)
+    """
+    conditions = "user_id = %s"
+    params: List[Any] = [user_id]
+    if cursor:
+        timestamp, row_id = decode_cursor(cursor)
+        conditions += (
+            f" AND ({time_column} < %s"
+            f" OR ({time_column} = %s AND id < %s))"
+        )
+        params.extend((timestamp, timestamp, row_id))
+    params.append(limit + 1)
+
+    rows = get_db().execute_query(
+        f"""SELECT {columns}
+             FROM {table}
+             WHERE {conditions}
+             ORDER BY {time_column} DESC, id DESC
+             LIMIT %s""",
+        tuple(params),
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last[time_column], last["id"])
+    return rows, next_cursor
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Kullanıcı başına toplam sayı önbelleği
+count_cache = TTLCache(
+    max_size=int(config.get("HISTORY_COUNT_CACHE_SIZE", 4096)),
+    ttl=int(config.get("HISTORY_COUNT_CACHE_TTL", 60)),
+)
+
+
+# Toplam sayı gibi özet değerleri önbellekten alma fonksiyonu
+def cached_totals(
+    table: str, user_id: int, loader: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Toplam sayı gibi özet değerleri önbellekten alma fonksiyonu
+
+    Parametreler:
+        table (str): Tablo adı
+        user_id (int): Kullanıcı ID'si
+        loader (Callable): Önbellekte yoksa değerleri hesaplayan fonksiyon
+
+    Döndürülenler:
+        Dict[str, Any]: Özet değerlerin kopyası
+    """
+    key = (table, user_id)
+    totals = count_cache.get(key)
+    if totals is None:
+        totals = loader()
+        count_cache.set(key, totals)
+    return dict(totals)
+
+
+# Kullanıcının önbellekteki toplamlarını silme fonksiyonu
+def invalidate_totals(table: str, user_id: int) -> None:
+    """
+    Kullanıcının önbellekteki toplamlarını silme fonksiyonu
+
+    Tabloya kullanıcı için yeni kayıt eklendiğinde çağrılmalıdır.
+
+    Parametreler:
+        table (str): Tablo adı
+        user_id (int): Kullanıcı ID'si
+    """
+    count_cache.delete((table, user_id))
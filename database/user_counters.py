@@ -0,0 +1,393 @@
+"""
+BTK Hackathon 2025 - Kullanıcı Sayaçları Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül kullanıcı başına eğitim ve ödev sayılarını, puan toplamını ve
+son etkinlik zamanlarını user_counters tablosunda artımlı olarak tutar.
+Gösterge paneli bu değerleri her seferinde temel tablolardan hesaplamak
+yerine tek bir birincil anahtar aramasıyla okur.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import logging
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+from database.memory_cache import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+# Gösterge panelinde gösterilen son etkinlik sayısı
+RECENT_ACTIVITY_LIMIT = 5
+
+# Sayaçları temel tablolardan yeniden hesaplayan sorgu
+REFRESH_QUERY = """
+    INSERT INTO user_counters
+     (user_id, education_count, assignment_count, score_sum, score_n,
+      last_education_at, last_assignment_at)
+    SELECT u.id,
+     (SELECT COUNT(*) FROM education_contents WHERE user_id = u.id),
+     (SELECT COUNT(*) FROM assignment_evaluations WHERE user_id = u.id),
+     (SELECT COALESCE(SUM(score), 0) FROM assignment_evaluations
+       WHERE user_id = u.id),
+     (SELECT COUNT(score) FROM assignment_evaluations WHERE user_id = u.id),
+     (SELECT MAX(generated_at) FROM education_contents
+       WHERE user_id = u.id),
+     (SELECT MAX(evaluated_at) FROM assignment_evaluations
+       WHERE user_id = u.id)
+    FROM users u
+    WHERE {condition}
+    ON DUPLICATE KEY UPDATE
+     education_count = VALUES(education_count),
+     assignment_count = VALUES(assignment_count),
+     score_sum = VALUES(score_sum),
+     score_n = VALUES(score_n),
+     last_education_at = VALUES(last_education_at),
+     last_assignment_at = VALUES(last_assignment_at)
+"""
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Kullanıcı başına son etkinlik önbelleği
+recent_activity_cache = TTLCache(
+    max_size=int(config.get("RECENT_ACTIVITY_CACHE_SIZE", 4096)),
+    ttl=int(config.get("RECENT_ACTIVITY_CACHE_TTL", 300)),
+)
+
+
+# Kullanıcının sayaçlarını temel tablolardan yeniden hesaplama fonksiyonu
+def refresh_user_counters(user_id: Optional[int] = None) -> int:
+    """
+    Kullanıcının sayaçlarını temel tablolardan yeniden hesaplama fonksiyonu
+
+    Sayaç satırı yoksa oluşturulur, varsa üzerine yazılır.
+
+    Parametreler:
+        user_id (int, optional): Kullanıcı ID'si, None ise tüm kullanıcılar
+
+    Döndürülenler:
+        int: Etkilenen satır sayısı
+    """
+    db = get_db()
+    if user_id is None:
+        return db.execute_update(REFRESH_QUERY.format(condition="TRUE"))
+    return db.execute_update(
+        REFRESH_QUERY.format(condition="u.id = %s"), (user_id,)
+    )
+
+
+# Kullanıcıların sayaçlarını gruplar halinde yeniden hesaplama fonksiyonu
+def reconcile_user_counters(batch_size: int = 500) -> int:
+    """
+    Kullanıcıların sayaçlarını gruplar halinde yeniden hesaplama fonksiyonu
+
+    Tüm kullanıcıların sayaçları id sırasıyla batch_size kullanıcılık
+    gruplar halinde temel tablolardan yeniden hesaplanır. Eksik satırlar
+    oluşturulur, kaymış değerler (ör. silinen kayıtlar) düzeltilir.
+    Bakım zamanlayıcısı tarafından dönemsel olarak çalıştırılır.
+
+    Parametreler:
+        batch_size (int): Bir turda hesaplanacak en fazla kullanıcı sayısı
+
+    Döndürülenler:
+        int: Sayaçları yeniden hesaplanan kullanıcı sayısı
+    """
+    db = get_db()
+    query = REFRESH_QUERY.format(condition="u.id > %s AND u.id <= %s")
+
+    total = 0
+    last_id = 0
+    while True:
+        batch = db.execute_single(
+            """SELECT COUNT(*) AS users, MAX(id) AS last_id
+                FROM (SELECT id FROM users
+                       WHERE id > %s
+                       ORDER BY id
+                       LIMIT %s) AS batch""",
+            (last_id, batch_size),
+        )
+        if not batch or not batch["users"]:
+            return total
+
+        db.execute_update(query, (last_id, batch["last_id"]))
+        total += batch["users"]
+        last_id = batch["last_id"]
+        if batch["users"] < batch_size:
+            return total
+
+
+# Sayaç satırını güncelleme, yoksa yeniden hesaplama fonksiyonu
+def _increment(
+    cursor, user_id: int, assignments: str, params: tuple
+) -> None:
+    """
+    Sayaç satırını güncelleme, yoksa yeniden hesaplama fonksiyonu
+
+    Çağıranın işleminde çalışır; hata olursa kayıtla birlikte sayaç
+    güncellemesi de geri alınır.
+
+    Parametreler:
+        cursor: Kaydın eklendiği işlemin imleci
+        user_id (int): Kullanıcı ID'si
+        assignments (str): SET cümlesi
+        params (tuple): SET cümlesinin parametreleri
+    """
+    cursor.execute(
+        f"UPDATE user_counters SET {assignments} WHERE user_id = %s",
+        params + (user_id,),
+    )
+    if not cursor.rowcount:
+        # Henüz sayaç satırı yok; yeni kayıt dahil temelden hesapla
+        cursor.execute(
+            REFRESH_QUERY.format(condition="u.id = %s"), (user_id,)
+        )
+
+
+# Son etkinlik önbelleğinin başına kayıt ekleme fonksiyonu
+def _push_recent(user_id: int, item: Dict[str, Any]) -> None:
+    """
+    Son etkinlik önbelleğinin başına kayıt ekleme fonksiyonu
+
+    Kullanıcının listesi önbellekte yoksa bir sonraki okumada veri
+    tabanından yüklenir.
+
+    Parametreler:
+        user_id (int): Kullanıcı ID'si
+        item (Dict[str, Any]): type, title ve date alanları
+    """
+    recent = recent_activity_cache.get(user_id)
+    if recent is not None:
+        recent_activity_cache.set(
+            user_id, [item] + recent[:RECENT_ACTIVITY_LIMIT - 1]
+        )
+
+
+# Yeni eğitim kaydını sayaçlara işleme fonksiyonu
+def count_education(cursor, user_id: int, generated_at: datetime) -> None:
+    """
+    Yeni eğitim kaydını sayaçlara işleme fonksiyonu
+
+    Eğitim kaydını ekleyen işlemin içinde çağrılmalıdır.
+
+    Parametreler:
+        cursor: Kaydın eklendiği işlemin imleci
+        user_id (int): Kullanıcı ID'si
+        generated_at (datetime): Oluşturulma zamanı
+    """
+    _increment(
+        cursor,
+        user_id,
+        """education_count = education_count + 1,
+           last_education_at = GREATEST(
+               COALESCE(last_education_at, %s), %s)""",
+        (generated_at, generated_at),
+    )
+
+
+# Yeni eğitim kaydını son etkinliklere ekleme fonksiyonu
+def record_education(
+    user_id: int, subject: str, generated_at: Optional[datetime] = None
+) -> None:
+    """
+    Yeni eğitim kaydını son etkinliklere ekleme fonksiyonu
+
+    Kayıt işlemi onaylandıktan sonra çağrılmalıdır.
+
+    Parametreler:
+        user_id (int): Kullanıcı ID'si
+        subject (str): Ders adı
+        generated_at (datetime, optional): Oluşturulma zamanı
+    """
+    _push_recent(user_id, {"type": "education", "title": subject,
+                           "date": generated_at or datetime.now()})
+
+
+# Yeni ödev değerlendirmesini sayaçlara işleme fonksiyonu
+def count_assignment(
+    cursor,
+    user_id: int,
+    score: Optional[float],
+    evaluated_at: datetime,
+) -> None:
+    """
+    Yeni ödev değerlendirmesini sayaçlara işleme fonksiyonu
+
+    Değerlendirme kaydını ekleyen işlemin içinde çağrılmalıdır.
+
+    Parametreler:
+        cursor: Kaydın eklendiği işlemin imleci
+        user_id (int): Kullanıcı ID'si
+        score (float | None): Değerlendirme puanı
+        evaluated_at (datetime): Değerlendirme zamanı
+    """
+    _increment(
+        cursor,
+        user_id,
+        """assignment_count = assignment_count + 1,
+           score_sum = score_sum + COALESCE(%s, 0),
+           score_n = score_n + (%s IS NOT NULL),
+           last_assignment_at = GREATEST(
+               COALESCE(last_assignment_at, %s), %s)""",
+        (score, score, evaluated_at, evaluated_at),
+    )
+
+
+# Yeni ödev değerlendirmesini son etkinliklere ekleme fonksiyonu
+def record_assignment(
+    user_id: int,
+    assignment_text: str,
+    evaluated_at: Optional[datetime] = None,
+) -> None:
+    """
+    Yeni ödev değerlendirmesini son etkinliklere ekleme fonksiyonu
+
+    Kayıt işlemi onaylandıktan sonra çağrılmalıdır.
+
+    Parametreler:
+        user_id (int): Kullanıcı ID'si
+        assignment_text (str): Ödev metni
+        evaluated_at (datetime, optional): Değerlendirme zamanı
+    """
+    _push_recent(user_id, {"type": "assignment",
+                           "title": f"Ödev: {assignment_text[:50]}...",
+                           "date": evaluated_at or datetime.now()})
+
+
+# Toplu ödev değerlendirmesini sayaçlara işleme fonksiyonu
+def count_assignments(
+    cursor,
+    user_id: int,
+    scores: List[Optional[float]],
+    evaluated_at: datetime,
+) -> None:
+    """
+    Toplu ödev değerlendirmesini sayaçlara işleme fonksiyonu
+
+    Tüm ödevler tek bir UPDATE ile sayaçlara eklenir. Değerlendirme
+    kayıtlarını ekleyen işlemin içinde çağrılmalıdır.
+
+    Parametreler:
+        cursor: Kayıtların eklendiği işlemin imleci
+        user_id (int): Kullanıcı ID'si
+        scores (List[float | None]): Değerlendirme puanları
+        evaluated_at (datetime): Değerlendirme zamanı
+    """
+    if not scores:
+        return
+
+    known = [score for score in scores if score is not None]
+    _increment(
+        cursor,
+        user_id,
+        """assignment_count = assignment_count + %s,
+           score_sum = score_sum + %s,
+           score_n = score_n + %s,
+           last_assignment_at = GREATEST(
+               COALESCE(last_assignment_at, %s), %s)""",
+        (len(scores), sum(known), len(known), evaluated_at, evaluated_at),
+    )
+
+
+# Toplu ödev değerlendirmesini son etkinliklere ekleme fonksiyonu
+def record_assignments(
+    user_id: int,
+    assignment_texts: List[str],
+    evaluated_at: Optional[datetime] = None,
+) -> None:
+    """
+    Toplu ödev değerlendirmesini son etkinliklere ekleme fonksiyonu
+
+    Kayıt işlemi onaylandıktan sonra çağrılmalıdır.
+
+    Parametreler:
+        user_id (int): Kullanıcı ID'si
+        assignment_texts (List[str]): Ödev metinleri
+        evaluated_at (datetime, optional): Değerlendirme zamanı
+    """
+    for assignment_text in assignment_texts[-RECENT_ACTIVITY_LIMIT:]:
+        record_assignment(user_id, assignment_text, evaluated_at)
+
+
+# Kullanıcının sayaçlarını döndürme fonksiyonu
+def get_user_counters(user_id: int) -> Dict[str, Any]:
+    """
+    Kullanıcının sayaçlarını döndürme fonksiyonu
+
+    Sayaç satırı yoksa temel tablolardan bir kez hesaplanır.
+
+    Parametreler:
+        user_id (int): Kullanıcı ID'si
+
+    Döndürülenler:
+        Dict[str, Any]: education_count, assignment_count, avg_score,
+        last_education_at ve last_assignment_at
+    """
+    db = get_db()
+    query = """
+        SELECT education_count, assignment_count, score_sum, score_n,
+         last_education_at, last_assignment_at
+         FROM user_counters
+         WHERE user_id = %s
+    """
+    row = db.execute_single(query, (user_id,))
+    if row is None:
+        refresh_user_counters(user_id)
+        row = db.execute_single(query, (user_id,))
+
+    if row is None:
+        return {"education_count": 0, "assignment_count": 0,
+                "avg_score": 0, "last_education_at": None,
+                "last_assignment_at": None}
+
+    score_n = row.pop("score_n")
+    score_sum = row.pop("score_sum")
+    row["avg_score"] = float(score_sum) / score_n if score_n else 0
+    return row
+
+
+# Kullanıcının son etkinliklerini döndürme fonksiyonu
+def get_recent_activity(user_id: int) -> List[Dict[str, Any]]:
+    """
+    Kullanıcının son etkinliklerini döndürme fonksiyonu
+
+    Liste önbellekte tutulur ve yeni kayıtlar eklendikçe başına eklenir;
+    veri tabanı yalnızca önbellek boşken sorgulanır.
+
+    Parametreler:
+        user_id (int): Kullanıcı ID'si
+
+    Döndürülenler:
+        List[Dict[str, Any]]: type, title ve date alanlı son etkinlikler
+    """
+    recent = recent_activity_cache.get(user_id)
+    if recent is None:
+        recent = get_db().execute_query(
+            """(SELECT 'education' as type, subject as title,
+                 generated_at as date
+                FROM education_contents
+                WHERE user_id = %s
+                ORDER BY generated_at DESC
+                LIMIT %s)
+               UNION ALL
+               (SELECT 'assignment' as type,
+                 CONCAT('Ödev: ', LEFT(assignment_text, 50), '...') as title,
+                 evaluated_at as date
+                FROM assignment_evaluations
+                WHERE user_id = %s
+                ORDER BY evaluated_at DESC
+                LIMIT %s)
+               ORDER BY date DESC
+               LIMIT %s""",
+            (user_id, RECENT_ACTIVITY_LIMIT, user_id, RECENT_ACTIVITY_LIMIT,
+             RECENT_ACTIVITY_LIMIT),
+        )
+        recent_activity_cache.set(user_id, recent)
+    return [dict(item) for item in recent]
@@ -0,0 +1,438 @@
+"""
+BTK Hackathon 2025 - Toplu Ödev Değerlendirme Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül bir sınıfın ödevlerini aynı kriterlerle toplu olarak
+değerlendirir. Gönderimler JSON dizisi, JSONL dosyası veya ZIP arşivi
+olarak alınır ve sınırlı bir işçi havuzunda eş zamanlı değerlendirilir.
+İstek sınırına takılan ödevler reddedilmek yerine beklenip yeniden
+denenir; böylece toplu iş API anahtarının sınırına göre kendini ayarlar.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import io
+import json
+import logging
+import os
+import threading
+import time
+import zipfile
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Iterator, List, Tuple
+
+from config.config_loader import load_config
+from education.evaluate_assignment import (
+    evaluate_assignment,
+    extract_score,
+    is_error_result,
+)
+from education.llm_client import CircuitOpenError
+from education.rate_limiter import RateLimitExceededError
+
+
+logger = logging.getLogger(__name__)
+
+# ZIP arşivinden okunacak dosya uzantıları
+TEXT_EXTENSIONS = (".txt", ".md", ".py", ".java", ".c", ".cpp", ".js")
+
+# En kısa ödev metni (karakter)
+MIN_TEXT_LENGTH = 10
+
+
+# Gönderimler okunamadığında fırlatılan özel durum sınıfı
+class BatchSubmissionError(ValueError):
+    """Gönderimler okunamadığında fırlatılan özel durum sınıfı"""
+
+    pass
+
+
+# Kullanıcının eş zamanlı toplu iş sınırı aşıldığında fırlatılan özel durum
+# sınıfı
+class BatchLimitError(Exception):
+    """
+    Kullanıcının eş zamanlı toplu iş sınırı aşıldığında fırlatılan özel
+    durum sınıfı
+    """
+
+    pass
+
+
+# Gönderim sözlüğü oluşturma fonksiyonu
+def _submission(item: Any, position: int) -> Dict[str, str]:
+    """
+    Gönderim sözlüğü oluşturma fonksiyonu
+
+    Metin doğrudan veya assignment_text alanı olan bir sözlük olarak
+    verilebilir; ad verilmezse sıra numarası kullanılır.
+
+    Parametreler:
+        item (Any): Metin veya sözlük
+        position (int): Gönderimin 1'den başlayan sırası
+
+    Döndürülenler:
+        Dict[str, str]: name ve assignment_text alanları
+    """
+    if isinstance(item, str):
+        name, text = "", item
+    elif isinstance(item, dict):
+        name = str(item.get("name") or item.get("student") or "")
+        text = item.get("assignment_text")
+        if not isinstance(text, str):
+            raise BatchSubmissionError(
+                f"{position}. gönderimde assignment_text alanı yok"
+            )
+    else:
+        raise BatchSubmissionError(
+            f"{position}. gönderim metin veya nesne olmalıdır"
+        )
+
+    text = text.strip()
+    if len(text) < MIN_TEXT_LENGTH:
+        raise BatchSubmissionError(
+            f"{position}. gönderim en az {MIN_TEXT_LENGTH} karakter "
+            "olmalıdır"
+        )
+    return {"name": name.strip() or f"Ödev {position}",
+            "assignment_text": text}
+
+
+# JSON dizisindeki gönderimleri okuma fonksiyonu
+def parse_json_submissions(items: Any, max_items: int) -> List[Dict[str, str]]:
+    """
+    JSON dizisindeki gönderimleri okuma fonksiyonu
+
+    Parametreler:
+        items (Any): Metin veya nesnelerden oluşan liste
+        max_items (int): En fazla gönderim sayısı
+
+    Döndürülenler:
+        List[Dict[str, str]]: Gönderimler
+    """
+    if not isinstance(items, list) or not items:
+        raise BatchSubmissionError("submissions boş olmayan bir liste olmalı")
+    if len(items) > max_items:
+        raise BatchSubmissionError(
+            f"Bir defada en fazla {max_items} ödev değerlendirilebilir"
+        )
+    return [_submission(item, position)
+            for position, item in enumerate(items, 1)]
+
+
+# JSONL dosyasındaki gönderimleri okuma fonksiyonu
+def parse_jsonl_submissions(
+    data: bytes, max_items: int
+) -> List[Dict[str, str]]:
+    """
+    JSONL dosyasındaki gönderimleri okuma fonksiyonu
+
+    Her satır bir metin veya assignment_text alanlı bir nesnedir; boş
+    satırlar atlanır.
+
+    Parametreler:
+        data (bytes): Dosya içeriği
+        max_items (int): En fazla gönderim sayısı
+
+    Döndürülenler:
+        List[Dict[str, str]]: Gönderimler
+    """
+    try:
+        lines = data.decode("utf-8-sig").splitlines()
+    except UnicodeDecodeError:
+        raise BatchSubmissionError("JSONL dosyası UTF-8 olmalıdır")
+
+    items = []
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            items.append(json.loads(line))
+        except json.JSONDecodeError:
+            raise BatchSubmissionError(
+                f"JSONL dosyasının {number}. satırı geçersiz"
+            )
+    return parse_json_submissions(items, max_items)
+
+
+# ZIP arşivindeki gönderimleri okuma fonksiyonu
+def parse_zip_submissions(
+    data: bytes, max_items: int, max_file_size: int
+) -> List[Dict[str, str]]:
+    """
+    ZIP arşivindeki gönderimleri okuma fonksiyonu
+
+    Her metin dosyası bir gönderimdir ve dosya adı gönderim adı olarak
+    kullanılır. Gizli dosyalar ve klasörler atlanır; açılmış boyutu
+    sınırı aşan dosyalar okunmadan reddedilir.
+
+    Parametreler:
+        data (bytes): Arşiv içeriği
+        max_items (int): En fazla gönderim sayısı
+        max_file_size (int): Bir dosyanın açılmış en büyük boyutu (bayt)
+
+    Döndürülenler:
+        List[Dict[str, str]]: Ad sırasına göre gönderimler
+    """
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(data))
+    except zipfile.BadZipFile:
+        raise BatchSubmissionError("ZIP arşivi okunamadı")
+
+    with archive:
+        entries = sorted(
+            (info for info in archive.infolist()
+             if not info.is_dir()
+             and not any(part.startswith((".", "__MACOSX"))
+                         for part in info.filename.split("/"))
+             and info.filename.lower().endswith(TEXT_EXTENSIONS)),
+            key=lambda info: info.filename,
+        )
+        if len(entries) > max_items:
+            raise BatchSubmissionError(
+                f"Bir defada en fazla {max_items} ödev değerlendirilebilir"
+            )
+
+        items = []
+        for info in entries:
+            if info.file_size > max_file_size:
+                raise BatchSubmissionError(
+                    f"{info.filename} dosyası çok büyük"
+                )
+            content = archive.read(info)[:max_file_size]
+            try:
+                text = content.decode("utf-8-sig")
+            except UnicodeDecodeError:
+                raise BatchSubmissionError(
+                    f"{info.filename} dosyası UTF-8 olmalıdır"
+                )
+            name = os.path.splitext(os.path.basename(info.filename))[0]
+            items.append({"name": name, "assignment_text": text})
+
+    if not items:
+        raise BatchSubmissionError("ZIP arşivinde metin dosyası bulunamadı")
+    return parse_json_submissions(items, max_items)
+
+
+# Toplu ödev değerlendirme sınıfı
+class BatchEvaluator:
+    """Toplu ödev değerlendirme sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_items: int = 50,
+        max_file_size: int = 200000,
+        rate_limit_retries: int = 5,
+    ):
+        self.max_workers = max(1, int(max_workers))
+        self.max_items = max(1, int(max_items))
+        self.max_file_size = max(1, int(max_file_size))
+        self.rate_limit_retries = max(0, int(rate_limit_retries))
+        self._executor = None
+        self._lock = threading.Lock()
+        self._active_users = set()
+
+        # İzleme sayaçları
+        self.batches = 0
+        self.evaluated = 0
+        self.failed = 0
+        self.rate_limit_waits = 0
+
+    # İstek gövdesindeki gönderimleri okuma fonksiyonu
+    def parse_items(self, items: Any) -> List[Dict[str, str]]:
+        """
+        İstek gövdesindeki gönderimleri okuma fonksiyonu
+
+        Parametreler:
+            items (Any): Metin veya nesnelerden oluşan liste
+
+        Döndürülenler:
+            List[Dict[str, str]]: Gönderimler
+        """
+        return parse_json_submissions(items, self.max_items)
+
+    # Yüklenen dosyadaki gönderimleri okuma fonksiyonu
+    def parse_upload(self, filename: str, data: bytes) -> List[Dict[str, str]]:
+        """
+        Yüklenen dosyadaki gönderimleri okuma fonksiyonu
+
+        Parametreler:
+            filename (str): Dosya adı
+            data (bytes): Dosya içeriği
+
+        Döndürülenler:
+            List[Dict[str, str]]: Gönderimler
+        """
+        if filename.lower().endswith(".zip") or zipfile.is_zipfile(
+            io.BytesIO(data)
+        ):
+            return parse_zip_submissions(data, self.max_items,
+                                         self.max_file_size)
+        if filename.lower().endswith(".json"):
+            try:
+                items = json.loads(data.decode("utf-8-sig"))
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                raise BatchSubmissionError("JSON dosyası okunamadı")
+            return self.parse_items(items)
+        return parse_jsonl_submissions(data, self.max_items)
+
+    # Tek bir ödevi değerlendirme fonksiyonu
+    def _evaluate(self, assignment_text: str, criteria: str, model) -> str:
+        """
+        Tek bir ödevi değerlendirme fonksiyonu
+
+        İstek sınırına takılırsa belirtilen süre beklenip yeniden
+        denenir. Değerlendirme hata metni döndürürse özel durum fırlatılır.
+
+        Parametreler:
+            assignment_text (str): Ödev metni
+            criteria (str): Değerlendirme kriterleri
+            model: Gemini modeli
+
+        Döndürülenler:
+            str: Değerlendirme raporu
+        """
+        for attempt in range(self.rate_limit_retries + 1):
+            try:
+                result = evaluate_assignment(assignment_text, criteria,
+                                             model=model)
+                break
+            except RateLimitExceededError as e:
+                if attempt == self.rate_limit_retries:
+                    raise
+                with self._lock:
+                    self.rate_limit_waits += 1
+                time.sleep(e.retry_after)
+
+        if is_error_result(result):
+            raise RuntimeError(result)
+        return result
+
+    # Kullanıcının devam eden toplu işi olup olmadığını döndürme fonksiyonu
+    def is_active(self, user_id: int) -> bool:
+        """
+        Kullanıcının devam eden toplu işi olup olmadığını döndürme
+        fonksiyonu
+
+        Parametreler:
+            user_id (int): Kullanıcı ID'si
+
+        Döndürülenler:
+            bool: Devam eden toplu iş varsa True
+        """
+        with self._lock:
+            return user_id in self._active_users
+
+    # Ödevleri eş zamanlı değerlendirme fonksiyonu
+    def run(
+        self,
+        user_id: int,
+        submissions: List[Dict[str, str]],
+        criteria: str,
+        model,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Ödevleri eş zamanlı değerlendirme fonksiyonu
+
+        Sonuçlar bittikçe (gönderim sırası, sonuç) olarak döndürülür.
+        Kullanıcı başına aynı anda tek toplu iş çalışır. Üreteç erken
+        kapatılırsa henüz başlamamış değerlendirmeler iptal edilir.
+
+        Parametreler:
+            user_id (int): Kullanıcı ID'si
+            submissions (List[Dict[str, str]]): Gönderimler
+            criteria (str): Değerlendirme kriterleri
+            model: Gemini modeli
+
+        Döndürülenler:
+            Iterator: evaluation ve score ya da error alanlı sonuçlar
+        """
+        with self._lock:
+            if user_id in self._active_users:
+                raise BatchLimitError(
+                    "Devam eden bir toplu değerlendirmeniz var"
+                )
+            self._active_users.add(user_id)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="batch-evaluation",
+                )
+            self.batches += 1
+            executor = self._executor
+
+        futures = {}
+        try:
+            futures = {
+                executor.submit(self._evaluate, item["assignment_text"],
+                                criteria, model): index
+                for index, item in enumerate(submissions)
+            }
+            for future in as_completed(futures):
+                try:
+                    evaluation = future.result()
+                    result = {"evaluation": evaluation,
+                              "score": extract_score(evaluation)}
+                    with self._lock:
+                        self.evaluated += 1
+                except (RateLimitExceededError, CircuitOpenError) as e:
+                    result = {"error": str(e), "retry_after": e.retry_after}
+                except Exception as e:
+                    logger.error(f"Toplu ödev değerlendirme hatası: {e}")
+                    result = {"error": str(e)}
+                if "error" in result:
+                    with self._lock:
+                        self.failed += 1
+                yield futures[future], result
+        finally:
+            for future in futures:
+                future.cancel()
+            with self._lock:
+                self._active_users.discard(user_id)
+
+    # Toplu değerlendirme istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, int]:
+        """
+        Toplu değerlendirme istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, int]: Toplu iş, ödev, hata ve bekleme sayıları
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "active": len(self._active_users),
+                "batches": self.batches,
+                "evaluated": self.evaluated,
+                "failed": self.failed,
+                "rate_limit_waits": self.rate_limit_waits,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnek
+batch_evaluator = BatchEvaluator(
+    max_workers=int(config.get("BATCH_EVALUATION_WORKERS", 4)),
+    max_items=int(config.get("BATCH_EVALUATION_MAX_ITEMS", 50)),
+    max_file_size=int(config.get("BATCH_EVALUATION_MAX_FILE_SIZE", 200000)),
+    rate_limit_retries=int(
+        config.get("BATCH_EVALUATION_RATE_LIMIT_RETRIES", 5)
+    ),
+)
+
+
+# Toplu ödev değerlendirme örneğini döndürme fonksiyonu
+def get_batch_evaluator() -> BatchEvaluator:
+    """
+    Toplu ödev değerlendirme örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        BatchEvaluator: Toplu ödev değerlendirme nesnesi
+    """
+    return batch_evaluator
@@ -0,0 +1,358 @@
+"""
+BTK Hackathon 2025 - Eğitim İçeriği Arama Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül kullanıcıların geçmiş eğitim içeriklerinde tam metin araması
+yapar. İçerikler Türkçe kurallarına göre küçük harfe çevrilip kök
+bulunarak education_contents.search_text sütununa yazılır; arama bu
+sütundaki FULLTEXT dizini üzerinden yapılır ve sonuçlar puana göre
+sıralanıp eşleşen kelimeleri işaretlenmiş bir özetle döndürülür.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import html
+import logging
+import re
+import threading
+import time
+import unicodedata
+
+from typing import Any, Dict, List, Optional
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+
+
+logger = logging.getLogger(__name__)
+
+# Kelime ayırma deseni
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+# FULLTEXT dizininin dikkate aldığı en kısa kelime uzunluğu
+MIN_TERM_LENGTH = 3
+
+# Bir aramada kullanılacak en fazla kelime sayısı
+MAX_QUERY_TERMS = 10
+
+# Özet uzunluğu (karakter)
+SNIPPET_LENGTH = 200
+
+# Türkçe ekler; uzundan kısaya denenir
+SUFFIXES = sorted(
+    (
+        "lerinden", "larından", "lerinde", "larında", "lerine", "larına",
+        "lerini", "larını", "lerin", "ların", "leri", "ları", "ler", "lar",
+        "ından", "inden", "undan", "ünden", "ndan", "nden", "dan", "den",
+        "tan", "ten", "nda", "nde", "da", "de", "ta", "te",
+        "nın", "nin", "nun", "nün", "ın", "in", "un", "ün",
+        "yla", "yle", "la", "le", "ya", "ye", "yı", "yi", "yu", "yü",
+        "lık", "lik", "luk", "lük", "sı", "si", "su", "sü",
+        "ı", "i", "u", "ü", "a", "e",
+    ),
+    key=len,
+    reverse=True,
+)
+
+# Ek atıldıktan sonra yumuşayan ünsüzlerin sert hali
+SOFTENED_CONSONANTS = {"ğ": "k", "b": "p"}
+
+# Türkçe karakterlerin ASCII karşılıkları
+FOLD_TABLE = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+
+
+# Metni Türkçe kurallarına göre küçük harfe çevirme fonksiyonu
+def turkish_lower(text: str) -> str:
+    """
+    Metni Türkçe kurallarına göre küçük harfe çevirme fonksiyonu
+
+    "I" harfi "ı", "İ" harfi "i" olur; str.lower() bunları yanlış çevirir.
+
+    Parametreler:
+        text (str): Metin
+
+    Döndürülenler:
+        str: Küçük harfli metin
+    """
+    return text.replace("I", "ı").replace("İ", "i").lower()
+
+
+# Küçük harfli kelimenin kökünü bulma fonksiyonu
+def stem(word: str) -> str:
+    """
+    Küçük harfli kelimenin kökünü bulma fonksiyonu
+
+    En fazla iki ek atılır, kök en az MIN_TERM_LENGTH harf kalır. Sözlük
+    kullanmayan kaba bir kök bulucudur; dizin ve sorgu aynı fonksiyondan
+    geçtiği için tutarlı sonuç verir.
+
+    Parametreler:
+        word (str): turkish_lower ile küçültülmüş kelime
+
+    Döndürülenler:
+        str: Türkçe karakterleri ASCII'ye çevrilmiş kök
+    """
+    for _ in range(2):
+        for suffix in SUFFIXES:
+            if word.endswith(suffix) and \
+                    len(word) - len(suffix) >= MIN_TERM_LENGTH:
+                word = word[:-len(suffix)]
+                if word[-1] in SOFTENED_CONSONANTS:
+                    word = word[:-1] + SOFTENED_CONSONANTS[word[-1]]
+                break
+        else:
+            break
+
+    word = unicodedata.normalize("NFKD", word.translate(FOLD_TABLE))
+    return "".join(ch for ch in word if not unicodedata.combining(ch))
+
+
+# Metni köklere ayırma fonksiyonu
+def tokenize(text: str) -> List[str]:
+    """
+    Metni köklere ayırma fonksiyonu
+
+    Parametreler:
+        text (str): Metin
+
+    Döndürülenler:
+        List[str]: Metindeki kelimelerin kökleri
+    """
+    return [stem(word) for word in WORD_PATTERN.findall(turkish_lower(text))
+            if len(word) > 1]
+
+
+# Eğitim kaydı için arama metni üretme fonksiyonu
+def build_search_text(subject: str, content: str) -> str:
+    """
+    Eğitim kaydı için arama metni üretme fonksiyonu
+
+    Ders adı, sıralamada ağırlığı artsın diye iki kez eklenir.
+
+    Parametreler:
+        subject (str): Ders adı
+        content (str): Eğitim içeriği
+
+    Döndürülenler:
+        str: search_text sütununa yazılacak kökler
+    """
+    subject_terms = " ".join(tokenize(subject))
+    return f"{subject_terms} {subject_terms} {' '.join(tokenize(content))}"
+
+
+# Arama ifadesinden sorgu köklerini çıkarma fonksiyonu
+def query_terms(query: str) -> List[str]:
+    """
+    Arama ifadesinden sorgu köklerini çıkarma fonksiyonu
+
+    Parametreler:
+        query (str): Kullanıcının yazdığı arama ifadesi
+
+    Döndürülenler:
+        List[str]: Sırası korunmuş, tekrarsız kökler
+    """
+    terms = []
+    for term in tokenize(query):
+        if len(term) >= MIN_TERM_LENGTH and term not in terms:
+            terms.append(term)
+    return terms[:MAX_QUERY_TERMS]
+
+
+# Eşleşen kelimeleri işaretlenmiş özet üretme fonksiyonu
+def build_snippet(content: str, terms: List[str]) -> str:
+    """
+    Eşleşen kelimeleri işaretlenmiş özet üretme fonksiyonu
+
+    Özet ilk eşleşmenin çevresinden alınır, HTML olarak kaçışlanır ve
+    eşleşen kelimeler <mark> etiketine alınır.
+
+    Parametreler:
+        content (str): Eğitim içeriği
+        terms (List[str]): Sorgu kökleri
+
+    Döndürülenler:
+        str: HTML özet
+    """
+    matches = [
+        match for match in WORD_PATTERN.finditer(content)
+        if any(stem(turkish_lower(match.group())).startswith(term)
+               for term in terms)
+    ]
+
+    start = 0
+    if matches:
+        start = max(0, matches[0].start() - SNIPPET_LENGTH // 3)
+        # Kelimenin ortasından başlamamak için boşluğa kadar ilerle
+        space = content.find(" ", start, matches[0].start())
+        if start > 0 and space != -1:
+            start = space + 1
+    end = min(len(content), start + SNIPPET_LENGTH)
+
+    parts = ["…"] if start > 0 else []
+    position = start
+    for match in matches:
+        if match.start() < start or match.end() > end:
+            continue
+        parts.append(html.escape(content[position:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group())}</mark>")
+        position = match.end()
+    parts.append(html.escape(content[position:end]))
+    if end < len(content):
+        parts.append("…")
+    return "".join(parts)
+
+
+# Eğitim içeriği arama sınıfı
+class ContentSearch:
+    """Eğitim içeriği arama sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, max_results: int = 20):
+        self.max_results = max(1, int(max_results))
+        self._lock = threading.Lock()
+
+        # İzleme sayaçları
+        self.queries = 0
+        self.total_ms = 0.0
+        self.last_ms = 0.0
+        self.indexed = 0
+
+    # Kullanıcının eğitimlerinde arama yapma fonksiyonu
+    def search(
+        self, user_id: int, query: str, limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Kullanıcının eğitimlerinde arama yapma fonksiyonu
+
+        Tüm kökler zorunludur ve önek olarak eşleşir; sonuçlar FULLTEXT
+        puanına, eşitlikte yeniden eskiye sıralanır.
+
+        Parametreler:
+            user_id (int): Kullanıcı ID'si
+            query (str): Arama ifadesi
+            limit (int, optional): En fazla sonuç sayısı
+
+        Döndürülenler:
+            Dict[str, Any]: terms, results ve took_ms alanları
+        """
+        terms = query_terms(query)
+        if not terms:
+            raise ValueError(
+                f"Arama ifadesi en az {MIN_TERM_LENGTH} harfli bir kelime "
+                "içermelidir"
+            )
+        limit = max(1, min(int(limit or self.max_results), self.max_results))
+        against = " ".join(f"+{term}*" for term in terms)
+
+        started = time.monotonic()
+        rows = get_db().execute_query(
+            """SELECT id, subject, content, generated_at, is_favorite,
+                MATCH(search_text) AGAINST(%s IN BOOLEAN MODE) AS score
+                FROM education_contents
+                WHERE user_id = %s
+                 AND MATCH(search_text) AGAINST(%s IN BOOLEAN MODE)
+                ORDER BY score DESC, generated_at DESC, id DESC
+                LIMIT %s""",
+            (against, user_id, against, limit),
+        )
+
+        results = []
+        for row in rows:
+            content = row.pop("content")
+            row["score"] = round(float(row["score"]), 4)
+            row["snippet"] = build_snippet(content, terms)
+            results.append(row)
+        took_ms = round((time.monotonic() - started) * 1000, 2)
+
+        with self._lock:
+            self.queries += 1
+            self.total_ms += took_ms
+            self.last_ms = took_ms
+        logger.debug(f"İçerik araması: {terms} -> {len(results)} sonuç, "
+                     f"{took_ms} ms")
+
+        return {"terms": terms, "results": results, "took_ms": took_ms}
+
+    # Arama metni olmayan kayıtları dizine ekleme fonksiyonu
+    def backfill(self, batch_size: int = 200) -> int:
+        """
+        Arama metni olmayan kayıtları dizine ekleme fonksiyonu
+
+        search_text sütunu eklenmeden önce oluşturulmuş kayıtlar gruplar
+        halinde işlenir.
+
+        Parametreler:
+            batch_size (int): Bir turda işlenecek kayıt sayısı
+
+        Döndürülenler:
+            int: Dizine eklenen kayıt sayısı
+        """
+        db = get_db()
+        total = 0
+        while True:
+            rows = db.execute_query(
+                """SELECT id, subject, content
+                    FROM education_contents
+                    WHERE search_text IS NULL
+                    LIMIT %s""",
+                (batch_size,),
+            )
+            if not rows:
+                break
+
+            db.execute_many(
+                "UPDATE education_contents SET search_text = %s WHERE id = %s",
+                [(build_search_text(row["subject"], row["content"]), row["id"])
+                 for row in rows],
+            )
+            total += len(rows)
+            if len(rows) < batch_size:
+                break
+
+        with self._lock:
+            self.indexed += total
+        return total
+
+    # Arama istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, float]:
+        """
+        Arama istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, float]: Sorgu sayısı, gecikmeler ve dizine eklenen
+            eski kayıt sayısı
+        """
+        with self._lock:
+            return {
+                "queries": self.queries,
+                "avg_ms": round(self.total_ms / self.queries, 2)
+                if self.queries else 0.0,
+                "last_ms": self.last_ms,
+                "backfilled": self.indexed,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Arama ayarları
+SEARCH_BACKFILL_INTERVAL = float(config.get("SEARCH_BACKFILL_INTERVAL", 300))
+SEARCH_BACKFILL_BATCH_SIZE = int(config.get("SEARCH_BACKFILL_BATCH_SIZE", 200))
+
+# Tekil örnek
+content_search = ContentSearch(
+    max_results=int(config.get("SEARCH_MAX_RESULTS", 20)),
+)
+
+
+# Eğitim içeriği arama örneğini döndürme fonksiyonu
+def get_content_search() -> ContentSearch:
+    """
+    Eğitim içeriği arama örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        ContentSearch: Eğitim içeriği arama nesnesi
+    """
+    return content_search
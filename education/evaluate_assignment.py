@@ -8,28 +8,219 @@ Bu dosya, Gemini API kullanarak ödev değerlendirir.
 """
 
 
-# Ödevi değerlendiren fonksiyon
-def evaluate_assignment(
+# Gerekli kütüphanelerin içe aktarılması
+import re
+import threading
+import unicodedata
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from config.config_loader import load_config
+from education.llm_client import CircuitOpenError, get_resilient_caller
+from education.rate_limiter import RateLimitExceededError
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Parçalı değerlendirme ayarları
+CHUNKED_ENABLED = str(config.get("EVALUATION_CHUNKED", False)).lower() \
+    in ["true", "1", "yes"]
+CHUNK_SIZE = max(500, int(config.get("EVALUATION_CHUNK_SIZE", 6000)))
+CHUNK_WORKERS = max(1, int(config.get("EVALUATION_CHUNK_WORKERS", 4)))
+
+# Ödevdeki soru başlığı deseni, ör. "3. Soru:", "Soru 3", "Question 3"
+QUESTION_PATTERN = re.compile(
+    r"^[ \t#*>-]*(?:\d+\s*[.)-]?\s*(?:soru|question)\b"
+    r"|(?:soru|question|görev|bölüm)\s*\d+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Markdown başlığı deseni, ör. "## Giriş"
+HEADING_PATTERN = re.compile(r"^[ \t]*#{1,6}[ \t]+\S", re.MULTILINE)
+
+# Numaralı bölüm deseni, ör. "2) ..." veya "2. ..."
+NUMBERED_PATTERN = re.compile(r"^[ \t]*\d+[.)][ \t]+\S", re.MULTILINE)
+
+# Parça değerlendirmelerini yapan iş parçacığı havuzu
+_chunk_executor = None
+_chunk_lock = threading.Lock()
+
+# Değerlendirme raporundaki bölüm başlıkları
+EVALUATION_SECTIONS = [
+    "GENEL DEĞERLENDİRME",
+    "GÜÇLÜ YÖNLER",
+    "GELİŞTİRİLEBİLİR ALANLAR",
+    "ÖNERİLER VE REHBERLIK",
+    "DETAYLI GERİ BİLDİRİM",
+    "SONUÇ VE ÖZET",
+]
+
+# "Puan: X/100" satırını yakalayan düzenli ifade
+SCORE_PATTERN = re.compile(
+    r"puan\W*(\d+(?:[.,]\d+)?)\s*/\s*100", re.IGNORECASE
+)
+
+# Eski biçimdeki puan ifadelerini yakalayan düzenli ifade
+LEGACY_SCORE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:puan|point|/)")
+
+# Değerlendirmenin başarısız olduğunu gösteren yanıt önekleri
+ERROR_PREFIXES = ("Hata:", "Uyarı:", "Ödev değerlendirilirken hata oluştu:")
+
+
+# Başlık karşılaştırması için satırı sadeleştiren fonksiyon
+def _normalize_heading(line):
+    """
+    Başlık karşılaştırması için satırı sadeleştiren fonksiyon
+
+    Emoji, Markdown işaretleri, noktalama ve Türkçe karakterlerin
+    işaretleri kaldırılır; böylece "REHBERLIK" ile "REHBERLİK" eşleşir.
+    """
+    text = unicodedata.normalize("NFKD", line.casefold().replace("ı", "i"))
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w\s]", " ", text).split())
+
+
+_NORMALIZED_SECTIONS = [
+    (_normalize_heading(title), title) for title in EVALUATION_SECTIONS
+]
+
+
+# Satırın bir rapor bölümü başlığı olup olmadığını denetleyen fonksiyon
+def match_section_title(line):
+    """
+    Satırın bir rapor bölümü başlığı olup olmadığını denetleyen fonksiyon
+
+    Başlıksa bölümün adını, değilse None döndürür.
+    """
+    normalized = _normalize_heading(line)
+    for normalized_title, title in _NORMALIZED_SECTIONS:
+        if normalized_title in normalized and \
+                len(normalized) <= len(normalized_title) + 10:
+            return title
+    return None
+
+
+# Değerlendirme metninden puanı çıkaran fonksiyon
+def extract_score(evaluation_text):
+    """
+    Değerlendirme metninden puanı çıkaran fonksiyon
+
+    Önce "Puan: X/100" satırını, bulunamazsa eski biçimdeki puan
+    ifadelerini arar. Puan yoksa None döndürür.
+    """
+    match = SCORE_PATTERN.search(evaluation_text)
+    if not match:
+        match = LEGACY_SCORE_PATTERN.search(evaluation_text.lower())
+    if not match:
+        return None
+    return float(match.group(1).replace(",", "."))
+
+
+# Değerlendirme sonucunun hata iletisi olup olmadığını denetleyen fonksiyon
+def is_error_result(evaluation_text):
+    """
+    Değerlendirme sonucunun hata iletisi olup olmadığını denetleyen fonksiyon
+
+    evaluate_assignment hata durumunda rapor yerine ERROR_PREFIXES ile
+    başlayan bir ileti döndürür.
+    """
+    return evaluation_text.lstrip().startswith(ERROR_PREFIXES)
+
+
+# Akış halindeki değerlendirmeyi bölümlerine ayıran sınıf
+class EvaluationStreamParser:
+    """
+    Akış halindeki değerlendirmeyi bölümlerine ayıran sınıf
+
+    Gelen metin parçaları feed ile verilir; tamamlanan her satır
+    işlenir ve puan satırı ya da biten bölümler için olaylar döndürülür.
+    """
+
+    # Yapıcı fonksiyon
+    def __init__(self):
+        self.text = ""
+        self.score = None
+        self._line_buffer = ""
+        self._title = None
+        self._lines = []
+
+    # Yeni metin parçasını işleyen fonksiyon
+    def feed(self, chunk):
+        """
+        Yeni metin parçasını işleyen fonksiyon
+
+        (olay adı, veri) ikililerinden oluşan bir liste döndürür.
+        """
+        self.text += chunk
+        self._line_buffer += chunk
+
+        events = []
+        while "\n" in self._line_buffer:
+            line, self._line_buffer = self._line_buffer.split("\n", 1)
+            events.extend(self._process_line(line))
+        return events
+
+    # Akış bitince kalan metni işleyen fonksiyon
+    def finish(self):
+        """
+        Akış bitince kalan metni işleyen fonksiyon
+
+        Son bölümü kapatır; puan satırı hiç gelmediyse puanı tüm
+        metinden çıkarmayı dener.
+        """
+        events = []
+        if self._line_buffer:
+            events.extend(self._process_line(self._line_buffer))
+            self._line_buffer = ""
+        events.extend(self._close_section())
+
+        if self.score is None:
+            self.score = extract_score(self.text)
+            if self.score is not None:
+                events.append(("score", {"score": self.score}))
+        return events
+
+    # Açık bölümü kapatan fonksiyon
+    def _close_section(self):
+        content = "\n".join(self._lines).strip()
+        title = self._title
+        self._title = None
+        self._lines = []
+        if title is None and not content:
+            return []
+        return [("section", {"title": title or "", "content": content})]
+
+    # Tek bir satırı işleyen fonksiyon
+    def _process_line(self, line):
+        title = match_section_title(line)
+        if title:
+            events = self._close_section()
+            self._title = title
+            return events
+
+        self._lines.append(line)
+        if self.score is None:
+            match = SCORE_PATTERN.search(line)
+            if match:
+                self.score = float(match.group(1).replace(",", "."))
+                return [("score", {"score": self.score})]
+        return []
+
+
+# Ödev değerlendirme istemini hazırlayan fonksiyon
+def build_evaluation_prompt(
     assignment_text,
-    criteria="Genel değerlendirme kriterleri",
-    model=None
+    criteria="Genel değerlendirme kriterleri"
 ):
     """
-    Ödevi değerlendiren fonksiyon
+    Ödev değerlendirme istemini hazırlayan fonksiyon
 
-    Öğrenci ödevini detaylı şekilde değerlendirir ve sonuç üretir.
-    ...
+    Rapor biçimini içeren ve Gemini'ye gönderilecek istemi döndürür.
     """
-    if not assignment_text.strip():
-        return "Hata: Ödev metni boş olamaz! " \
-               "Lütfen değerlendirilecek içeriği giriniz."
-    if len(assignment_text) < 10:
-        return (
-            "Uyarı: Çok kısa ödev metni! "
-            "Detaylı değerlendirme için daha uzun içerik önerilir."
-        )
 
-    prompt = f"""
+    return f"""
 Aşağıdaki öğrenci ödevini eğitici ve yapıcı bir şekilde değerlendir:
 
 === ÖDEV İÇERİĞİ ===
@@ -69,8 +260,373 @@ Genel Görüş: [Kısa özet değerlendirme]
 Değerlendirme Türkçe, eğitici, yapıcı ve motive edici olmalı.
 Öğrencinin moralini bozmadan gelişim alanlarını belirt.
     """
+
+
+# Ödevi soru veya bölüm sınırlarından ayıran fonksiyon
+def split_sections(assignment_text) -> List[str]:
+    """
+    Ödevi soru veya bölüm sınırlarından ayıran fonksiyon
+
+    Sırasıyla soru başlıkları, Markdown başlıkları ve numaralı satırlar
+    denenir; en az iki sınır bulan ilk desen kullanılır. Hiçbiri
+    bulunamazsa metin paragraflara ayrılır. İlk sınırdan önceki metin
+    ilk bölüme eklenir.
+    """
+
+    for pattern in (QUESTION_PATTERN, HEADING_PATTERN, NUMBERED_PATTERN):
+        starts = [match.start() for match in pattern.finditer(assignment_text)]
+        if len(starts) < 2:
+            continue
+        starts[0] = 0
+        ends = starts[1:] + [len(assignment_text)]
+        return [assignment_text[start:end].strip()
+                for start, end in zip(starts, ends)
+                if assignment_text[start:end].strip()]
+
+    return [paragraph.strip()
+            for paragraph in re.split(r"\n\s*\n", assignment_text)
+            if paragraph.strip()]
+
+
+# Parça boyutunu aşan bölümü bölen fonksiyon
+def split_oversized(section, chunk_size) -> List[str]:
+    """
+    Parça boyutunu aşan bölümü bölen fonksiyon
+
+    Bölüm önce paragraflara, paragraf da sığmazsa boşluklardan
+    chunk_size uzunluğunu aşmayan parçalara ayrılır.
+    """
+
+    if len(section) <= chunk_size:
+        return [section]
+
+    pieces = []
+    for paragraph in re.split(r"\n\s*\n", section):
+        paragraph = paragraph.strip()
+        while len(paragraph) > chunk_size:
+            cut = paragraph.rfind(" ", 0, chunk_size)
+            if cut <= 0:
+                cut = chunk_size
+            pieces.append(paragraph[:cut].strip())
+            paragraph = paragraph[cut:].strip()
+        if paragraph:
+            pieces.append(paragraph)
+    return pieces
+
+
+# Ödevi değerlendirme parçalarına ayıran fonksiyon
+def split_assignment(assignment_text, chunk_size=None) -> List[str]:
+    """
+    Ödevi değerlendirme parçalarına ayıran fonksiyon
+
+    Ardışık bölümler chunk_size karakterini aşmayacak şekilde aynı
+    parçada toplanır; böylece bir soru iki parçaya bölünmez. Metin
+    chunk_size değerinden kısaysa tek parça döndürülür.
+    """
+
+    chunk_size = chunk_size or CHUNK_SIZE
+    assignment_text = assignment_text.strip()
+    if len(assignment_text) <= chunk_size:
+        return [assignment_text]
+
+    chunks = []
+    current = ""
+    for section in split_sections(assignment_text):
+        for piece in split_oversized(section, chunk_size):
+            if current and len(current) + len(piece) + 2 > chunk_size:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+# Ödev parçasının değerlendirme istemini hazırlayan fonksiyon
+def build_chunk_prompt(chunk, criteria, index, total):
+    """
+    Ödev parçasının değerlendirme istemini hazırlayan fonksiyon
+
+    Parça değerlendirmesi kısa tutulur; birleştirme adımında tam rapor
+    biçimine dönüştürülür.
+    """
+
+    return f"""
+Aşağıda uzun bir öğrenci ödevinin {index}/{total}. bölümü yer alıyor.
+Yalnızca bu bölümü eğitici ve yapıcı bir şekilde değerlendir:
+
+=== ÖDEV BÖLÜMÜ ===
+{chunk}
+
+=== DEĞERLENDİRME KRİTERLERİ ===
+{criteria}
+
+=== BÖLÜM DEĞERLENDİRMESİ ===
+Lütfen aşağıdaki formatı kullanarak kısa ve öz değerlendirme yap:
+
+Puan: [X]/100
+Güçlü Yönler:
+- [Başarılı olan noktalar]
+Geliştirilebilir Alanlar:
+- [Eksik veya hatalı noktalar]
+Öneriler:
+- [Somut iyileştirme önerileri]
+Detaylı Geri Bildirim:
+[Bu bölümdeki her soru veya kısım için kısa analiz]
+
+Değerlendirme Türkçe olmalı. Başka bölümlere atıf yapma.
+    """
+
+
+# Parça değerlendirmelerini birleştirme istemini hazırlayan fonksiyon
+def build_merge_prompt(chunk_reports, criteria, score=None):
+    """
+    Parça değerlendirmelerini birleştirme istemini hazırlayan fonksiyon
+
+    Puan verilmişse rapor başlığı ve puan satırı çağıran tarafından
+    yazılır; model raporu "Genel Görüş" satırından sürdürür.
+    """
+
+    reports = "\n\n".join(
+        f"--- {index}. BÖLÜM ---\n{report.strip()}"
+        for index, report in enumerate(chunk_reports, 1)
+    )
+
+    if score is None:
+        opening = """🎯 GENEL DEĞERLENDİRME
+Puan: [X]/100
+Genel Görüş: [Kısa özet değerlendirme]"""
+    else:
+        opening = f"""Raporun "🎯 GENEL DEĞERLENDİRME" başlığı ve \
+"Puan: {format_score(score)}/100" satırı zaten yazıldı. Bunları tekrar
+yazma; yanıtına doğrudan aşağıdaki satırla başla:
+
+Genel Görüş: [Kısa özet değerlendirme]"""
+
+    return f"""
+Uzun bir öğrenci ödevi bölümlere ayrılarak değerlendirildi. Aşağıdaki
+bölüm değerlendirmelerini tek ve tutarlı bir değerlendirme raporunda
+birleştir. Tekrarları ayıkla, ortak noktaları genelle.
+
+=== BÖLÜM DEĞERLENDİRMELERİ ===
+{reports}
+
+=== DEĞERLENDİRME KRİTERLERİ ===
+{criteria}
+
+=== DEĞERLENDİRME RAPORU ===
+Lütfen aşağıdaki format kullanarak detaylı değerlendirme yap:
+
+{opening}
+
+✅ GÜÇLÜ YÖNLER
+- [Başarılı olan noktalar]
+- [Doğru yaklaşımlar]
+- [İyi uygulamalar]
+
+📈 GELİŞTİRİLEBİLİR ALANLAR
+- [Eksik olan noktalar]
+- [Hatalı yaklaşımlar]
+- [İyileştirilebilir alanlar]
+
+💡 ÖNERİLER VE REHBERLIK
+- [Somut iyileştirme önerileri]
+- [Alternatif yaklaşımlar]
+- [Ek kaynak önerileri]
+
+📝 DETAYLI GERİ BİLDİRİM
+[Bölüm bölüm detaylı analiz]
+
+🎯 SONUÇ VE ÖZET
+[Öğrencinin gelişimi için somut adımlar]
+
+Değerlendirme Türkçe, eğitici, yapıcı ve motive edici olmalı.
+Öğrencinin moralini bozmadan gelişim alanlarını belirt.
+    """
+
+
+# Puanı rapordaki biçimine çeviren fonksiyon
+def format_score(score):
+    """
+    Puanı rapordaki biçimine çeviren fonksiyon
+    """
+
+    return f"{round(score, 1):g}"
+
+
+# Parça puanlarının ağırlıklı ortalamasını hesaplayan fonksiyon
+def weighted_score(scores, weights) -> Optional[float]:
+    """
+    Parça puanlarının ağırlıklı ortalamasını hesaplayan fonksiyon
+
+    Her parça uzunluğuyla ağırlıklandırılır; puanı okunamayan parçalar
+    hesaba katılmaz. Hiç puan yoksa None döndürür.
+    """
+
+    pairs = [(min(max(score, 0.0), 100.0), weight)
+             for score, weight in zip(scores, weights)
+             if score is not None and weight > 0]
+    total_weight = sum(weight for _, weight in pairs)
+    if not total_weight:
+        return None
+    return round(sum(score * weight for score, weight in pairs)
+                 / total_weight, 1)
+
+
+# Parça değerlendirme havuzunu döndüren fonksiyon
+def get_chunk_executor() -> ThreadPoolExecutor:
+    """
+    Parça değerlendirme havuzunu döndüren fonksiyon
+
+    Havuz ilk kullanımda oluşturulur ve tüm değerlendirmeler arasında
+    paylaşılır; aynı anda en fazla CHUNK_WORKERS Gemini çağrısı yapılır.
+    """
+
+    global _chunk_executor
+    with _chunk_lock:
+        if _chunk_executor is None:
+            _chunk_executor = ThreadPoolExecutor(
+                max_workers=CHUNK_WORKERS,
+                thread_name_prefix="evaluation-chunk",
+            )
+        return _chunk_executor
+
+
+# Ödev parçalarını eş zamanlı değerlendiren fonksiyon
+def evaluate_chunks(chunks, criteria, model) -> List[str]:
+    """
+    Ödev parçalarını eş zamanlı değerlendiren fonksiyon
+
+    Değerlendirmeler parça sırasıyla döndürülür. Bir parça başarısız
+    olursa henüz başlamamış çağrılar iptal edilir ve hata çağırana
+    iletilir.
+    """
+
+    executor = get_chunk_executor()
+    caller = get_resilient_caller()
+
+    def evaluate(prompt):
+        return caller.generate(model, prompt).text
+
+    futures = [
+        executor.submit(evaluate, build_chunk_prompt(
+            chunk, criteria, index, len(chunks)
+        ))
+        for index, chunk in enumerate(chunks, 1)
+    ]
+    try:
+        return [future.result() for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+# Parçalı değerlendirmenin birleştirme adımını hazırlayan fonksiyon
+def prepare_chunked_evaluation(assignment_text, criteria, model):
+    """
+    Parçalı değerlendirmenin birleştirme adımını hazırlayan fonksiyon
+
+    Ödev parçalara ayrılıp eş zamanlı değerlendirilir ve parça puanları
+    uzunluklarına göre ağırlıklandırılır. Rapor başlığı ile birleştirme
+    istemini döndürür.
+    """
+
+    chunks = split_assignment(assignment_text)
+    reports = evaluate_chunks(chunks, criteria, model)
+    score = weighted_score([extract_score(report) for report in reports],
+                           [len(chunk) for chunk in chunks])
+
+    header = "" if score is None else \
+        f"🎯 GENEL DEĞERLENDİRME\nPuan: {format_score(score)}/100\n"
+    return header, build_merge_prompt(reports, criteria, score)
+
+
+# Uzun ödevi parçalara ayırarak değerlendiren fonksiyon
+def evaluate_assignment_chunked(
+    assignment_text,
+    criteria="Genel değerlendirme kriterleri",
+    model=None
+):
+    """
+    Uzun ödevi parçalara ayırarak değerlendiren fonksiyon
+
+    Parçalar eş zamanlı değerlendirilir, ardından tek bir istemle
+    evaluate_assignment ile aynı rapor biçiminde birleştirilir. Hatalar
+    çağırana iletilir.
+    """
+
+    header, prompt = prepare_chunked_evaluation(assignment_text, criteria,
+                                                model)
+    return header + get_resilient_caller().generate(model, prompt).text.strip()
+
+
+# Ödevi değerlendiren fonksiyon
+def evaluate_assignment(
+    assignment_text,
+    criteria="Genel değerlendirme kriterleri",
+    model=None,
+    chunked=None
+):
+    """
+    Ödevi değerlendiren fonksiyon
+
+    Öğrenci ödevini detaylı şekilde değerlendirir ve sonuç üretir.
+    ...
+    """
+    if not assignment_text.strip():
+        return "Hata: Ödev metni boş olamaz! " \
+               "Lütfen değerlendirilecek içeriği giriniz."
+    if len(assignment_text) < 10:
+        return (
+            "Uyarı: Çok kısa ödev metni! "
+            "Detaylı değerlendirme için daha uzun içerik önerilir."
+        )
+
+    if chunked is None:
+        chunked = CHUNKED_ENABLED
+
     try:
-        response = model.generate_content(prompt).text
+        if chunked and len(assignment_text.strip()) > CHUNK_SIZE:
+            return evaluate_assignment_chunked(assignment_text, criteria,
+                                               model=model)
+
+        prompt = build_evaluation_prompt(assignment_text, criteria)
+        response = get_resilient_caller().generate(model, prompt).text
         return response
+    except (RateLimitExceededError, CircuitOpenError):
+        # Çağıran 429 yanıtı verebilsin diye metne çevrilmez
+        raise
     except Exception as e:
         return f"Ödev değerlendirilirken hata oluştu: {str(e)}"
+
+
+# Ödevi parça parça değerlendiren fonksiyon
+def evaluate_assignment_stream(
+    assignment_text,
+    criteria="Genel değerlendirme kriterleri",
+    model=None,
+    chunked=None
+):
+    """
+    Ödevi parça parça değerlendiren fonksiyon
+
+    evaluate_assignment ile aynı istemi Gemini'nin akış kipinde gönderir
+    ve metin parçalarını geldikçe döndürür. Parçalı kipte bölümler önce
+    eş zamanlı değerlendirilir, ardından puan satırı ve birleştirilmiş
+    rapor akış olarak gönderilir. Hatalar çağırana iletilir.
+    """
+    if chunked is None:
+        chunked = CHUNKED_ENABLED
+
+    if chunked and len(assignment_text.strip()) > CHUNK_SIZE:
+        header, prompt = prepare_chunked_evaluation(assignment_text,
+                                                    criteria, model)
+        if header:
+            yield header
+    else:
+        prompt = build_evaluation_prompt(assignment_text, criteria)
+
+    response = get_resilient_caller().generate_stream(model, prompt)
+    for chunk in response:
+        if chunk.parts:
+            yield chunk.text
@@ -0,0 +1,157 @@
+"""
+BTK Hackathon 2025 - Yinelenen Ödev Değerlendirmesi Denetimi Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül aynı kullanıcının aynı ödev metni ve kriterlerle yaptığı
+yinelenen gönderimleri, assignment_evaluations tablosundaki özet sütunu
+üzerinden bulur.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import hashlib
+import logging
+
+from typing import Any, Dict, List, Optional
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+from education.evaluate_assignment import is_error_result
+
+
+logger = logging.getLogger(__name__)
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Yinelenen gönderimlerin aranacağı süre (dakika), 0 ise kapalı
+DEDUP_WINDOW_MINUTES = int(config.get("EVAL_DEDUP_WINDOW_MINUTES", 1440))
+
+
+# Metni karşılaştırma için sadeleştiren fonksiyon
+def _normalize(text: str) -> str:
+    """
+    Metni karşılaştırma için sadeleştiren fonksiyon
+
+    Satır sonları birleştirilir, satır sonundaki boşluklar atılır.
+    """
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+# Ödev metni ve kriterlerden gönderim özeti üretme fonksiyonu
+def submission_digest(assignment_text: str, criteria: str) -> str:
+    """
+    Ödev metni ve kriterlerden gönderim özeti üretme fonksiyonu
+
+    Parametreler:
+        assignment_text (str): Ödev metni
+        criteria (str): Değerlendirme kriterleri
+
+    Döndürülenler:
+        str: SHA-256 özeti
+    """
+    payload = _normalize(assignment_text) + "\0" + _normalize(criteria)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Değerlendirme kaydına yazılacak gönderim özetini döndürme fonksiyonu
+def stored_digest(
+    assignment_text: str, criteria: str, evaluation_result: str
+) -> Optional[str]:
+    """
+    Değerlendirme kaydına yazılacak gönderim özetini döndürme fonksiyonu
+
+    Başarısız değerlendirmeler geçmişte görünsün diye yine kaydedilir
+    ancak özetsiz yazılır; böylece geçici bir hatadan sonra yapılan
+    yeniden gönderim saklanan hata iletisiyle yanıtlanmaz.
+
+    Parametreler:
+        assignment_text (str): Ödev metni
+        criteria (str): Değerlendirme kriterleri
+        evaluation_result (str): Değerlendirme raporu
+
+    Döndürülenler:
+        str | None: SHA-256 özeti veya başarısız değerlendirmede None
+    """
+    if is_error_result(evaluation_result):
+        return None
+    return submission_digest(assignment_text, criteria)
+
+
+# Aynı gönderimin yakın zamandaki değerlendirmesini bulma fonksiyonu
+def find_recent_evaluation(
+    user_id: int, digest: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Aynı gönderimin yakın zamandaki değerlendirmesini bulma fonksiyonu
+
+    Parametreler:
+        user_id (int): Kullanıcı ID'si
+        digest (str): Gönderim özeti
+
+    Döndürülenler:
+        Dict[str, Any] | None: id, evaluation_result, score ve
+        evaluated_at alanları veya None
+    """
+    if DEDUP_WINDOW_MINUTES <= 0:
+        return None
+
+    try:
+        return get_db().execute_single(
+            """SELECT id, evaluation_result, score, evaluated_at
+                FROM assignment_evaluations
+                WHERE user_id = %s AND submission_digest = %s
+                 AND evaluated_at > NOW() - INTERVAL %s MINUTE
+                ORDER BY evaluated_at DESC
+                LIMIT 1""",
+            (user_id, digest, DEDUP_WINDOW_MINUTES),
+        )
+    except Exception as e:
+        logger.error(f"Yinelenen değerlendirme arama hatası: {e}")
+        return None
+
+
+# Birden fazla gönderimin yakın zamandaki değerlendirmelerini bulma fonksiyonu
+def find_recent_evaluations(
+    user_id: int, digests: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Birden fazla gönderimin yakın zamandaki değerlendirmelerini bulma
+    fonksiyonu
+
+    Toplu değerlendirmede her gönderim için ayrı sorgu yapmamak için
+    kullanılır.
+
+    Parametreler:
+        user_id (int): Kullanıcı ID'si
+        digests (List[str]): Gönderim özetleri
+
+    Döndürülenler:
+        Dict[str, Dict[str, Any]]: Özete göre en yeni değerlendirmenin
+        id, evaluation_result, score ve evaluated_at alanları
+    """
+    digests = list(dict.fromkeys(digests))
+    if DEDUP_WINDOW_MINUTES <= 0 or not digests:
+        return {}
+
+    placeholders = ", ".join(["%s"] * len(digests))
+    try:
+        rows = get_db().execute_query(
+            f"""SELECT id, submission_digest, evaluation_result, score,
+                 evaluated_at
+                FROM assignment_evaluations
+                WHERE user_id = %s
+                 AND submission_digest IN ({placeholders})
+                 AND evaluated_at > NOW() - INTERVAL %s MINUTE
+                ORDER BY evaluated_at ASC""",
+            (user_id, *digests, DEDUP_WINDOW_MINUTES),
+        )
+    except Exception as e:
+        logger.error(f"Yinelenen değerlendirme arama hatası: {e}")
+        return {}
+
+    # Artan sırada okunduğu için en yeni kayıt en son yazılır
+    return {row.pop("submission_digest"): row for row in rows}
@@ -8,23 +8,52 @@ Bu dosya, Gemini API kullanarak eğitim oluşturmayı sınar.
 """
 
 
-# Eğitimi oluşturan fonksiyon
-def generate_education(
+# Gerekli kütüphanelerin içe aktarılması
+import re
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterator, List, Tuple
+
+from config.config_loader import load_config
+from education.llm_client import CircuitOpenError, get_resilient_caller
+from education.rate_limiter import RateLimitExceededError
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Aşamalı oluşturma ayarları
+PIPELINE_ENABLED = str(config.get("EDUCATION_PIPELINE", False)).lower() \
+    in ["true", "1", "yes"]
+PIPELINE_WORKERS = max(1, int(config.get("EDUCATION_PIPELINE_WORKERS", 4)))
+
+# Taslaktaki hafta satırı deseni, ör. "HAFTA 3: Döngüler"
+WEEK_PATTERN = re.compile(
+    r"^[\s#*>-]*HAFTA\s+(\d+)\s*[:.\-–—)]\s*\**\s*(.+?)\s*\**\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Haftalık içerikleri oluşturan iş parçacığı havuzu
+_pipeline_executor = None
+_pipeline_lock = threading.Lock()
+
+
+# Eğitim oluşturma istemini hazırlayan fonksiyon
+def build_education_prompt(
     subject,
     duration="5 hafta",
     lesson_duration=30,
-    question_count=5,
-    model=None
+    question_count=5
 ):
     """
-    Eğitimi oluşturan fonksiyon
+    Eğitim oluşturma istemini hazırlayan fonksiyon
 
-    Belirtilen konu için eğitim, ders planı, ders içerikleri ve
-    sınav soruları oluşturur ve hepsini bir defada yazdırır.
+    Eğitim, ders planı, ders içerikleri ve sınav soruları için
+    Gemini'ye gönderilecek istemi döndürür.
     """
 
-    try:
-        prompt_content_of_education = f"""
+    return f"""
 Bilgisayar alanında \"{subject}\" konusunda {duration} süresinde
 bir eğitim oluştur. Müfredat şu şekilde olmalı:
 
@@ -61,8 +90,341 @@ Yanıt: [Sorunun yanıtı yer almaktadır.]
 
 """
 
-        response = model.generate_content(prompt_content_of_education).text
+
+# Süre metninden hafta sayısını çıkaran fonksiyon
+def parse_week_count(duration, default=5):
+    """
+    Süre metninden hafta sayısını çıkaran fonksiyon
+
+    "14 hafta" gibi metinlerdeki ilk sayıyı döndürür.
+    """
+
+    match = re.search(r"\d+", str(duration))
+    return int(match.group()) if match else default
+
+
+# Eğitim taslağı istemini hazırlayan fonksiyon
+def build_outline_prompt(
+    subject,
+    duration="5 hafta",
+    lesson_duration=30,
+    question_count=5
+):
+    """
+    Eğitim taslağı istemini hazırlayan fonksiyon
+
+    Aşamalı oluşturmanın ilk adımıdır; eğitim hedeflerini, dersleri,
+    haftalık konuları ve kaynakları ister. Haftalık konular sonraki
+    adımlarda ayrıştırılabilmesi için sabit bir satır biçimiyle istenir.
+    """
+
+    week_count = parse_week_count(duration)
+    return f"""
+Bilgisayar alanında \"{subject}\" konusunda {duration} süresinde
+bir eğitim için müfredat taslağı oluştur. Taslak şu şekilde olmalı:
+
+1. Eğitim hedefleri (Somut ve ölçülebilir hedefler)
+2. Eğitimde yer alan dersler (Temelden uzmanlığa
+kadar sıralama)
+3. Haftalık konular ve alt başlıklar (Kronolojik sıralama)
+4. Kaynaklar (Kitap, video, çevrimiçi platform önerileri)
+
+Haftalık konular bölümünde toplam {week_count} hafta olmalı ve her
+hafta tam olarak şu biçimde ayrı bir satırla başlamalıdır:
+
+HAFTA [Hafta numarası]: [Haftanın konusu]
+
+Her hafta {lesson_duration} dakikalık ders olacaktır. Bu adımda ders
+içeriklerini ve soruları yazma; yalnızca taslağı hazırla.
+
+Tüm içerikleri Türkçe olarak, ayrıntılı ve düzenli bir biçimde
+hazırla.
+"""
+
+
+# Haftalık ders içeriği istemini hazırlayan fonksiyon
+def build_week_prompt(subject, outline, week_number, week_title,
+                      lesson_duration=30):
+    """
+    Haftalık ders içeriği istemini hazırlayan fonksiyon
+
+    Taslak, haftanın eğitimin geri kalanıyla tutarlı olması için
+    isteme eklenir.
+    """
+
+    week_label = f"{week_number}. haftası"
+    if week_title:
+        week_label += f' ("{week_title}")'
+
+    return f"""
+Aşağıda \"{subject}\" eğitiminin taslağı yer almaktadır:
+
+{outline}
+
+Bu eğitimin {week_label} için {lesson_duration} dakikalık
+dersin içeriğini hazırla. İçerik şu bölümlerden oluşmalı:
+
+    1. Ders Başlığı
+    2. Giriş (%5)
+    3. Ana İçerik (%70)
+    4. Pratik Uygulamalar (%30)
+    5. Değerlendirme ve Kapanış (%5)
+
+Yalnızca bu haftanın içeriğini yaz; taslağı tekrarlama ve soru
+hazırlama. Tüm içerikleri Türkçe olarak, ayrıntılı ve düzenli bir
+biçimde hazırla.
+"""
+
+
+# Haftalık soru istemini hazırlayan fonksiyon
+def build_questions_prompt(subject, outline, week_number, week_title,
+                           question_count=5):
+    """
+    Haftalık soru istemini hazırlayan fonksiyon
+
+    Sorular ders içeriğine değil taslaktaki hafta konusuna dayanır;
+    böylece ders içeriğiyle aynı anda oluşturulabilir.
+    """
+
+    week_label = f"{week_number}. haftası"
+    if week_title:
+        week_label += f' ("{week_title}")'
+
+    return f"""
+Aşağıda \"{subject}\" eğitiminin taslağı yer almaktadır:
+
+{outline}
+
+Bu eğitimin {week_label} için {question_count} adet soru
+hazırla. Sorular açık uçlu ve aşağıdaki şekilde hazırlanmalıdır:
+
+Soru: [Soru yer almaktadır.]
+Yanıt: [Sorunun yanıtı yer almaktadır.]
+
+Yalnızca soruları ve yanıtlarını yaz. Tüm içerikleri Türkçe olarak
+hazırla.
+"""
+
+
+# Taslaktan haftalık konuları ayrıştıran fonksiyon
+def parse_outline_weeks(outline, week_count=None) -> List[Tuple[int, str]]:
+    """
+    Taslaktan haftalık konuları ayrıştıran fonksiyon
+
+    Aynı numaralı hafta birden fazla geçerse ilki alınır. week_count
+    verilirse ondan büyük numaralı haftalar atılır. Taslakta hafta satırı
+    bulunamazsa 1..week_count haftaları başlıksız döndürülür; konuları
+    model taslaktan çıkarır.
+    """
+
+    weeks = {}
+    for match in WEEK_PATTERN.finditer(outline):
+        number = int(match.group(1))
+        if week_count and number > week_count:
+            continue
+        weeks.setdefault(number, match.group(2).strip())
+    if not weeks and week_count:
+        return [(number, "") for number in range(1, week_count + 1)]
+    return sorted(weeks.items())
+
+
+# Haftalık içerik havuzunu döndüren fonksiyon
+def get_pipeline_executor() -> ThreadPoolExecutor:
+    """
+    Haftalık içerik havuzunu döndüren fonksiyon
+
+    Havuz ilk kullanımda oluşturulur ve tüm eğitimler arasında
+    paylaşılır; aynı anda en fazla PIPELINE_WORKERS Gemini çağrısı
+    yapılır.
+    """
+
+    global _pipeline_executor
+    with _pipeline_lock:
+        if _pipeline_executor is None:
+            _pipeline_executor = ThreadPoolExecutor(
+                max_workers=PIPELINE_WORKERS,
+                thread_name_prefix="education-pipeline",
+            )
+        return _pipeline_executor
+
+
+# Haftalık içerik ve soru çağrılarını başlatan fonksiyon
+def submit_weeks(subject, outline, weeks, lesson_duration, question_count,
+                 model) -> List[Tuple[int, str, Future, Future]]:
+    """
+    Haftalık içerik ve soru çağrılarını başlatan fonksiyon
+
+    Her hafta için ders içeriği ve sorular ayrı ayrı, havuzda eş zamanlı
+    oluşturulur.
+    """
+
+    executor = get_pipeline_executor()
+    caller = get_resilient_caller()
+
+    def generate(prompt):
+        return caller.generate(model, prompt).text
+
+    return [
+        (
+            number,
+            title,
+            executor.submit(generate, build_week_prompt(
+                subject, outline, number, title, lesson_duration
+            )),
+            executor.submit(generate, build_questions_prompt(
+                subject, outline, number, title, question_count
+            )),
+        )
+        for number, title in weeks
+    ]
+
+
+# Haftanın içeriğini ve sorularını birleştiren fonksiyon
+def format_week(number, title, lesson, questions) -> str:
+    """
+    Haftanın içeriğini ve sorularını birleştiren fonksiyon
+    """
+
+    heading = f"{number}. Hafta: {title}" if title else f"{number}. Hafta"
+    return (f"\n\n## {heading}\n\n{lesson.strip()}"
+            f"\n\n### {number}. Hafta Soruları\n\n{questions.strip()}")
+
+
+# Haftalık sonuçları sırayla döndüren fonksiyon
+def collect_weeks(futures) -> Iterator[str]:
+    """
+    Haftalık sonuçları sırayla döndüren fonksiyon
+
+    Bir hafta başarısız olursa henüz başlamamış çağrılar iptal edilir
+    ve hata çağırana iletilir.
+    """
+
+    try:
+        for number, title, lesson, questions in futures:
+            yield format_week(number, title, lesson.result(),
+                              questions.result())
+    finally:
+        for _, _, lesson, questions in futures:
+            lesson.cancel()
+            questions.cancel()
+
+
+# Eğitimi aşamalı ve paralel oluşturan fonksiyon
+def generate_education_pipelined(
+    subject,
+    duration="5 hafta",
+    lesson_duration=30,
+    question_count=5,
+    model=None
+):
+    """
+    Eğitimi aşamalı ve paralel oluşturan fonksiyon
+
+    Önce taslak oluşturulur, ardından her haftanın ders içeriği ve
+    soruları eş zamanlı oluşturulup hafta sırasıyla birleştirilir.
+    Hatalar çağırana iletilir.
+    """
+
+    outline = get_resilient_caller().generate(model, build_outline_prompt(
+        subject, duration, lesson_duration, question_count
+    )).text
+
+    weeks = parse_outline_weeks(outline, parse_week_count(duration))
+    futures = submit_weeks(subject, outline, weeks, lesson_duration,
+                           question_count, model)
+    return outline.strip() + "".join(collect_weeks(futures))
+
+
+# Eğitimi oluşturan fonksiyon
+def generate_education(
+    subject,
+    duration="5 hafta",
+    lesson_duration=30,
+    question_count=5,
+    model=None,
+    pipelined=None
+):
+    """
+    Eğitimi oluşturan fonksiyon
+
+    Belirtilen konu için eğitim, ders planı, ders içerikleri ve
+    sınav soruları oluşturur ve hepsini bir defada yazdırır.
+    pipelined verilmezse EDUCATION_PIPELINE ayarına göre aşamalı
+    oluşturma kullanılır.
+    """
+
+    if pipelined is None:
+        pipelined = PIPELINE_ENABLED
+
+    try:
+        if pipelined:
+            return generate_education_pipelined(
+                subject, duration, lesson_duration, question_count,
+                model=model
+            )
+
+        prompt_content_of_education = build_education_prompt(
+            subject, duration, lesson_duration, question_count
+        )
+
+        response = get_resilient_caller().generate(
+            model, prompt_content_of_education
+        ).text
 
         return response
+    except (RateLimitExceededError, CircuitOpenError):
+        # Çağıran 429 yanıtı verebilsin diye metne çevrilmez
+        raise
     except Exception as e:
         return f"Hata oluştu: {str(e)}"
+
+
+# Eğitimi parça parça oluşturan fonksiyon
+def generate_education_stream(
+    subject,
+    duration="5 hafta",
+    lesson_duration=30,
+    question_count=5,
+    model=None,
+    pipelined=None
+):
+    """
+    Eğitimi parça parça oluşturan fonksiyon
+
+    generate_education ile aynı istemi Gemini'nin akış kipinde gönderir
+    ve metin parçalarını geldikçe döndürür. Aşamalı kipte taslak akış
+    olarak gönderilir, haftalar ise hazır oldukça sırayla gönderilir.
+    Hatalar çağırana iletilir.
+    """
+
+    if pipelined is None:
+        pipelined = PIPELINE_ENABLED
+
+    if pipelined:
+        outline_parts = []
+        for chunk in get_resilient_caller().generate_stream(
+            model, build_outline_prompt(
+                subject, duration, lesson_duration, question_count
+            )
+        ):
+            if chunk.parts:
+                outline_parts.append(chunk.text)
+                yield chunk.text
+
+        outline = "".join(outline_parts)
+        weeks = parse_outline_weeks(outline, parse_week_count(duration))
+        futures = submit_weeks(subject, outline, weeks, lesson_duration,
+                               question_count, model)
+        yield from collect_weeks(futures)
+        return
+
+    prompt_content_of_education = build_education_prompt(
+        subject, duration, lesson_duration, question_count
+    )
+
+    response = get_resilient_caller().generate_stream(
+        model, prompt_content_of_education
+    )
+    for chunk in response:
+        if chunk.parts:
+            yield chunk.text
@@ -0,0 +1,265 @@
+"""
+BTK Hackathon 2025 - Eğitim Oluşturma İş Kuyruğu Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül uzun süren Gemini çağrılarını istek iş parçacığından alıp
+sınırlı bir işçi havuzunda arka planda çalıştırır.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import logging
+import secrets
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from config.config_loader import load_config
+
+
+logger = logging.getLogger(__name__)
+
+
+# İş durumları
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+# Kuyruk dolu olduğunda fırlatılan özel durum sınıfı
+class JobQueueFullError(Exception):
+    """Kuyruk dolu olduğunda fırlatılan özel durum sınıfı"""
+
+    pass
+
+
+# Kullanıcının eş zamanlı iş sınırı aşıldığında fırlatılan özel durum sınıfı
+class JobLimitError(Exception):
+    """
+    Kullanıcının eş zamanlı iş sınırı aşıldığında fırlatılan özel durum
+    sınıfı
+    """
+
+    pass
+
+
+# Tek bir arka plan işini temsil eden sınıf
+class Job:
+    """Tek bir arka plan işini temsil eden sınıf"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, user_id: int, metadata: Optional[Dict] = None):
+        self.id = secrets.token_urlsafe(16)
+        self.user_id = user_id
+        self.metadata = metadata or {}
+        self.status = JOB_QUEUED
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    # İşin bitip bitmediğini döndürme fonksiyonu
+    @property
+    def finished(self) -> bool:
+        return self.status in (JOB_DONE, JOB_FAILED)
+
+    # İşi sözlük olarak döndürme fonksiyonu
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        İşi sözlük olarak döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: İş bilgileri
+        """
+        data = {
+            "job_id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        data.update(self.metadata)
+        if self.status == JOB_DONE:
+            data["result"] = self.result
+        elif self.status == JOB_FAILED:
+            data["error"] = self.error
+        return data
+
+
+# Sınırlı işçi havuzlu iş kuyruğu sınıfı
+class JobQueue:
+    """Sınırlı işçi havuzlu iş kuyruğu sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue: int = 100,
+        max_per_user: int = 2,
+        result_ttl: int = 3600,
+    ):
+        self.max_workers = max(1, int(max_workers))
+        self.max_queue = max(1, int(max_queue))
+        self.max_per_user = max(1, int(max_per_user))
+        self.result_ttl = result_ttl
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="education-job",
+        )
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+        # İzleme sayaçları
+        self._submitted = 0
+        self._rejected = 0
+        self._completed = 0
+        self._failed = 0
+
+    # Süresi dolmuş iş sonuçlarını temizleme fonksiyonu
+    def _purge_expired(self) -> None:
+        """
+        Süresi dolmuş iş sonuçlarını temizleme fonksiyonu
+
+        Kilit tutulurken çağrılmalıdır.
+        """
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished and now - job.finished_at > self.result_ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    # Kuyruğa yeni iş ekleme fonksiyonu
+    def submit(
+        self,
+        user_id: int,
+        func: Callable,
+        *args,
+        metadata: Optional[Dict] = None,
+        **kwargs,
+    ) -> Job:
+        """
+        Kuyruğa yeni iş ekleme fonksiyonu
+
+        Parametreler:
+            user_id (int): İşin sahibi olan kullanıcı
+            func (Callable): Arka planda çalıştırılacak fonksiyon
+            metadata (Dict, optional): İş bilgisine eklenecek alanlar
+
+        Döndürülenler:
+            Job: Kuyruğa eklenen iş
+        """
+        with self._lock:
+            self._purge_expired()
+
+            pending = [job for job in self._jobs.values() if not job.finished]
+            if sum(job.status == JOB_QUEUED for job in pending) \
+                    >= self.max_queue:
+                self._rejected += 1
+                raise JobQueueFullError("İş kuyruğu dolu")
+            if sum(job.user_id == user_id for job in pending) \
+                    >= self.max_per_user:
+                self._rejected += 1
+                raise JobLimitError("Eş zamanlı iş sınırına ulaşıldı")
+
+            job = Job(user_id, metadata)
+            self._jobs[job.id] = job
+            self._submitted += 1
+
+        self._executor.submit(self._run, job, func, args, kwargs)
+        return job
+
+    # İşi çalıştırma fonksiyonu
+    def _run(self, job: Job, func: Callable, args, kwargs) -> None:
+        """
+        İşi çalıştırma fonksiyonu
+
+        Parametreler:
+            job (Job): Çalıştırılacak iş
+            func (Callable): İş fonksiyonu
+        """
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        try:
+            job.result = func(*args, **kwargs)
+            job.status = JOB_DONE
+            with self._lock:
+                self._completed += 1
+        except Exception as e:
+            logger.error(f"Arka plan işi başarısız oldu ({job.id}): {e}")
+            job.error = str(e)
+            job.status = JOB_FAILED
+            with self._lock:
+                self._failed += 1
+        finally:
+            job.finished_at = time.time()
+
+    # İşi kimliğine göre döndürme fonksiyonu
+    def get(self, job_id: str, user_id: Optional[int] = None) -> Optional[Job]:
+        """
+        İşi kimliğine göre döndürme fonksiyonu
+
+        Parametreler:
+            job_id (str): İş kimliği
+            user_id (int, optional): Verilirse yalnızca bu kullanıcının
+                işi döndürülür
+
+        Döndürülenler:
+            Job | None: İş veya None
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or (user_id is not None and job.user_id != user_id):
+            return None
+        return job
+
+    # Kuyruk istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, int]:
+        """
+        Kuyruk istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, int]: Kuyruk istatistikleri
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+            return {
+                "workers": self.max_workers,
+                "queued": sum(job.status == JOB_QUEUED for job in jobs),
+                "running": sum(job.status == JOB_RUNNING for job in jobs),
+                "submitted": self._submitted,
+                "rejected": self._rejected,
+                "completed": self._completed,
+                "failed": self._failed,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnek
+job_queue = JobQueue(
+    max_workers=int(config.get("JOB_WORKERS", 4)),
+    max_queue=int(config.get("JOB_MAX_QUEUE", 100)),
+    max_per_user=int(config.get("JOB_MAX_PER_USER", 2)),
+    result_ttl=int(config.get("JOB_RESULT_TTL", 3600)),
+)
+
+
+# İş kuyruğu örneğini döndürme fonksiyonu
+def get_job_queue() -> JobQueue:
+    """
+    İş kuyruğu örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        JobQueue: İş kuyruğu nesnesi
+    """
+    return job_queue
@@ -0,0 +1,578 @@
+"""
+BTK Hackathon 2025 - Dayanıklı Gemini Çağrı Katmanı Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül model.generate_content çağrılarını geçici hatalara karşı
+dayanıklı hale getirir. Hatalar yeniden denenebilir veya kalıcı olarak
+sınıflandırılır; geçici hatalar toplam süre sınırı içinde rastgele
+gecikmeli üstel geri çekilmeyle yeniden denenir. İstenirse yavaş kalan
+ilk isteğin yanına ikinci bir istek gönderilir ve önce biten kullanılır.
+Anahtar başına devre kesici, kesinti sırasında istekleri beklemeden
+reddeder.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import logging
+import math
+import random
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from google.api_core import exceptions as google_exceptions
+
+from config.config_loader import load_config
+
+
+logger = logging.getLogger(__name__)
+
+# Yeniden denenebilir Gemini hataları
+RETRYABLE_ERRORS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.InternalServerError,
+    google_exceptions.BadGateway,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.GatewayTimeout,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.Aborted,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+# Devre açıkken fırlatılan özel durum sınıfı
+class CircuitOpenError(Exception):
+    """Devre açıkken fırlatılan özel durum sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, retry_after: float):
+        self.retry_after = max(1, math.ceil(retry_after))
+        super().__init__(
+            "Gemini hizmetine şu anda ulaşılamıyor, lütfen "
+            f"{self.retry_after} saniye sonra tekrar deneyin"
+        )
+
+
+# Hatanın yeniden denenebilir olup olmadığını belirleme fonksiyonu
+def is_retryable(error: Exception) -> bool:
+    """
+    Hatanın yeniden denenebilir olup olmadığını belirleme fonksiyonu
+
+    Kota, sunucu ve bağlantı hataları geçicidir. Geçersiz istek, yetki ve
+    anahtar hataları ile yerel istek sınırlayıcının hatası kalıcıdır.
+
+    Parametreler:
+        error (Exception): Yakalanan hata
+
+    Döndürülenler:
+        bool: Yeniden denenebilirse True
+    """
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+# Anahtar başına devre kesici sınıfı
+class CircuitBreaker:
+    """Anahtar başına devre kesici sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        # Eşik 0 ise devre kesici kapalıdır
+        self.threshold = max(0, int(threshold))
+        self.cooldown = max(1.0, float(cooldown))
+
+        # anahtar -> [ardışık hata sayısı, açılma zamanı, deneme sürüyor mu]
+        self._state: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+        # İzleme sayaçları
+        self.opened = 0
+        self.short_circuited = 0
+
+    # Çağrıdan önce devreyi denetleme fonksiyonu
+    def before_call(self, key: str) -> None:
+        """
+        Çağrıdan önce devreyi denetleme fonksiyonu
+
+        Devre açıksa CircuitOpenError fırlatılır. Bekleme süresi dolduysa
+        tek bir deneme isteğine izin verilir.
+
+        Parametreler:
+            key (str): Anahtar parmak izi
+        """
+        if not self.threshold:
+            return
+        with self._lock:
+            state = self._state.get(key)
+            if state is None or state[1] is None:
+                return
+            remaining = state[1] + self.cooldown - time.monotonic()
+            if remaining > 0 or state[2]:
+                self.short_circuited += 1
+                raise CircuitOpenError(max(remaining, 1))
+            state[2] = True
+
+    # Başarılı çağrıyı kaydetme fonksiyonu
+    def record_success(self, key: str) -> None:
+        """
+        Başarılı çağrıyı kaydetme fonksiyonu
+
+        Parametreler:
+            key (str): Anahtar parmak izi
+        """
+        if not self.threshold:
+            return
+        with self._lock:
+            self._state.pop(key, None)
+
+    # Geçici hatayı kaydetme fonksiyonu
+    def record_failure(self, key: str) -> None:
+        """
+        Geçici hatayı kaydetme fonksiyonu
+
+        Ardışık hata sayısı eşiğe ulaşınca veya deneme isteği başarısız
+        olunca devre açılır.
+
+        Parametreler:
+            key (str): Anahtar parmak izi
+        """
+        if not self.threshold:
+            return
+        with self._lock:
+            state = self._state.setdefault(key, [0, None, False])
+            state[0] += 1
+            probing, state[2] = state[2], False
+            if probing or (state[1] is None and state[0] >= self.threshold):
+                state[1] = time.monotonic()
+                self.opened += 1
+                logger.warning(f"Gemini devresi açıldı: {key}")
+
+    # Sonucu devreyi etkilemeyen çağrıyı kaydetme fonksiyonu
+    def release(self, key: str) -> None:
+        """
+        Sonucu devreyi etkilemeyen çağrıyı kaydetme fonksiyonu
+
+        Deneme isteği Gemini'ye ulaşmadan başarısız olduysa bir sonraki
+        isteğin deneme yapabilmesi sağlanır.
+
+        Parametreler:
+            key (str): Anahtar parmak izi
+        """
+        with self._lock:
+            state = self._state.get(key)
+            if state is not None:
+                state[2] = False
+
+    # Açık devre sayısını döndürme fonksiyonu
+    def open_count(self) -> int:
+        """
+        Açık devre sayısını döndürme fonksiyonu
+
+        Döndürülenler:
+            int: Bekleme süresi dolmamış açık devre sayısı
+        """
+        now = time.monotonic()
+        with self._lock:
+            return sum(1 for state in self._state.values()
+                       if state[1] is not None
+                       and state[1] + self.cooldown > now)
+
+
+# Son çağrı sürelerini tutan sınıf
+class LatencyTracker:
+    """Son çağrı sürelerini tutan sınıf"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=max(1, int(window)))
+        self._lock = threading.Lock()
+
+    # Süre ekleme fonksiyonu
+    def add(self, seconds: float) -> None:
+        """
+        Süre ekleme fonksiyonu
+
+        Parametreler:
+            seconds (float): Çağrı süresi
+        """
+        with self._lock:
+            self._samples.append(seconds)
+
+    # Yüzdelik değeri döndürme fonksiyonu
+    def percentile(self, percent: float, min_samples: int) -> Optional[float]:
+        """
+        Yüzdelik değeri döndürme fonksiyonu
+
+        Parametreler:
+            percent (float): Yüzdelik, ör. 95
+            min_samples (int): Hesap için gereken en az örnek sayısı
+
+        Döndürülenler:
+            float | None: Süre veya yeterli örnek yoksa None
+        """
+        with self._lock:
+            if len(self._samples) < max(1, min_samples):
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1,
+                    int(math.ceil(percent / 100.0 * len(ordered))) - 1)
+        return ordered[max(0, index)]
+
+
+# Dayanıklı Gemini çağrı sınıfı
+class ResilientCaller:
+    """Dayanıklı Gemini çağrı sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        deadline: float = 120.0,
+        hedge_percentile: float = 0,
+        hedge_min_samples: int = 20,
+        hedge_workers: int = 8,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 30.0,
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = max(0.0, float(base_delay))
+        self.max_delay = max(self.base_delay, float(max_delay))
+        self.deadline = max(1.0, float(deadline))
+        self.hedge_percentile = max(0.0, min(float(hedge_percentile), 100.0))
+        self.hedge_min_samples = int(hedge_min_samples)
+
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_cooldown)
+        self.latency = LatencyTracker()
+        self._executor = None
+        self._hedge_workers = max(2, int(hedge_workers))
+        # Havuzdaki boş iş parçacıkları; iş hiçbir zaman kuyrukta beklemez
+        self._slots = threading.BoundedSemaphore(self._hedge_workers)
+        self._lock = threading.Lock()
+
+        # İzleme sayaçları
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.hedges_skipped = 0
+
+    # Sayaç artırma fonksiyonu
+    def _count(self, name: str) -> None:
+        """
+        Sayaç artırma fonksiyonu
+
+        Parametreler:
+            name (str): Sayaç adı
+        """
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    # Denemeden önce beklenecek süreyi hesaplama fonksiyonu
+    def _backoff(self, attempt: int) -> float:
+        """
+        Denemeden önce beklenecek süreyi hesaplama fonksiyonu
+
+        Üstel artan üst sınır içinde tamamen rastgele bir süre seçilir;
+        böylece aynı anda hata alan istekler aynı anda yeniden denenmez.
+
+        Parametreler:
+            attempt (int): Başarısız deneme sayısı
+
+        Döndürülenler:
+            float: Saniye cinsinden bekleme süresi
+        """
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    # Yedek istek gecikmesini döndürme fonksiyonu
+    def _hedge_delay(self) -> Optional[float]:
+        """
+        Yedek istek gecikmesini döndürme fonksiyonu
+
+        Döndürülenler:
+            float | None: İlk istek bu süreyi aşarsa yedek gönderilir;
+            yedekleme kapalıysa veya yeterli örnek yoksa None
+        """
+        if not self.hedge_percentile:
+            return None
+        return self.latency.percentile(self.hedge_percentile,
+                                       self.hedge_min_samples)
+
+    # Çağrıyı ayrılmış iş parçacığında başlatma fonksiyonu
+    def _start(self, call: Callable[[], Any]) -> Future:
+        """
+        Çağrıyı ayrılmış iş parçacığında başlatma fonksiyonu
+
+        Çağıran _slots üzerinden bir iş parçacığı ayırmış olmalıdır;
+        çağrı bitince ayrılan iş parçacığı bırakılır.
+
+        Parametreler:
+            call (Callable): Çağrı fonksiyonu
+
+        Döndürülenler:
+            Future: Çağrının sonucu
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._hedge_workers,
+                    thread_name_prefix="gemini-hedge",
+                )
+
+        def run():
+            try:
+                return call()
+            finally:
+                self._slots.release()
+
+        return self._executor.submit(run)
+
+    # Gerekirse yedek istekle çağırma fonksiyonu
+    def _call_hedged(
+        self,
+        call: Callable[[], Any],
+        delay: float,
+        make_hedge: Callable[[], Optional[Callable[[], Any]]],
+    ) -> Any:
+        """
+        Gerekirse yedek istekle çağırma fonksiyonu
+
+        İlk istek delay saniyede bitmezse yedek istek gönderilir ve önce
+        başarıyla biten sonuç döndürülür. İstekler yalnızca havuzda boş
+        iş parçacığı varsa havuza verilir; yoksa ilk istek çağıranın iş
+        parçacığında yedeksiz çalışır. make_hedge yedek istek için bütçe
+        ayıramazsa None döndürür; bu durumda ilk istek beklenir.
+
+        Parametreler:
+            call (Callable): Çağrı fonksiyonu
+            delay (float): Yedek istekten önce beklenecek süre
+            make_hedge (Callable): Yedek çağrıyı hazırlayan fonksiyon
+
+        Döndürülenler:
+            Any: Çağrının sonucu
+        """
+        # İlk istek ve yedeği için iki boş iş parçacığı gerekir
+        if not self._slots.acquire(blocking=False):
+            self._count("hedges_skipped")
+            return call()
+        if not self._slots.acquire(blocking=False):
+            self._slots.release()
+            self._count("hedges_skipped")
+            return call()
+
+        primary = self._start(call)
+        done, _ = wait([primary], timeout=delay)
+        hedge_call = None if done else make_hedge()
+        if hedge_call is None:
+            self._slots.release()
+            if not done:
+                self._count("hedges_skipped")
+            return primary.result()
+
+        self._count("hedged")
+        hedge = self._start(hedge_call)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self._count("hedge_wins")
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    # İçerik oluşturmayı yeniden deneyerek çağırma fonksiyonu
+    def generate(self, model, contents, **kwargs) -> Any:
+        """
+        İçerik oluşturmayı yeniden deneyerek çağırma fonksiyonu
+
+        Model sınırlayıcıyla sarmalanmışsa yedek istek yalnızca bütçede
+        beklemeden yer varsa gönderilir ve bütçeden bir kez düşülür.
+
+        Parametreler:
+            model: Gemini modeli veya sınırlayıcı sarmalayıcısı
+            contents: İstem
+            **kwargs: generate_content'e iletilecek diğer parametreler
+
+        Döndürülenler:
+            Any: Gemini yanıtı
+        """
+        key = getattr(model, "key_fingerprint", None) \
+            or getattr(model, "model_name", "")
+        hedge_delay = self._hedge_delay()
+
+        def call(timeout, estimate=None):
+            started = time.monotonic()
+            options = {"timeout": timeout}
+            if estimate is None:
+                response = model.generate_content(
+                    contents, request_options=options, **kwargs
+                )
+            else:
+                response = model.generate_reserved(
+                    contents, estimate, request_options=options, **kwargs
+                )
+            self.latency.add(time.monotonic() - started)
+            return response
+
+        def make_hedge(timeout):
+            if not hasattr(model, "try_reserve"):
+                return lambda: call(timeout)
+            estimate = model.try_reserve(contents)
+            if estimate is None:
+                return None
+            return lambda: call(timeout, estimate)
+
+        if hedge_delay is None:
+            return self._retry(key, call)
+        return self._retry(
+            key, lambda timeout: self._call_hedged(
+                lambda: call(timeout), hedge_delay,
+                lambda: make_hedge(timeout),
+            ),
+        )
+
+    # İçerik oluşturmayı akış kipinde yeniden deneyerek çağırma fonksiyonu
+    def generate_stream(self, model, contents, **kwargs) -> Iterator[Any]:
+        """
+        İçerik oluşturmayı akış kipinde yeniden deneyerek çağırma fonksiyonu
+
+        Yalnızca ilk parça gelene kadar yeniden denenir; parça iletildikten
+        sonraki hatalar çağırana iletilir. Akışta yedek istek gönderilmez.
+
+        Parametreler:
+            model: Gemini modeli veya sınırlayıcı sarmalayıcısı
+            contents: İstem
+            **kwargs: generate_content'e iletilecek diğer parametreler
+
+        Döndürülenler:
+            Iterator: Yanıt parçaları
+        """
+        key = getattr(model, "key_fingerprint", None) \
+            or getattr(model, "model_name", "")
+
+        def start(timeout):
+            chunks = iter(model.generate_content(
+                contents, stream=True, request_options={"timeout": timeout},
+                **kwargs
+            ))
+            return chunks, next(chunks, None)
+
+        chunks, first = self._retry(key, start)
+        if first is not None:
+            yield first
+            yield from chunks
+
+    # Çağrıyı süre sınırı içinde yeniden deneme fonksiyonu
+    def _retry(self, key: str, call: Callable[[], Any]) -> Any:
+        """
+        Çağrıyı süre sınırı içinde yeniden deneme fonksiyonu
+
+        Parametreler:
+            key (str): Devre kesici anahtarı
+            call (Callable): Kalan süreyi (saniye) alan çağrı fonksiyonu
+
+        Döndürülenler:
+            Any: Çağrının sonucu
+        """
+        self._count("calls")
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+        while True:
+            self.breaker.before_call(key)
+            attempt += 1
+            try:
+                result = call(max(1.0, deadline - time.monotonic()))
+            except Exception as e:
+                if not is_retryable(e):
+                    # Gemini'nin döndürdüğü kalıcı hata hizmetin ayakta
+                    # olduğunu gösterir
+                    if isinstance(e, google_exceptions.GoogleAPICallError):
+                        self.breaker.record_success(key)
+                    else:
+                        self.breaker.release(key)
+                    raise
+                self.breaker.record_failure(key)
+                delay = self._backoff(attempt)
+                if attempt >= self.max_attempts or \
+                        time.monotonic() + delay >= deadline:
+                    self._count("failures")
+                    raise
+                self._count("retries")
+                logger.warning(f"Gemini çağrısı yeniden denenecek "
+                               f"({attempt}/{self.max_attempts}, "
+                               f"{delay:.2f} sn): {e}")
+                time.sleep(delay)
+                continue
+
+            self.breaker.record_success(key)
+            return result
+
+    # Çağrı istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Any]:
+        """
+        Çağrı istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: Yeniden deneme, yedek istek ve devre sayaçları
+        """
+        hedge_delay = self._hedge_delay()
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "retries": self.retries,
+                "failures": self.failures,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "hedges_skipped": self.hedges_skipped,
+                "hedge_delay_ms": round(hedge_delay * 1000, 2)
+                if hedge_delay is not None else None,
+                "circuits_open": self.breaker.open_count(),
+                "circuits_opened": self.breaker.opened,
+                "short_circuited": self.breaker.short_circuited,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnek
+resilient_caller = ResilientCaller(
+    max_attempts=int(config.get("GEMINI_RETRY_MAX_ATTEMPTS", 4)),
+    base_delay=float(config.get("GEMINI_RETRY_BASE_DELAY", 0.5)),
+    max_delay=float(config.get("GEMINI_RETRY_MAX_DELAY", 8)),
+    deadline=float(config.get("GEMINI_CALL_DEADLINE", 120)),
+    hedge_percentile=float(config.get("GEMINI_HEDGE_PERCENTILE", 0)),
+    hedge_min_samples=int(config.get("GEMINI_HEDGE_MIN_SAMPLES", 20)),
+    hedge_workers=int(config.get("GEMINI_HEDGE_WORKERS", 8)),
+    breaker_threshold=int(config.get("GEMINI_BREAKER_THRESHOLD", 5)),
+    breaker_cooldown=float(config.get("GEMINI_BREAKER_COOLDOWN", 30)),
+)
+
+
+# Dayanıklı çağrı örneğini döndürme fonksiyonu
+def get_resilient_caller() -> ResilientCaller:
+    """
+    Dayanıklı çağrı örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        ResilientCaller: Dayanıklı çağrı nesnesi
+    """
+    return resilient_caller
@@ -0,0 +1,289 @@
+"""
+BTK Hackathon 2025 - Gemini Model İstemcisi Önbelleği Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül GenerativeModel nesnelerini API anahtarı parmak izi ve model adına
+göre önbellekte tutar. Her modelin kendi kimlik bilgisiyle yapılandırılmış
+ayrı bir istemcisi vardır; böylece genel genai.configure çağrısına ve
+iş parçacıkları arasındaki anahtar karışmasına gerek kalmaz.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import hashlib
+import logging
+import threading
+
+import google.generativeai as genai
+
+from google.generativeai import client as genai_client
+from typing import Any, Dict, Optional, Tuple
+
+from config.config_loader import load_config
+from database.database_connection import (
+    get_user_settings,
+    get_user_gemini_api_key,
+    register_settings_listener,
+)
+from database.memory_cache import TTLCache
+from education.rate_limiter import get_rate_limiter
+
+
+logger = logging.getLogger(__name__)
+
+# Varsayılan Gemini modeli
+DEFAULT_MODEL_NAME = "gemini-2.5-flash"
+
+
+# API anahtarının parmak izini üretme fonksiyonu
+def key_fingerprint(api_key: str) -> str:
+    """
+    API anahtarının parmak izini üretme fonksiyonu
+
+    Anahtarın kendisi yerine önbellek anahtarlarında ve günlüklerde bu
+    parmak izi kullanılır.
+
+    Parametreler:
+        api_key (str): Gemini API anahtarı
+
+    Döndürülenler:
+        str: 16 karakterlik SHA-256 özeti
+    """
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+# Modele özel istemci için gereken iç arayüzleri denetleme fonksiyonu
+def isolated_clients_supported() -> bool:
+    """
+    Modele özel istemci için gereken iç arayüzleri denetleme fonksiyonu
+
+    google-generativeai modele özel kimlik bilgisi için genel bir arayüz
+    sunmaz; build_isolated_model kütüphanenin iç yapısını
+    (client._ClientManager ve GenerativeModel._client) kullanır. Bu
+    fonksiyon kurulu sürümde bunların bulunup bulunmadığını denetler.
+
+    Döndürülenler:
+        bool: İç arayüzler kullanılabiliyorsa True
+    """
+    manager_class = getattr(genai_client, "_ClientManager", None)
+    if manager_class is None or not all(
+        callable(getattr(manager_class, name, None))
+        for name in ("configure", "get_default_client")
+    ):
+        return False
+    try:
+        return "_client" in vars(genai.GenerativeModel(DEFAULT_MODEL_NAME))
+    except Exception:
+        return False
+
+
+# Kurulu kütüphane modele özel istemcileri destekliyor mu
+ISOLATED_CLIENTS = isolated_clients_supported()
+if not ISOLATED_CLIENTS:
+    logger.warning(
+        "google-generativeai iç istemci arayüzü bulunamadı; Gemini "
+        "çağrıları genai.configure ile sırayla yapılacak"
+    )
+
+# Genel yapılandırmayla yapılan çağrıları sıraya sokan kilit
+_configure_lock = threading.Lock()
+
+
+# Genel yapılandırmayı kullanarak çağıran model sarmalayıcı sınıfı
+class GloballyConfiguredModel:
+    """Genel yapılandırmayı kullanarak çağıran model sarmalayıcı sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, api_key: str, model_name: str):
+        self._api_key = api_key
+        self._model = genai.GenerativeModel(model_name)
+
+    # Diğer öznitelikleri modele yönlendirme fonksiyonu
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
+
+    # Anahtarı yapılandırıp içerik oluşturma fonksiyonu
+    def generate_content(self, *args, **kwargs):
+        """
+        Anahtarı yapılandırıp içerik oluşturma fonksiyonu
+
+        genai.configure süreç genelindeki istemciyi değiştirdiğinden
+        yapılandırma ve çağrı kilit altında yapılır; böylece başka bir
+        kullanıcının anahtarı araya giremez. Model istemcisini ilk
+        çağrıda aldığı için her çağrıda yeni bir model kullanılır.
+        """
+        with _configure_lock:
+            genai.configure(api_key=self._api_key)
+            model = genai.GenerativeModel(self._model.model_name)
+            return model.generate_content(*args, **kwargs)
+
+
+# Kendi kimlik bilgisine sahip model oluşturma fonksiyonu
+def build_isolated_model(api_key: str, model_name: str):
+    """
+    Kendi kimlik bilgisine sahip model oluşturma fonksiyonu
+
+    genai.configure süreç genelindeki varsayılan istemciyi değiştirir. Bunun
+    yerine her anahtar için ayrı bir istemci yöneticisi yapılandırılıp
+    modele bağlanır. Kurulu kütüphane sürümünde gereken iç arayüzler
+    yoksa genai.configure ile kilit altında çağıran sarmalayıcı döner.
+
+    Parametreler:
+        api_key (str): Gemini API anahtarı
+        model_name (str): Gemini model adı
+
+    Döndürülenler:
+        genai.GenerativeModel: Yapılandırılmış model
+    """
+    if not ISOLATED_CLIENTS:
+        return GloballyConfiguredModel(api_key, model_name)
+
+    manager = genai_client._ClientManager()
+    manager.configure(api_key=api_key)
+
+    model = genai.GenerativeModel(model_name)
+    model._client = manager.get_default_client("generative")
+    return model
+
+
+# Gemini model önbelleği sınıfı
+class ModelCache:
+    """Gemini model önbelleği sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, max_size: int = 64, resolve_ttl: int = 300):
+        # (anahtar parmak izi, model adı) -> GenerativeModel
+        self.models = TTLCache(max_size=max_size)
+        # user_id -> (anahtar parmak izi, model adı); anahtarın kendisi
+        # burada tutulmaz, gerektiğinde ayar önbelleğinden okunur
+        self.resolved = TTLCache(max_size=max_size * 16, ttl=resolve_ttl)
+
+        self._lock = threading.Lock()
+
+        # İzleme sayaçları
+        self.built = 0
+        self.invalidations = 0
+
+    # Anahtar ve model adına göre model döndürme fonksiyonu
+    def get_model(self, api_key: str, model_name: str):
+        """
+        Anahtar ve model adına göre model döndürme fonksiyonu
+
+        Parametreler:
+            api_key (str): Gemini API anahtarı
+            model_name (str): Gemini model adı
+
+        Döndürülenler:
+            genai.GenerativeModel: Önbellekteki veya yeni oluşturulan model
+        """
+        cache_key = (key_fingerprint(api_key), model_name)
+        model = self.models.get(cache_key)
+        if model is not None:
+            return model
+
+        # Aynı anahtar için eş zamanlı iki istemci oluşturulmasını önle
+        with self._lock:
+            model = self.models.get(cache_key)
+            if model is None:
+                model = build_isolated_model(api_key, model_name)
+                self.models.set(cache_key, model)
+                self.built += 1
+        return model
+
+    # Kullanıcının modelini ve anahtar parmak izini döndürme fonksiyonu
+    def get_user_model(self, user_id: int) -> Tuple[Any, Optional[str]]:
+        """
+        Kullanıcının modelini ve anahtar parmak izini döndürme fonksiyonu
+
+        Kullanıcının anahtar parmak izi ve model adı önbellekte tutulur;
+        model önbellekteyse ayarlar okunmaz. Kayıt yoksa veya model
+        önbellekten atılmışsa anahtar ayar önbelleğinden okunur. Model,
+        anahtar ve kullanıcı bütçelerini uygulayan sınırlayıcıyla
+        sarmalanmış olarak döner.
+
+        Parametreler:
+            user_id (int): Kullanıcı ID'si
+
+        Döndürülenler:
+            Tuple: (model, anahtar parmak izi) veya anahtar yoksa
+            (None, None)
+        """
+        resolved = self.resolved.get(user_id)
+        model = self.models.get(resolved) if resolved else None
+        if model is None:
+            api_key = get_user_gemini_api_key(user_id)
+            if not api_key:
+                return None, None
+
+            user_settings = get_user_settings(user_id)
+            if not user_settings:
+                return None, None
+
+            model_name = user_settings.get("gemini_model") \
+                or DEFAULT_MODEL_NAME
+            model = self.get_model(api_key, model_name)
+            resolved = (key_fingerprint(api_key), model_name)
+            self.resolved.set(user_id, resolved)
+
+        fingerprint = resolved[0]
+        return get_rate_limiter().wrap(model, fingerprint, user_id), \
+            fingerprint
+
+    # Kullanıcının önbellek kaydını geçersiz kılma fonksiyonu
+    def invalidate_user(self, user_id: Optional[int] = None) -> None:
+        """
+        Kullanıcının önbellek kaydını geçersiz kılma fonksiyonu
+
+        Parametreler:
+            user_id (int, optional): Kullanıcı ID'si, None ise tüm
+                kullanıcıların kayıtları silinir
+        """
+        if user_id is None:
+            self.resolved.clear()
+        else:
+            self.resolved.delete(user_id)
+        with self._lock:
+            self.invalidations += 1
+
+    # Önbellek istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Any]:
+        """
+        Önbellek istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: Model ve kullanıcı çözümleme sayaçları
+        """
+        with self._lock:
+            return {
+                "models": self.models.stats(),
+                "resolved": self.resolved.stats(),
+                "built": self.built,
+                "invalidations": self.invalidations,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnek; kullanıcı kayıtları ayar önbelleğinden uzun yaşamaz
+model_cache = ModelCache(
+    max_size=int(config.get("MODEL_CACHE_SIZE", 64)),
+    resolve_ttl=min(int(config.get("MODEL_CACHE_TTL", 300)),
+                    int(config.get("SETTINGS_CACHE_TTL", 60))),
+)
+
+# Ayarlar değiştiğinde kullanıcının kaydını sil
+register_settings_listener(model_cache.invalidate_user)
+
+
+# Model önbelleği örneğini döndürme fonksiyonu
+def get_model_cache() -> ModelCache:
+    """
+    Model önbelleği örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        ModelCache: Model önbelleği nesnesi
+    """
+    return model_cache
@@ -0,0 +1,625 @@
+"""
+BTK Hackathon 2025 - Gemini İstek Sınırlayıcı Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül Gemini çağrılarını API anahtarı parmak izi ve kullanıcı başına
+dakikalık istek (RPM) ve jeton (TPM) bütçeleriyle sınırlar. Bütçeyi aşan
+istek hemen reddedilmez, kısa bir süre bekletilir; bekleme süresi
+yetmeyecekse RateLimitExceededError fırlatılır. Kullanım sayıları
+gemini_usage tablosuna toplu olarak yazılır.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import atexit
+import logging
+import math
+import threading
+import time
+
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+from database.memory_cache import TTLCache
+
+
+logger = logging.getLogger(__name__)
+
+# Boş bir dakikalık kovanın tamamen dolma süresi (saniye); kullanılmayan
+# kovalar en erken bu süre sonunda önbellekten düşer
+BUCKET_TTL = 60.0
+
+
+# Bütçe aşıldığında fırlatılan özel durum sınıfı
+class RateLimitExceededError(Exception):
+    """Bütçe aşıldığında fırlatılan özel durum sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, retry_after: float):
+        self.retry_after = max(1, math.ceil(retry_after))
+        super().__init__(
+            "Gemini istek sınırına ulaşıldı, lütfen "
+            f"{self.retry_after} saniye sonra tekrar deneyin"
+        )
+
+
+# Dakikalık bütçeli jeton kovası sınıfı
+class TokenBucket:
+    """Dakikalık bütçeli jeton kovası sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    # Geçen süreye göre kovayı doldurma fonksiyonu
+    def _refill(self, now: float) -> None:
+        """
+        Geçen süreye göre kovayı doldurma fonksiyonu
+
+        Parametreler:
+            now (float): time.monotonic() değeri
+        """
+        # Kova, now alındıktan sonra oluşturulmuş olabilir
+        elapsed = max(0.0, now - self.updated)
+        self.level = min(self.capacity, self.level + elapsed * self.rate)
+        self.updated = max(self.updated, now)
+
+    # Miktar için beklenmesi gereken süreyi hesaplama fonksiyonu
+    def wait_time(self, amount: float, now: float) -> float:
+        """
+        Miktar için beklenmesi gereken süreyi hesaplama fonksiyonu
+
+        Kova kapasitesinden büyük istekler kovanın dolmasını bekler.
+
+        Parametreler:
+            amount (float): İstenen miktar
+            now (float): time.monotonic() değeri
+
+        Döndürülenler:
+            float: Saniye cinsinden bekleme süresi, yeterliyse 0
+        """
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    # Kovanın tamamen dolması için gereken süreyi hesaplama fonksiyonu
+    def refill_time(self) -> float:
+        """
+        Kovanın tamamen dolması için gereken süreyi hesaplama fonksiyonu
+
+        Döndürülenler:
+            float: Son güncellemeden itibaren saniye cinsinden süre; kova
+            eksideyse bir dakikadan uzun olabilir
+        """
+        return max(0.0, self.capacity - self.level) / self.rate
+
+    # Kovadan miktar düşme fonksiyonu
+    def take(self, amount: float) -> None:
+        """
+        Kovadan miktar düşme fonksiyonu
+
+        Parametreler:
+            amount (float): Düşülecek miktar; kova eksiye düşebilir
+        """
+        self.level -= amount
+
+
+# Gemini istek sınırlayıcı sınıfı
+class GeminiRateLimiter:
+    """Gemini istek sınırlayıcı sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        key_rpm: int = 60,
+        key_tpm: int = 1000000,
+        user_rpm: int = 10,
+        user_tpm: int = 250000,
+        max_wait: float = 10.0,
+        output_estimate: int = 4096,
+        max_buckets: int = 8192,
+    ):
+        # 0 değerli bütçeler kapalıdır
+        self.budgets = {
+            "key": (int(key_rpm), int(key_tpm)),
+            "user": (int(user_rpm), int(user_tpm)),
+        }
+        self.max_wait = max(0.0, float(max_wait))
+        self.output_estimate = max(0, int(output_estimate))
+
+        # (tür, kimlik, "rpm" | "tpm") -> TokenBucket; kovalar en az
+        # dolana kadar (bir dakika) tutulur, böylece kimlik değişimi
+        # sınırları sıfırlamaz
+        self._buckets = TTLCache(max_size=max_buckets, ttl=BUCKET_TTL)
+        self._lock = threading.Lock()
+
+        # İzleme sayaçları
+        self.admitted = 0
+        self.waited = 0
+        self.rejected = 0
+        self.total_wait_ms = 0.0
+        self.tokens = 0
+
+    # İlgili kovaları döndürme fonksiyonu
+    def _buckets_for(
+        self, fingerprint: str, user_id: Optional[int]
+    ) -> List[Tuple[TokenBucket, str]]:
+        """
+        İlgili kovaları döndürme fonksiyonu
+
+        Kilit tutulurken çağrılmalıdır. Kullanılan her kovanın önbellekte
+        kalma süresi kova dolana kadar uzatılır.
+
+        Parametreler:
+            fingerprint (str): API anahtarı parmak izi
+            user_id (int, optional): Kullanıcı ID'si
+
+        Döndürülenler:
+            List[Tuple[TokenBucket, str]]: (kova, "rpm" veya "tpm")
+        """
+        buckets = []
+        for kind, ident in (("key", fingerprint), ("user", user_id)):
+            if ident is None:
+                continue
+            for unit, per_minute in zip(("rpm", "tpm"), self.budgets[kind]):
+                if per_minute <= 0:
+                    continue
+                cache_key = (kind, ident, unit)
+                bucket = self._buckets.get(cache_key)
+                if bucket is None:
+                    bucket = TokenBucket(per_minute)
+                self._buckets.set(
+                    cache_key, bucket,
+                    ttl=BUCKET_TTL + bucket.refill_time(),
+                )
+                buckets.append((bucket, unit))
+        return buckets
+
+    # İstek için bütçe ayırma fonksiyonu
+    def acquire(
+        self, fingerprint: str, user_id: Optional[int], tokens: int
+    ) -> None:
+        """
+        İstek için bütçe ayırma fonksiyonu
+
+        Bütçe yetersizse en fazla max_wait saniye beklenir. Gereken süre
+        bundan uzunsa beklemeden RateLimitExceededError fırlatılır.
+
+        Parametreler:
+            fingerprint (str): API anahtarı parmak izi
+            user_id (int, optional): Kullanıcı ID'si
+            tokens (int): Tahmini jeton sayısı
+        """
+        amounts = {"rpm": 1, "tpm": tokens}
+        started = time.monotonic()
+        deadline = started + self.max_wait
+        slept = False
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                buckets = self._buckets_for(fingerprint, user_id)
+                wait = max((bucket.wait_time(amounts[unit], now)
+                            for bucket, unit in buckets), default=0.0)
+                if wait <= 0:
+                    for bucket, unit in buckets:
+                        bucket.take(amounts[unit])
+                    self.admitted += 1
+                    self.tokens += tokens
+                    if slept:
+                        self.waited += 1
+                        self.total_wait_ms += (now - started) * 1000
+                    return
+                if now + wait > deadline:
+                    self.rejected += 1
+                    raise RateLimitExceededError(wait)
+            time.sleep(wait)
+            slept = True
+
+    # Beklemeden bütçe ayırmayı deneme fonksiyonu
+    def try_acquire(
+        self, fingerprint: str, user_id: Optional[int], tokens: int
+    ) -> bool:
+        """
+        Beklemeden bütçe ayırmayı deneme fonksiyonu
+
+        Yedek istek gibi ertelenebilir işler için kullanılır; bütçe hemen
+        yetmiyorsa hiçbir kovadan düşülmez.
+
+        Parametreler:
+            fingerprint (str): API anahtarı parmak izi
+            user_id (int, optional): Kullanıcı ID'si
+            tokens (int): Tahmini jeton sayısı
+
+        Döndürülenler:
+            bool: Bütçe ayrıldıysa True
+        """
+        amounts = {"rpm": 1, "tpm": tokens}
+        with self._lock:
+            now = time.monotonic()
+            buckets = self._buckets_for(fingerprint, user_id)
+            if any(bucket.wait_time(amounts[unit], now) > 0
+                   for bucket, unit in buckets):
+                return False
+            for bucket, unit in buckets:
+                bucket.take(amounts[unit])
+            self.admitted += 1
+            self.tokens += tokens
+            return True
+
+    # Gerçek jeton kullanımına göre kovaları düzeltme fonksiyonu
+    def settle(
+        self, fingerprint: str, user_id: Optional[int], delta: int
+    ) -> None:
+        """
+        Gerçek jeton kullanımına göre kovaları düzeltme fonksiyonu
+
+        Parametreler:
+            fingerprint (str): API anahtarı parmak izi
+            user_id (int, optional): Kullanıcı ID'si
+            delta (int): Tahminden fazla harcanan jeton; eksi ise iade
+        """
+        if not delta:
+            return
+        with self._lock:
+            for bucket, unit in self._buckets_for(fingerprint, user_id):
+                if unit == "tpm":
+                    bucket.take(delta)
+            self.tokens += delta
+
+    # İstemin jeton sayısını tahmin etme fonksiyonu
+    def estimate_tokens(self, contents: Any) -> int:
+        """
+        İstemin jeton sayısını tahmin etme fonksiyonu
+
+        Yaklaşık dört karakter bir jeton sayılır ve yanıt için
+        output_estimate eklenir.
+
+        Parametreler:
+            contents (Any): generate_content'e verilen içerik
+
+        Döndürülenler:
+            int: Tahmini toplam jeton sayısı
+        """
+        return len(str(contents)) // 4 + self.output_estimate
+
+    # Modeli sınırlayıcıyla sarmalama fonksiyonu
+    def wrap(
+        self, model, fingerprint: str, user_id: Optional[int] = None
+    ) -> "RateLimitedModel":
+        """
+        Modeli sınırlayıcıyla sarmalama fonksiyonu
+
+        Parametreler:
+            model (genai.GenerativeModel): Gemini modeli
+            fingerprint (str): API anahtarı parmak izi
+            user_id (int, optional): Kullanıcı ID'si
+
+        Döndürülenler:
+            RateLimitedModel: Sarmalanmış model
+        """
+        return RateLimitedModel(model, self, fingerprint, user_id)
+
+    # Sınırlayıcı istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Any]:
+        """
+        Sınırlayıcı istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: Kabul edilen, bekletilen ve reddedilen istekler
+        """
+        with self._lock:
+            return {
+                "key_rpm": self.budgets["key"][0],
+                "key_tpm": self.budgets["key"][1],
+                "user_rpm": self.budgets["user"][0],
+                "user_tpm": self.budgets["user"][1],
+                "admitted": self.admitted,
+                "waited": self.waited,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_ms / self.waited, 2)
+                if self.waited else 0.0,
+                "tokens": self.tokens,
+                "buckets": len(self._buckets),
+                "bucket_evictions": self._buckets.evictions,
+            }
+
+
+# Sınırlayıcıdan geçen model sarmalayıcı sınıfı
+class RateLimitedModel:
+    """Sınırlayıcıdan geçen model sarmalayıcı sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        model,
+        limiter: GeminiRateLimiter,
+        fingerprint: str,
+        user_id: Optional[int] = None,
+    ):
+        self._model = model
+        self._limiter = limiter
+        self._fingerprint = fingerprint
+        self._user_id = user_id
+
+        # Devre kesici gibi anahtar başına tutulan durumlar için
+        self.key_fingerprint = fingerprint
+
+    # Diğer öznitelikleri modele yönlendirme fonksiyonu
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._model, name)
+
+    # Yanıttaki gerçek jeton sayısıyla bütçeyi düzeltme fonksiyonu
+    def _settle(self, response, estimate: int) -> None:
+        """
+        Yanıttaki gerçek jeton sayısıyla bütçeyi düzeltme fonksiyonu
+
+        Parametreler:
+            response: Gemini yanıtı
+            estimate (int): Ayrılan tahmini jeton sayısı
+        """
+        usage = getattr(response, "usage_metadata", None)
+        actual = getattr(usage, "total_token_count", 0) if usage else 0
+        if actual:
+            self._limiter.settle(self._fingerprint, self._user_id,
+                                 actual - estimate)
+
+    # Akış yanıtını bitince bütçeyi düzelterek iletme fonksiyonu
+    def _stream(self, response, estimate: int) -> Iterator[Any]:
+        """
+        Akış yanıtını bitince bütçeyi düzelterek iletme fonksiyonu
+
+        Parametreler:
+            response: Gemini akış yanıtı
+            estimate (int): Ayrılan tahmini jeton sayısı
+        """
+        yield from response
+        self._settle(response, estimate)
+
+    # Bütçe ayırıp içerik oluşturma fonksiyonu
+    def generate_content(self, contents, *args, stream: bool = False,
+                         **kwargs):
+        """
+        Bütçe ayırıp içerik oluşturma fonksiyonu
+
+        GenerativeModel.generate_content ile aynı parametreleri alır.
+        Akış kipinde yanıt parçalarını döndüren bir üreteç döner.
+        """
+        estimate = self._limiter.estimate_tokens(contents)
+        self._limiter.acquire(self._fingerprint, self._user_id, estimate)
+        return self.generate_reserved(contents, estimate, *args,
+                                      stream=stream, **kwargs)
+
+    # Beklemeden bütçe ayırmayı deneme fonksiyonu
+    def try_reserve(self, contents) -> Optional[int]:
+        """
+        Beklemeden bütçe ayırmayı deneme fonksiyonu
+
+        Parametreler:
+            contents: İstem
+
+        Döndürülenler:
+            int: Ayrılan tahmini jeton sayısı, bütçe yetmiyorsa None
+        """
+        estimate = self._limiter.estimate_tokens(contents)
+        if self._limiter.try_acquire(self._fingerprint, self._user_id,
+                                     estimate):
+            return estimate
+        return None
+
+    # Önceden ayrılan bütçeyle içerik oluşturma fonksiyonu
+    def generate_reserved(self, contents, estimate: int, *args,
+                          stream: bool = False, **kwargs):
+        """
+        Önceden ayrılan bütçeyle içerik oluşturma fonksiyonu
+
+        Bütçe tekrar düşülmez; istek bir kez kullanım sayacına yazılır.
+
+        Parametreler:
+            contents: İstem
+            estimate (int): acquire veya try_reserve ile ayrılan jeton
+            stream (bool): Akış kipi
+        """
+        usage_recorder.record(self._user_id, self._fingerprint)
+
+        try:
+            response = self._model.generate_content(
+                contents, *args, stream=stream, **kwargs
+            )
+        except Exception:
+            # İstek Gemini'ye ulaşmadıysa jetonları iade et
+            self._limiter.settle(self._fingerprint, self._user_id,
+                                 -estimate)
+            raise
+
+        if stream:
+            return self._stream(response, estimate)
+        self._settle(response, estimate)
+        return response
+
+
+# API anahtarı kullanım sayaçlarını toplu yazma sınıfı
+class UsageRecorder:
+    """API anahtarı kullanım sayaçlarını toplu yazma sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(self, flush_interval: float = 30.0):
+        self.flush_interval = max(1.0, float(flush_interval))
+        self.db = get_db()
+
+        # (user_id, parmak izi) -> [istek sayısı, son kullanım zamanı]
+        self._pending: Dict[Tuple[int, str], list] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # İzleme sayaçları
+        self.recorded = 0
+        self.flushed_rows = 0
+        self.flush_errors = 0
+
+    # Arka plan yazma iş parçacığını başlatma fonksiyonu
+    def _ensure_started(self) -> None:
+        """
+        Arka plan yazma iş parçacığını başlatma fonksiyonu
+
+        Kilit tutulurken çağrılmalıdır.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="gemini-usage-flush", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    # İsteği sayaçlara ekleme fonksiyonu
+    def record(self, user_id: Optional[int], fingerprint: str) -> None:
+        """
+        İsteği sayaçlara ekleme fonksiyonu
+
+        Parametreler:
+            user_id (int, optional): Kullanıcı ID'si; yoksa kayıt yapılmaz
+            fingerprint (str): API anahtarı parmak izi
+        """
+        if user_id is None:
+            return
+        with self._lock:
+            entry = self._pending.setdefault((user_id, fingerprint), [0, None])
+            entry[0] += 1
+            entry[1] = datetime.now()
+            self.recorded += 1
+            self._ensure_started()
+
+    # Arka plan yazma döngüsü fonksiyonu
+    def _run(self) -> None:
+        """
+        Arka plan yazma döngüsü fonksiyonu
+        """
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    # Bekleyen sayaçları veri tabanına yazma fonksiyonu
+    def flush(self) -> int:
+        """
+        Bekleyen sayaçları veri tabanına yazma fonksiyonu
+
+        Her (kullanıcı, anahtar parmak izi) çifti gemini_usage tablosunda
+        bir satırda tutulur; sayaçlar tek bir execute_many ile artırılır.
+        Yazılamayan sayaçlar arabelleğe geri eklenir.
+
+        Döndürülenler:
+            int: Yazılan satır sayısı
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+
+            rows = [
+                (user_id, fingerprint, count, last_used)
+                for (user_id, fingerprint), (count, last_used)
+                in pending.items()
+            ]
+            try:
+                self.db.execute_many(
+                    """INSERT INTO gemini_usage
+                        (user_id, key_fingerprint, request_count, last_used)
+                        VALUES (%s, %s, %s, %s)
+                        ON DUPLICATE KEY UPDATE
+                         request_count = request_count + VALUES(request_count),
+                         last_used = GREATEST(
+                             COALESCE(last_used, VALUES(last_used)),
+                             VALUES(last_used))""",
+                    rows,
+                )
+            except Exception as e:
+                logger.error(f"API anahtarı kullanımı yazılamadı: {e}")
+                with self._lock:
+                    self.flush_errors += 1
+                    for key, (count, last_used) in pending.items():
+                        entry = self._pending.setdefault(key, [0, last_used])
+                        entry[0] += count
+                return 0
+
+            with self._lock:
+                self.flushed_rows += len(rows)
+            return len(rows)
+
+    # Yazıcıyı durdurma ve son sayaçları yazma fonksiyonu
+    def stop(self) -> None:
+        """
+        Yazıcıyı durdurma ve son sayaçları yazma fonksiyonu
+
+        Uygulama kapanırken atexit ile çağrılır.
+        """
+        self._stop.set()
+        if self._thread is not None and \
+                self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval)
+        self.flush()
+
+    # Yazıcı istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Any]:
+        """
+        Yazıcı istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: Bekleyen satırlar ve yazma sayaçları
+        """
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "recorded": self.recorded,
+                "flushed_rows": self.flushed_rows,
+                "flush_errors": self.flush_errors,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnekler
+rate_limiter = GeminiRateLimiter(
+    key_rpm=int(config.get("GEMINI_KEY_RPM", 60)),
+    key_tpm=int(config.get("GEMINI_KEY_TPM", 1000000)),
+    user_rpm=int(config.get("GEMINI_USER_RPM", 10)),
+    user_tpm=int(config.get("GEMINI_USER_TPM", 250000)),
+    max_wait=float(config.get("GEMINI_RATE_MAX_WAIT", 10)),
+    output_estimate=int(config.get("GEMINI_OUTPUT_TOKEN_ESTIMATE", 4096)),
+    max_buckets=int(config.get("GEMINI_RATE_MAX_BUCKETS", 8192)),
+)
+usage_recorder = UsageRecorder(
+    flush_interval=float(config.get("GEMINI_USAGE_FLUSH_INTERVAL", 30)),
+)
+
+
+# İstek sınırlayıcı örneğini döndürme fonksiyonu
+def get_rate_limiter() -> GeminiRateLimiter:
+    """
+    İstek sınırlayıcı örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        GeminiRateLimiter: İstek sınırlayıcı nesnesi
+    """
+    return rate_limiter
+
+
+# Kullanım sayacı yazıcısı örneğini döndürme fonksiyonu
+def get_usage_recorder() -> UsageRecorder:
+    """
+    Kullanım sayacı yazıcısı örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        UsageRecorder: Kullanım sayacı yazıcısı nesnesi
+    """
+    return usage_recorder
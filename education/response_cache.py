@@ -0,0 +1,315 @@
+"""
+BTK Hackathon 2025 - Eğitim Yanıt Önbelleği Modülü
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu modül aynı parametrelerle istenen eğitimleri, istem parametrelerinin
+özetiyle adreslenen bir önbellekten sunar. Önde bellek içi LRU, arkada
+education_cache tablosu bulunur.
+"""
+
+
+# Gerekli kütüphanelerin içe aktarılması
+import hashlib
+import json
+import logging
+import threading
+
+from typing import Any, Dict, Optional, Tuple
+
+from config.config_loader import load_config
+from database.database_connection import get_db
+from database.memory_cache import TTLCache
+from education.generate_education import generate_education
+
+
+logger = logging.getLogger(__name__)
+
+
+# Eğitim yanıt önbelleği sınıfı
+class EducationCache:
+    """Eğitim yanıt önbelleği sınıfı"""
+
+    # Yapıcı fonksiyon
+    def __init__(
+        self,
+        enabled: bool = True,
+        ttl: int = 604800,
+        memory_size: int = 256,
+        max_entries: int = 5000,
+        eviction_interval: int = 50,
+    ):
+        self.enabled = enabled
+        self.ttl = int(ttl)
+        self.max_entries = int(max_entries)
+        self.eviction_interval = max(1, int(eviction_interval))
+        self.memory = TTLCache(max_size=memory_size, ttl=self.ttl)
+        self.db = get_db()
+
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        # İzleme sayaçları
+        self.db_hits = 0
+        self.db_misses = 0
+        self.stores = 0
+        self.evicted = 0
+
+    # İstem parametrelerinden önbellek anahtarı üretme fonksiyonu
+    @staticmethod
+    def make_key(
+        subject: str,
+        duration: str,
+        lesson_duration: int,
+        question_count: int,
+        model_name: str,
+    ) -> str:
+        """
+        İstem parametrelerinden önbellek anahtarı üretme fonksiyonu
+
+        Ders adı büyük/küçük harf ve boşluk farklarından arındırılır;
+        böylece "Python" ile " python " aynı anahtarı üretir.
+
+        Parametreler:
+            subject (str): Ders adı
+            duration (str): Eğitim süresi
+            lesson_duration (int): Ders süresi (dakika)
+            question_count (int): Ders başına soru sayısı
+            model_name (str): Gemini model adı
+
+        Döndürülenler:
+            str: SHA-256 özeti
+        """
+        normalized = json.dumps(
+            {
+                "subject": " ".join(subject.split()).casefold(),
+                "duration": " ".join(str(duration).split()).casefold(),
+                "lesson_duration": int(lesson_duration),
+                "question_count": int(question_count),
+                "model": model_name,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    # Önbellekten eğitim alma fonksiyonu
+    def get(self, key: str) -> Optional[str]:
+        """
+        Önbellekten eğitim alma fonksiyonu
+
+        Parametreler:
+            key (str): Önbellek anahtarı
+
+        Döndürülenler:
+            str | None: Önbellekteki eğitim içeriği veya None
+        """
+        if not self.enabled:
+            return None
+
+        content = self.memory.get(key)
+        if content is not None:
+            return content
+
+        try:
+            row = self.db.execute_single(
+                """SELECT content FROM education_cache
+                    WHERE cache_key = %s AND expires_at > NOW()""",
+                (key,),
+            )
+        except Exception as e:
+            logger.error(f"Eğitim önbelleği okuma hatası: {e}")
+            return None
+
+        with self._lock:
+            if row:
+                self.db_hits += 1
+            else:
+                self.db_misses += 1
+        if not row:
+            return None
+
+        self.memory.set(key, row["content"])
+        try:
+            self.db.execute_update(
+                """UPDATE education_cache SET hit_count = hit_count + 1
+                    WHERE cache_key = %s""",
+                (key,),
+            )
+        except Exception as e:
+            logger.debug(f"Önbellek isabet sayacı güncellenemedi: {e}")
+        return row["content"]
+
+    # Önbelleğe eğitim yazma fonksiyonu
+    def set(self, key: str, subject: str, model_name: str,
+            content: str) -> None:
+        """
+        Önbelleğe eğitim yazma fonksiyonu
+
+        Parametreler:
+            key (str): Önbellek anahtarı
+            subject (str): Ders adı
+            model_name (str): Gemini model adı
+            content (str): Eğitim içeriği
+        """
+        if not self.enabled:
+            return
+
+        self.memory.set(key, content)
+        try:
+            self.db.execute_update(
+                """INSERT INTO education_cache
+                    (cache_key, model_name, subject, content, content_size,
+                     expires_at)
+                    VALUES (%s, %s, %s, %s, %s,
+                            NOW() + INTERVAL %s SECOND)
+                    ON DUPLICATE KEY UPDATE
+                     content = VALUES(content),
+                     content_size = VALUES(content_size),
+                     created_at = NOW(),
+                     expires_at = VALUES(expires_at)""",
+                (key, model_name, subject[:200], content,
+                 len(content.encode("utf-8")), self.ttl),
+            )
+        except Exception as e:
+            logger.error(f"Eğitim önbelleği yazma hatası: {e}")
+            return
+
+        with self._lock:
+            self.stores += 1
+            self._writes += 1
+            evict = self._writes % self.eviction_interval == 0
+        if evict:
+            self.evict()
+
+    # Süresi dolan ve boyut sınırını aşan kayıtları silme fonksiyonu
+    def evict(self) -> int:
+        """
+        Süresi dolan ve boyut sınırını aşan kayıtları silme fonksiyonu
+
+        Döndürülenler:
+            int: Silinen kayıt sayısı
+        """
+        try:
+            removed = self.db.execute_update(
+                "DELETE FROM education_cache WHERE expires_at <= NOW()"
+            )
+            removed += self.db.execute_update(
+                """DELETE FROM education_cache WHERE cache_key IN (
+                    SELECT cache_key FROM (
+                        SELECT cache_key FROM education_cache
+                         ORDER BY created_at DESC
+                         LIMIT 18446744073709551615 OFFSET %s
+                    ) AS old_entries
+                )""",
+                (self.max_entries,),
+            )
+        except Exception as e:
+            logger.error(f"Eğitim önbelleği temizleme hatası: {e}")
+            return 0
+
+        with self._lock:
+            self.evicted += removed
+        if removed:
+            logger.info(f"Eğitim önbelleğinden {removed} kayıt silindi")
+        return removed
+
+    # Önbellek istatistiklerini döndürme fonksiyonu
+    def stats(self) -> Dict[str, Any]:
+        """
+        Önbellek istatistiklerini döndürme fonksiyonu
+
+        Döndürülenler:
+            Dict[str, Any]: Bellek ve veri tabanı katmanı sayaçları
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "memory": self.memory.stats(),
+                "db_hits": self.db_hits,
+                "db_misses": self.db_misses,
+                "stores": self.stores,
+                "evicted": self.evicted,
+            }
+
+
+# Yapılandırma ayarlarını yükle
+config = load_config()
+
+# Tekil örnek
+education_cache = EducationCache(
+    enabled=str(config.get("EDU_CACHE_ENABLED", "True")).lower() == "true",
+    ttl=int(config.get("EDU_CACHE_TTL", 604800)),
+    memory_size=int(config.get("EDU_CACHE_MEMORY_SIZE", 256)),
+    max_entries=int(config.get("EDU_CACHE_MAX_ENTRIES", 5000)),
+)
+
+
+# Eğitim önbelleği örneğini döndürme fonksiyonu
+def get_education_cache() -> EducationCache:
+    """
+    Eğitim önbelleği örneğini döndürme fonksiyonu
+
+    Döndürülenler:
+        EducationCache: Eğitim önbelleği nesnesi
+    """
+    return education_cache
+
+
+# Eğitim parametreleri ve modelden önbellek anahtarı üretme fonksiyonu
+def education_cache_key(
+    subject,
+    duration="5 hafta",
+    lesson_duration=30,
+    question_count=5,
+    model=None
+) -> str:
+    """
+    Eğitim parametreleri ve modelden önbellek anahtarı üretme fonksiyonu
+
+    Parametreler generate_education ile aynıdır.
+
+    Döndürülenler:
+        str: Önbellek anahtarı
+    """
+    return education_cache.make_key(
+        subject, duration, lesson_duration, question_count,
+        getattr(model, "model_name", ""),
+    )
+
+
+# Önbellek destekli eğitim oluşturma fonksiyonu
+def generate_education_cached(
+    subject,
+    duration="5 hafta",
+    lesson_duration=30,
+    question_count=5,
+    model=None,
+    bypass_cache=False
+) -> Tuple[str, bool]:
+    """
+    Önbellek destekli eğitim oluşturma fonksiyonu
+
+    Aynı parametrelerle daha önce oluşturulmuş bir eğitim varsa Gemini
+    çağrılmadan önbellekten döndürülür. bypass_cache verilirse önbellek
+    okunmaz ancak yeni sonuç önbelleğe yazılır. Hatalı sonuçlar
+    önbelleğe alınmaz.
+
+    Döndürülenler:
+        Tuple[str, bool]: (Eğitim içeriği, önbellekten gelip gelmediği)
+    """
+    key = education_cache_key(subject, duration, lesson_duration,
+                              question_count, model)
+
+    if not bypass_cache:
+        content = education_cache.get(key)
+        if content is not None:
+            return content, True
+
+    content = generate_education(subject, duration, lesson_duration,
+                                 question_count, model=model)
+    if not content.startswith("Hata oluştu:"):
+        education_cache.set(key, subject,
+                            getattr(model, "model_name", ""), content)
+    return content, False
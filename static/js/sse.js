@@ -0,0 +1,34 @@
+/*
+ * BTK Hackathon 2025 - Sunucu Gönderimli Olay (SSE) Yardımcıları
+ *
+ * Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+ * Tüm hakları saklıdır.
+ */
+
+function escapeHtml(text) {
+    return text.replace(/</g, '&lt;').replace(/>/g, '&gt;');
+}
+
+// Sunucu gönderimli olayları (SSE) okuyup her olay için geri çağırır
+async function readEvents(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const raw = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+            let event = 'message';
+            let data = '';
+            raw.split('\n').forEach(line => {
+                if (line.startsWith('event: ')) event = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            });
+            onEvent(event, data ? JSON.parse(data) : {});
+        }
+    }
+}
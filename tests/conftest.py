@@ -0,0 +1,18 @@
+"""
+BTK Hackathon 2025 - Birim Sınamaları Ortak Ayarları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Sınamalar proje kök dizinindeki paketleri (config, database, education)
+içe aktardığından kök dizin modül arama yoluna eklenir.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import os
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
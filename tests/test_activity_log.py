@@ -0,0 +1,105 @@
+"""
+BTK Hackathon 2025 - Kullanıcı Etkinlik Günlüğü Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya yazılamayan etkinlik kayıtlarının kaybolmadığını veri tabanına
+bağlanmadan sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from mysql.connector import IntegrityError, OperationalError  # noqa: E402
+
+from database import activity_log  # noqa: E402
+from database.activity_log import ActivityLogger  # noqa: E402
+
+
+# Yazılan kayıtları tutan ve istenen hataları veren sahte veri tabanı
+class FakeDatabase:
+    """Yazılan kayıtları tutan ve istenen hataları veren sahte veri tabanı"""
+
+    def __init__(self):
+        self.rows = []
+        self.offline = False
+        self.deleted_users = set()
+
+    def _check(self, record):
+        if self.offline:
+            raise OperationalError("bağlantı koptu")
+        if record[0] in self.deleted_users:
+            raise IntegrityError("yabancı anahtar hatası")
+
+    def execute_many(self, query, records):
+        for record in records:
+            self._check(record)
+        self.rows.extend(records)
+
+    def execute_update(self, query, record):
+        self._check(record)
+        self.rows.append(record)
+        return 1
+
+
+# Sahte veri tabanını kuran fonksiyon
+@pytest.fixture
+def database(monkeypatch):
+    fake = FakeDatabase()
+    monkeypatch.setattr(activity_log, "get_db", lambda: fake)
+    return fake
+
+
+# Arka plan iş parçacığı başlatmayan yazıcı oluşturma fonksiyonu
+def make_logger(**kwargs):
+    logger = ActivityLogger(**kwargs)
+    logger._thread = object()
+    return logger
+
+
+# Bağlantı hatasında grubun arabelleğe geri konmasını sınayan fonksiyon
+def test_failed_batch_is_requeued(database):
+    logger = make_logger(batch_size=2)
+    for user_id in (1, 2, 3):
+        logger.log(user_id, "login")
+
+    database.offline = True
+    assert logger.flush() == 0
+    assert logger.stats()["buffer_size"] == 3
+    assert logger.stats()["requeued"] == 2
+
+    database.offline = False
+    assert logger.flush() == 3
+    assert [row[0] for row in database.rows] == [1, 2, 3]
+
+
+# Bütünlük hatasında yalnızca hatalı kaydın atılmasını sınayan fonksiyon
+def test_integrity_error_drops_only_bad_rows(database):
+    logger = make_logger(batch_size=10)
+    for user_id in (1, 2, 3):
+        logger.log(user_id, "login")
+
+    database.deleted_users.add(2)
+    assert logger.flush() == 2
+    assert [row[0] for row in database.rows] == [1, 3]
+    assert logger.stats()["failed"] == 1
+
+
+# Geri konan grup sığmazsa en eski kayıtların düşürülmesini sınayan
+# fonksiyon
+def test_requeue_keeps_newest_records(database):
+    logger = make_logger(capacity=3, batch_size=3)
+    for user_id in (1, 2, 3):
+        logger.log(user_id, "login")
+    batch = [logger._buffer.popleft() for _ in range(3)]
+    logger.log(4, "login")
+
+    logger._requeue(batch)
+
+    assert [record[0] for record in logger._buffer] == [2, 3, 4]
+    assert logger.stats()["dropped"] == 1
@@ -0,0 +1,140 @@
+"""
+BTK Hackathon 2025 - Oturum Yönetimi Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya oturum kaydının, son giriş zamanı yazma arabelleği açık da kapalı
+da olsa bir işlem içinde yazıldığını veri tabanına bağlanmadan sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("bcrypt")
+pytest.importorskip("flask")
+
+from contextlib import contextmanager  # noqa: E402
+
+from auth import auth_manager  # noqa: E402
+from auth.auth_manager import (  # noqa: E402
+    AuthenticationError,
+    LAST_LOGIN_QUERY,
+    SessionManager,
+)
+
+
+# Sorguları işlemleriyle birlikte kaydeden sahte imleç sınıfı
+class FakeCursor:
+    """Sorguları işlemleriyle birlikte kaydeden sahte imleç sınıfı"""
+
+    def __init__(self, database):
+        self.database = database
+
+    def execute(self, query, params=None):
+        if self.database.fail_on and self.database.fail_on in query:
+            raise RuntimeError("bağlantı koptu")
+        self.database.pending.append((query, params))
+
+
+# İşlemleri onaylanan ve geri alınan sorgulara ayıran sahte veri tabanı
+class FakeDatabase:
+    """İşlemleri onaylanan ve geri alınan sorgulara ayıran sahte veri tabanı"""
+
+    def __init__(self):
+        self.committed = []
+        self.rolled_back = []
+        self.pending = []
+        self.fail_on = None
+
+    @contextmanager
+    def transaction(self, dictionary=True):
+        self.pending = []
+        try:
+            yield FakeCursor(self)
+            self.committed.append(self.pending)
+        except Exception:
+            self.rolled_back.append(self.pending)
+            raise
+
+    def execute_insert(self, query, params=None):
+        raise AssertionError("Sorgu işlem dışında çalıştırıldı")
+
+    def execute_update(self, query, params=None):
+        raise AssertionError("Sorgu işlem dışında çalıştırıldı")
+
+
+# Giriş zamanlarını bellekte toplayan sahte arabellek sınıfı
+class FakeBuffer:
+    """Giriş zamanlarını bellekte toplayan sahte arabellek sınıfı"""
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.recorded = []
+
+    def record(self, user_id):
+        self.recorded.append(user_id)
+
+
+# Sahte veri tabanını kuran fonksiyon
+@pytest.fixture
+def database(monkeypatch):
+    fake = FakeDatabase()
+    monkeypatch.setattr(auth_manager, "get_db", lambda: fake)
+    return fake
+
+
+# Arabellek açık ve kapalı yapılandırmalarını kuran fonksiyon
+@pytest.fixture(params=[False, True], ids=["unbuffered", "buffered"])
+def buffer(request, monkeypatch):
+    fake = FakeBuffer(enabled=request.param)
+    monkeypatch.setattr(auth_manager, "get_last_login_buffer", lambda: fake)
+    return fake
+
+
+# Oturum kaydının her iki yapılandırmada da bir işlemde yazılmasını
+# sınayan fonksiyon
+def test_create_session_writes_in_one_transaction(database, buffer):
+    token = SessionManager().create_session(7, "127.0.0.1", "pytest")
+
+    assert len(database.committed) == 1
+    statements = database.committed[0]
+    insert, insert_params = statements[0]
+    assert "INSERT INTO user_sessions" in insert
+    assert insert_params[:2] == (7, token)
+
+    if buffer.enabled:
+        # Giriş zamanı arabelleğe bırakılır, işlemde güncellenmez
+        assert len(statements) == 1
+        assert buffer.recorded == [7]
+    else:
+        assert statements[1] == (LAST_LOGIN_QUERY, (7,))
+        assert buffer.recorded == []
+
+
+# Oturum kaydı başarısız olunca giriş zamanının yazılmamasını sınayan
+# fonksiyon
+def test_failed_insert_records_nothing(database, buffer):
+    database.fail_on = "INSERT INTO user_sessions"
+
+    with pytest.raises(AuthenticationError):
+        SessionManager().create_session(7)
+
+    assert database.committed == []
+    assert len(database.rolled_back) == 1
+    assert buffer.recorded == []
+
+
+# Son giriş güncellemesi başarısız olunca oturumun geri alınmasını sınayan
+# fonksiyon
+def test_failed_update_rolls_back_session(database, monkeypatch):
+    monkeypatch.setattr(auth_manager, "get_last_login_buffer",
+                        lambda: FakeBuffer(enabled=False))
+    database.fail_on = "UPDATE users"
+
+    with pytest.raises(AuthenticationError):
+        SessionManager().create_session(7)
+
+    assert database.committed == []
+    assert len(database.rolled_back) == 1
@@ -0,0 +1,116 @@
+"""
+BTK Hackathon 2025 - Toplu Ödev Değerlendirme Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya JSON, JSONL ve ZIP gönderimlerinin okunmasını sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import io
+import zipfile
+
+import pytest
+
+pytest.importorskip("google.api_core")
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from education.batch_evaluation import (  # noqa: E402
+    BatchSubmissionError,
+    parse_json_submissions,
+    parse_jsonl_submissions,
+    parse_zip_submissions,
+)
+
+
+# Verilen dosyalarla bellekte ZIP arşivi oluşturan fonksiyon
+def make_zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in files.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+# Metin ve nesne gönderimlerinin okunmasını sınayan fonksiyon
+def test_json_accepts_text_and_objects():
+    submissions = parse_json_submissions(
+        ["  Birinci öğrencinin ödevi  ",
+         {"student": "Ayşe", "assignment_text": "İkinci öğrencinin ödevi"}],
+        max_items=5,
+    )
+
+    assert submissions == [
+        {"name": "Ödev 1", "assignment_text": "Birinci öğrencinin ödevi"},
+        {"name": "Ayşe", "assignment_text": "İkinci öğrencinin ödevi"},
+    ]
+
+
+# Geçersiz JSON gönderimlerinin reddedilmesini sınayan fonksiyon
+@pytest.mark.parametrize("items, message", [
+    ([], "boş olmayan"),
+    ("metin", "boş olmayan"),
+    (["yeterince uzun ödev"] * 3, "en fazla 2"),
+    ([42], "1. gönderim"),
+    (["yeterince uzun ödev", {"name": "x"}], "2. gönderimde"),
+    (["kısa"], "en az"),
+])
+def test_json_rejects_invalid_items(items, message):
+    with pytest.raises(BatchSubmissionError, match=message):
+        parse_json_submissions(items, max_items=2)
+
+
+# JSONL satırlarının okunmasını sınayan fonksiyon
+def test_jsonl_skips_blank_lines():
+    data = (
+        '\ufeff"Birinci öğrencinin ödevi"\n\n'
+        '{"name": "Can", "assignment_text": "İkinci öğrencinin ödevi"}\n'
+    ).encode("utf-8")
+    submissions = parse_jsonl_submissions(data, max_items=5)
+
+    assert [item["name"] for item in submissions] == ["Ödev 1", "Can"]
+
+
+# Bozuk JSONL dosyalarının reddedilmesini sınayan fonksiyon
+@pytest.mark.parametrize("data, message", [
+    (b'"yeterince uzun odev"\n{bozuk\n', "2. satırı"),
+    (b"\xff\xfe", "UTF-8"),
+])
+def test_jsonl_rejects_invalid_files(data, message):
+    with pytest.raises(BatchSubmissionError, match=message):
+        parse_jsonl_submissions(data, max_items=5)
+
+
+# ZIP arşivindeki metin dosyalarının okunmasını sınayan fonksiyon
+def test_zip_reads_text_files_in_name_order():
+    data = make_zip({
+        "sinif/zeynep.md": "Zeynep'in ödev metni",
+        "ali.txt": "Ali'nin ödev metni burada",
+        "__MACOSX/._ali.txt": "gizli",
+        ".gizli.txt": "gizli dosya içeriği",
+        "resim.png": "ikili veri",
+    })
+    submissions = parse_zip_submissions(data, max_items=5,
+                                        max_file_size=1000)
+
+    assert submissions == [
+        {"name": "ali", "assignment_text": "Ali'nin ödev metni burada"},
+        {"name": "zeynep", "assignment_text": "Zeynep'in ödev metni"},
+    ]
+
+
+# Geçersiz ZIP arşivlerinin reddedilmesini sınayan fonksiyon
+@pytest.mark.parametrize("data, message", [
+    (b"zip degil", "okunamadı"),
+    (make_zip({"resim.png": "x"}), "bulunamadı"),
+    (make_zip({"a.txt": "a" * 50, "b.txt": "b" * 50, "c.txt": "c" * 50}),
+     "en fazla 2"),
+    (make_zip({"buyuk.txt": "x" * 101}), "çok büyük"),
+    (make_zip({"latin.txt": "ödev metni".encode("latin-1")}), "UTF-8"),
+])
+def test_zip_rejects_invalid_archives(data, message):
+    with pytest.raises(BatchSubmissionError, match=message):
+        parse_zip_submissions(data, max_items=2, max_file_size=100)
@@ -0,0 +1,82 @@
+"""
+BTK Hackathon 2025 - Eğitim İçeriği Arama Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya Türkçe kök bulucuyu, sorgu köklerini ve işaretli özet
+üretimini sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from education.content_search import (  # noqa: E402
+    SNIPPET_LENGTH,
+    build_snippet,
+    query_terms,
+    stem,
+    turkish_lower,
+)
+
+
+# Türkçe küçük harf çevrimini sınayan fonksiyon
+def test_turkish_lower_handles_dotted_letters():
+    assert turkish_lower("IŞIK İZMİR") == "ışık izmir"
+
+
+# Eklerin atılıp ASCII köke çevrilmesini sınayan fonksiyon
+@pytest.mark.parametrize("word, root", [
+    ("kitaplardan", "kitap"),
+    ("kitabı", "kitap"),
+    ("fonksiyonları", "fonksiyon"),
+    ("ağacı", "agac"),
+    ("matematik", "matematik"),
+    ("ev", "ev"),
+])
+def test_stem_strips_suffixes(word, root):
+    assert stem(turkish_lower(word)) == root
+
+
+# Aynı kelimenin çekimlerinin aynı köke inmesini sınayan fonksiyon
+def test_stem_is_consistent_across_inflections():
+    roots = {stem(turkish_lower(word))
+             for word in ("öğrenci", "öğrenciler", "öğrencilerin")}
+
+    assert len(roots) == 1
+
+
+# Sorgu köklerinin tekrarsız ve sıralı olmasını sınayan fonksiyon
+def test_query_terms_deduplicates_and_drops_short_words():
+    terms = query_terms("Fonksiyonların TÜREVİ ve türev, fonksiyon")
+
+    assert terms == ["fonksiyon", "turev"]
+
+
+# Eşleşen kelimelerin işaretlenmesini sınayan fonksiyon
+def test_snippet_marks_matches_and_escapes_html():
+    snippet = build_snippet("<b>Türev</b> kuralı ve türevi", ["turev"])
+
+    assert snippet == ("&lt;b&gt;<mark>Türev</mark>&lt;/b&gt; kuralı ve "
+                       "<mark>türevi</mark>")
+
+
+# Özetin ilk eşleşmenin çevresinden alınmasını sınayan fonksiyon
+def test_snippet_is_centered_on_first_match():
+    content = "giriş " * 100 + "türev konusu " + "sonuç " * 100
+    snippet = build_snippet(content, ["turev"])
+
+    assert snippet.startswith("…giriş ")
+    assert snippet.endswith("…")
+    assert "<mark>türev</mark>" in snippet
+    assert len(snippet.replace("<mark>", "").replace("</mark>", "")) \
+        <= SNIPPET_LENGTH + 2
+
+
+# Eşleşme yoksa metnin başından özet alınmasını sınayan fonksiyon
+def test_snippet_without_match_uses_beginning():
+    assert build_snippet("hiç eşleşme yok", ["xyz"]) == "hiç eşleşme yok"
@@ -0,0 +1,113 @@
+"""
+BTK Hackathon 2025 - Yinelenen Ödev Değerlendirmesi Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya gönderim özetini ve başarısız değerlendirmelerin yeniden
+gönderimde döndürülmemesini veri tabanına bağlanmadan sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from education import evaluation_dedup  # noqa: E402
+from education.evaluate_assignment import is_error_result  # noqa: E402
+from education.evaluation_dedup import (  # noqa: E402
+    find_recent_evaluation,
+    stored_digest,
+    submission_digest,
+)
+
+
+ASSIGNMENT = "1. Soru: Fotosentez nedir?\nCevap: Bitkilerin besin üretmesi."
+CRITERIA = "Doğruluk ve açıklık"
+REPORT = "🎯 GENEL DEĞERLENDİRME\nPuan: 80/100\nGenel Görüş: İyi."
+FAILURE = "Ödev değerlendirilirken hata oluştu: 503 Service Unavailable"
+
+
+# Değerlendirme kayıtlarını bellekte tutan sahte veri tabanı sınıfı
+class FakeDatabase:
+    """Değerlendirme kayıtlarını bellekte tutan sahte veri tabanı sınıfı"""
+
+    def __init__(self):
+        self.rows = []
+
+    def save(self, user_id, assignment_text, criteria, evaluation_result):
+        self.rows.append({
+            "id": len(self.rows) + 1,
+            "user_id": user_id,
+            "submission_digest": stored_digest(
+                assignment_text, criteria, evaluation_result
+            ),
+            "evaluation_result": evaluation_result,
+            "score": None,
+        })
+
+    def execute_single(self, query, params=None):
+        user_id, digest, _ = params
+        matches = [row for row in self.rows
+                   if row["user_id"] == user_id
+                   and row["submission_digest"] == digest]
+        return matches[-1] if matches else None
+
+
+# Sahte veri tabanını kuran fonksiyon
+@pytest.fixture
+def database(monkeypatch):
+    fake = FakeDatabase()
+    monkeypatch.setattr(evaluation_dedup, "get_db", lambda: fake)
+    monkeypatch.setattr(evaluation_dedup, "DEDUP_WINDOW_MINUTES", 1440)
+    return fake
+
+
+# Özetin satır sonu ve boşluk farklarını yok saymasını sınayan fonksiyon
+def test_digest_ignores_line_endings_and_trailing_spaces():
+    windows = ASSIGNMENT.replace("\n", "  \r\n") + "\n"
+
+    assert submission_digest(windows, CRITERIA) == \
+        submission_digest(ASSIGNMENT, CRITERIA)
+    assert submission_digest(ASSIGNMENT, "Başka kriter") != \
+        submission_digest(ASSIGNMENT, CRITERIA)
+
+
+# Hata iletilerinin tanınmasını sınayan fonksiyon
+@pytest.mark.parametrize("text, failed", [
+    (FAILURE, True),
+    ("Hata: Ödev metni boş olamaz!", True),
+    ("Uyarı: Çok kısa ödev metni!", True),
+    (REPORT, False),
+])
+def test_error_results_are_stored_without_digest(text, failed):
+    assert is_error_result(text) is failed
+    assert (stored_digest(ASSIGNMENT, CRITERIA, text) is None) is failed
+
+
+# Başarısız değerlendirmeden sonra yeniden gönderimin Gemini'ye
+# sorulmasını sınayan fonksiyon
+def test_failed_then_retried_submission(database):
+    digest = submission_digest(ASSIGNMENT, CRITERIA)
+
+    # İlk deneme geçici bir hatayla sonuçlanır ve geçmişe kaydedilir
+    database.save(7, ASSIGNMENT, CRITERIA, FAILURE)
+    assert find_recent_evaluation(7, digest) is None
+
+    # Yeniden gönderim değerlendirilir; sonraki gönderim bunu alır
+    database.save(7, ASSIGNMENT, CRITERIA, REPORT)
+    previous = find_recent_evaluation(7, digest)
+    assert previous["evaluation_result"] == REPORT
+    assert find_recent_evaluation(8, digest) is None
+
+
+# Süre 0 iken denetimin kapalı olmasını sınayan fonksiyon
+def test_zero_window_disables_lookup(database, monkeypatch):
+    database.save(7, ASSIGNMENT, CRITERIA, REPORT)
+    monkeypatch.setattr(evaluation_dedup, "DEDUP_WINDOW_MINUTES", 0)
+
+    assert find_recent_evaluation(
+        7, submission_digest(ASSIGNMENT, CRITERIA)
+    ) is None
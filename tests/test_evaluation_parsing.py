@@ -0,0 +1,123 @@
+"""
+BTK Hackathon 2025 - Ödev Değerlendirme Ayrıştırma Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya akış ayrıştırıcısını, ödevin parçalara ayrılmasını ve parça
+puanlarının birleştirilmesini Gemini'ye bağlanmadan sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import pytest
+
+pytest.importorskip("google.api_core")
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from education.evaluate_assignment import (  # noqa: E402
+    EvaluationStreamParser,
+    split_assignment,
+    weighted_score,
+)
+
+
+REPORT = """🎯 GENEL DEĞERLENDİRME
+Puan: 85/100
+Genel Görüş: İyi bir çalışma.
+
+✅ GÜÇLÜ YÖNLER
+- Açık anlatım
+
+📈 Geliştirilebilir Alanlar
+- Kaynak eksik
+"""
+
+
+# Metni parçalar halinde ayrıştırıcıya veren fonksiyon
+def feed_in_pieces(parser, text, size):
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    events.extend(parser.finish())
+    return events
+
+
+# Bölüm ve puan olaylarını sınayan fonksiyon
+@pytest.mark.parametrize("size", [1, 7, 1000])
+def test_stream_parser_emits_score_and_sections(size):
+    parser = EvaluationStreamParser()
+    events = feed_in_pieces(parser, REPORT, size)
+
+    assert events[0] == ("score", {"score": 85.0})
+    sections = [data for name, data in events if name == "section"]
+    assert [section["title"] for section in sections] == [
+        "GENEL DEĞERLENDİRME",
+        "GÜÇLÜ YÖNLER",
+        "GELİŞTİRİLEBİLİR ALANLAR",
+    ]
+    assert sections[1]["content"] == "- Açık anlatım"
+    assert parser.score == 85.0
+    assert parser.text == REPORT
+
+
+# Puan satırı yoksa puanın tüm metinden çıkarılmasını sınayan fonksiyon
+def test_stream_parser_falls_back_to_legacy_score():
+    parser = EvaluationStreamParser()
+    events = feed_in_pieces(parser, "Ödev 72 puan aldı.", 4)
+
+    assert events[-1] == ("score", {"score": 72.0})
+
+
+# Virgüllü puanın okunmasını sınayan fonksiyon
+def test_stream_parser_reads_decimal_comma():
+    parser = EvaluationStreamParser()
+    parser.feed("Puan: 92,5 / 100\n")
+
+    assert parser.score == 92.5
+
+
+# Kısa ödevin tek parça kalmasını sınayan fonksiyon
+def test_split_assignment_keeps_short_text():
+    assert split_assignment("  Kısa ödev.  ", chunk_size=500) == ["Kısa ödev."]
+
+
+# Soruların parçalar arasında bölünmemesini sınayan fonksiyon
+def test_split_assignment_keeps_questions_together():
+    questions = [f"{number}. Soru: " + "cevap " * 60
+                 for number in range(1, 6)]
+    text = "Giriş\n" + "\n".join(questions)
+    chunks = split_assignment(text, chunk_size=800)
+
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 800 for chunk in chunks)
+    for question in questions:
+        assert sum(question.strip() in chunk for chunk in chunks) == 1
+    assert chunks[0].startswith("Giriş")
+
+
+# Uzun paragrafın boşluklardan bölünmesini sınayan fonksiyon
+def test_split_assignment_splits_oversized_paragraph():
+    text = " ".join(f"kelime{index}" for index in range(400))
+    chunks = split_assignment(text, chunk_size=500)
+
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+# Ağırlıklı ortalamanın hesaplanmasını sınayan fonksiyon
+def test_weighted_score_uses_lengths():
+    assert weighted_score([80, 60], [3000, 1000]) == 75.0
+
+
+# Okunamayan ve sınır dışı puanları sınayan fonksiyon
+def test_weighted_score_skips_missing_and_clamps():
+    assert weighted_score([None, 120, -5], [100, 100, 100]) == 50.0
+    assert weighted_score([90, 40], [0, 100]) == 40.0
+
+
+# Hiç puan yoksa None döndürülmesini sınayan fonksiyon
+def test_weighted_score_without_scores():
+    assert weighted_score([None, None], [10, 20]) is None
+    assert weighted_score([], []) is None
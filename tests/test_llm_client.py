@@ -0,0 +1,203 @@
+"""
+BTK Hackathon 2025 - Dayanıklı Gemini Çağrı Katmanı Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya devre kesicinin açılma, bekleme ve deneme isteği davranışını
+ve yedek isteklerin iş parçacığı havuzunda kuyruğa alınmadığını sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import threading
+
+import pytest
+
+pytest.importorskip("google.api_core")
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from education import llm_client  # noqa: E402
+from education.llm_client import (  # noqa: E402
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientCaller,
+)
+
+
+# Süreyi elle ilerletilebilen saat sınıfı
+class FakeClock:
+    """Süreyi elle ilerletilebilen saat sınıfı"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+# Sahte saati kuran fonksiyon
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(llm_client.time, "monotonic", fake)
+    return fake
+
+
+# Devrenin eşikte açılmasını sınayan fonksiyon
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(threshold=3, cooldown=30)
+    for _ in range(2):
+        breaker.before_call("k")
+        breaker.record_failure("k")
+    breaker.before_call("k")
+    breaker.record_failure("k")
+
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_call("k")
+    assert error.value.retry_after == 30
+    assert breaker.opened == 1
+    assert breaker.open_count() == 1
+    breaker.before_call("başka")
+
+
+# Başarılı çağrının hata sayacını sıfırlamasını sınayan fonksiyon
+def test_success_resets_failures(clock):
+    breaker = CircuitBreaker(threshold=2, cooldown=30)
+    breaker.record_failure("k")
+    breaker.record_success("k")
+    breaker.record_failure("k")
+
+    breaker.before_call("k")
+    assert breaker.opened == 0
+
+
+# Bekleme süresi dolunca tek deneme isteğine izin verilmesini sınayan
+# fonksiyon
+def test_single_probe_after_cooldown(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    breaker.record_failure("k")
+    clock.now += 30
+
+    breaker.before_call("k")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("k")
+    assert breaker.short_circuited == 1
+
+    breaker.record_success("k")
+    breaker.before_call("k")
+    assert breaker.open_count() == 0
+
+
+# Başarısız deneme isteğinin devreyi yeniden açmasını sınayan fonksiyon
+def test_failed_probe_reopens(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    breaker.record_failure("k")
+    clock.now += 30
+    breaker.before_call("k")
+    breaker.record_failure("k")
+
+    assert breaker.opened == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("k")
+
+
+# Gemini'ye ulaşmayan deneme isteğinin sırayı bırakmasını sınayan fonksiyon
+def test_release_frees_probe(clock):
+    breaker = CircuitBreaker(threshold=1, cooldown=30)
+    breaker.record_failure("k")
+    clock.now += 30
+    breaker.before_call("k")
+    breaker.release("k")
+
+    breaker.before_call("k")
+
+
+# Eşik 0 iken devre kesicinin kapalı olmasını sınayan fonksiyon
+def test_zero_threshold_disables_breaker(clock):
+    breaker = CircuitBreaker(threshold=0)
+    for _ in range(10):
+        breaker.record_failure("k")
+
+    breaker.before_call("k")
+    assert breaker.open_count() == 0
+
+
+# Hızlı ilk isteğin yedeksiz dönmesini sınayan fonksiyon
+def test_fast_primary_is_not_hedged():
+    caller = ResilientCaller(hedge_workers=2)
+
+    result = caller._call_hedged(lambda: "ilk", 5,
+                                 lambda: pytest.fail("yedek istendi"))
+    assert result == "ilk"
+    assert caller.hedged == 0
+    assert caller.hedges_skipped == 0
+
+
+# Yavaş ilk isteğin yanına yedek gönderilmesini sınayan fonksiyon
+def test_slow_primary_is_hedged():
+    caller = ResilientCaller(hedge_workers=2)
+    release = threading.Event()
+
+    def primary():
+        release.wait(5)
+        return "ilk"
+
+    result = caller._call_hedged(primary, 0.01, lambda: lambda: "yedek")
+    release.set()
+    assert result == "yedek"
+    assert caller.hedged == 1
+    assert caller.hedge_wins == 1
+
+
+# Bütçe yoksa yedeğin atlanıp ilk isteğin beklenmesini sınayan fonksiyon
+def test_hedge_skipped_without_budget():
+    caller = ResilientCaller(hedge_workers=2)
+    release = threading.Event()
+
+    def primary():
+        release.wait(5)
+        return "ilk"
+
+    # Sınırlayıcı bütçe ayıramaz; ilk istek ancak bundan sonra biter
+    def make_hedge():
+        release.set()
+        return None
+
+    assert caller._call_hedged(primary, 0.01, make_hedge) == "ilk"
+    assert caller.hedged == 0
+    assert caller.hedges_skipped == 1
+
+
+# Havuz doluyken ilk isteğin çağıranın iş parçacığında çalışmasını sınayan
+# fonksiyon
+def test_busy_pool_runs_primary_on_caller_thread():
+    caller = ResilientCaller(hedge_workers=2)
+    blocker = threading.Event()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        blocker.wait(5)
+        return "meşgul"
+
+    # İlk çağrı havuzdaki iki iş parçacığını da ayırır
+    busy = threading.Thread(
+        target=caller._call_hedged,
+        args=(slow, 5, lambda: pytest.fail("yedek istendi")),
+    )
+    busy.start()
+    started.wait(5)
+
+    threads = []
+    result = caller._call_hedged(
+        lambda: threads.append(threading.current_thread()) or "ilk", 0.01,
+        lambda: pytest.fail("yedek istendi"),
+    )
+    blocker.set()
+    busy.join(5)
+
+    assert result == "ilk"
+    assert threads == [threading.current_thread()]
+    assert caller.hedges_skipped == 1
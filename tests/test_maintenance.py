@@ -0,0 +1,62 @@
+"""
+BTK Hackathon 2025 - Veri Tabanı Bakım Zamanlayıcısı Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya bakım işlerinin zamanlanmasını ve sonuçlarının kaydedilmesini
+arka plan iş parçacığı başlatmadan sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import time
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from database.maintenance import MaintenanceScheduler  # noqa: E402
+
+
+# Başlangıçta çalışacak işin beklemeden sıraya girmesini sınayan fonksiyon
+def test_run_at_start_schedules_first_run_now():
+    scheduler = MaintenanceScheduler()
+    scheduler.add_task("later", lambda: 0, 3600)
+    scheduler.add_task("now", lambda: 0, 3600, run_at_start=True)
+
+    tasks = {task.name: task for task in scheduler._tasks}
+    assert tasks["now"].next_run <= time.monotonic()
+    assert tasks["later"].next_run > time.monotonic() + 3000
+
+
+# Aralığı 0 olan işin eklenmemesini sınayan fonksiyon
+def test_zero_interval_disables_task():
+    scheduler = MaintenanceScheduler()
+    scheduler.add_task("off", lambda: 0, 0, run_at_start=True)
+
+    assert scheduler.stats() == {}
+
+
+# İş sonuçlarının ve hatalarının kaydedilmesini sınayan fonksiyon
+def test_run_now_records_rows_and_failures():
+    scheduler = MaintenanceScheduler()
+    results = iter([5, RuntimeError("kilit zaman aşımı")])
+
+    def task():
+        result = next(results)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    scheduler.add_task("task", task, 60)
+
+    stats = scheduler.run_now("task")
+    assert stats["last_rows"] == 5
+    assert stats["total_rows"] == 5
+
+    stats = scheduler.run_now("task")
+    assert stats["failures"] == 1
+    assert stats["last_error"] == "kilit zaman aşımı"
+    assert scheduler.run_now("missing") is None
@@ -0,0 +1,108 @@
+"""
+BTK Hackathon 2025 - Bellek İçi Önbellek Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya TTLCache sınıfının süre, boyut ve silme davranışlarını sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+from database import memory_cache
+from database.memory_cache import TTLCache
+
+
+# Süreyi elle ilerletilebilen saat sınıfı
+class FakeClock:
+    """Süreyi elle ilerletilebilen saat sınıfı"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+# Saati sahte saatle değiştiren fonksiyon
+def use_fake_clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(memory_cache.time, "monotonic", clock)
+    return clock
+
+
+# Yazılan değerin okunmasını sınayan fonksiyon
+def test_get_returns_value_and_counts_hits():
+    cache = TTLCache(max_size=4)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b", "yok") == "yok"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+# Süresi dolan kaydın silinmesini sınayan fonksiyon
+def test_entry_expires_after_ttl(monkeypatch):
+    clock = use_fake_clock(monkeypatch)
+    cache = TTLCache(ttl=10)
+    cache.set("a", 1)
+
+    clock.now += 9.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+# Kayıt başına verilen sürenin varsayılanı ezmesini sınayan fonksiyon
+def test_per_entry_ttl_overrides_default(monkeypatch):
+    clock = use_fake_clock(monkeypatch)
+    cache = TTLCache(ttl=60)
+    cache.set("kısa", 1, ttl=5)
+    cache.set("uzun", 2)
+
+    clock.now += 30
+    assert cache.get("kısa") is None
+    assert cache.get("uzun") == 2
+
+
+# Süresi sıfır olan kaydın yazılmamasını sınayan fonksiyon
+def test_non_positive_ttl_is_not_stored():
+    cache = TTLCache()
+    cache.set("a", 1, ttl=0)
+
+    assert "a" not in cache._data
+    assert cache.get("a") is None
+
+
+# Boyut aşılınca en eski kullanılan kaydın atılmasını sınayan fonksiyon
+def test_evicts_least_recently_used():
+    cache = TTLCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+# Silme fonksiyonlarını sınayan fonksiyon
+def test_delete_and_delete_where():
+    cache = TTLCache()
+    for user_id in (1, 2, 3):
+        cache.set(("gemini", user_id), user_id)
+    cache.set(("başka", 1), 0)
+
+    assert cache.delete(("başka", 1)) is True
+    assert cache.delete(("başka", 1)) is False
+    removed = cache.delete_where(lambda key, value: value >= 2)
+    assert removed == 2
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,116 @@
+"""
+BTK Hackathon 2025 - Gemini Model İstemcisi Önbelleği Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya modele özel istemcilerin kurulu google-generativeai sürümüyle
+oluşturulabildiğini, iç arayüz yoksa genel yapılandırmaya dönüldüğünü ve
+önbellekte API anahtarının tutulmadığını Gemini'ye bağlanmadan sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import pytest
+
+pytest.importorskip("google.generativeai")
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from education import model_cache  # noqa: E402
+from education.model_cache import (  # noqa: E402
+    GloballyConfiguredModel,
+    ModelCache,
+    build_isolated_model,
+    isolated_clients_supported,
+    key_fingerprint,
+)
+from education.rate_limiter import RateLimitedModel  # noqa: E402
+
+
+# Kurulu kütüphanede iç arayüzlerin bulunmasını sınayan fonksiyon
+def test_installed_sdk_supports_isolated_clients():
+    # Bu sınama başarısız olursa google-generativeai sürümü iç
+    # arayüzlerini değiştirmiştir; build_isolated_model güncellenmelidir
+    assert isolated_clients_supported() is True
+    assert model_cache.ISOLATED_CLIENTS is True
+
+
+# Her anahtarın kendi istemcisini almasını sınayan fonksiyon
+def test_isolated_models_get_separate_clients():
+    first = build_isolated_model("AIza-birinci", "gemini-2.5-flash")
+    second = build_isolated_model("AIza-ikinci", "gemini-2.5-flash")
+
+    assert first._client is not None
+    assert first._client is not second._client
+    assert first.model_name == "models/gemini-2.5-flash"
+
+
+# İç arayüz kaybolunca denetimin False döndürmesini sınayan fonksiyon
+def test_missing_client_manager_is_detected(monkeypatch):
+    monkeypatch.delattr(model_cache.genai_client, "_ClientManager")
+
+    assert isolated_clients_supported() is False
+
+
+# İç arayüz yoksa genel yapılandırmaya dönülmesini sınayan fonksiyon
+def test_fallback_configures_key_before_each_call(monkeypatch):
+    calls = []
+
+    class FakeModel:
+        def __init__(self, model_name):
+            self.model_name = model_name
+
+        def generate_content(self, contents, **kwargs):
+            calls.append(("generate", self.model_name, contents))
+            return "yanıt"
+
+    monkeypatch.setattr(model_cache, "ISOLATED_CLIENTS", False)
+    monkeypatch.setattr(model_cache.genai, "GenerativeModel", FakeModel)
+    monkeypatch.setattr(model_cache.genai, "configure",
+                        lambda api_key: calls.append(("configure", api_key)))
+
+    first = build_isolated_model("AIza-birinci", "gemini-2.5-flash")
+    second = build_isolated_model("AIza-ikinci", "gemini-2.5-flash")
+    assert isinstance(first, GloballyConfiguredModel)
+    assert first.model_name == "gemini-2.5-flash"
+
+    assert first.generate_content("a") == "yanıt"
+    second.generate_content("b")
+    assert calls == [
+        ("configure", "AIza-birinci"),
+        ("generate", "gemini-2.5-flash", "a"),
+        ("configure", "AIza-ikinci"),
+        ("generate", "gemini-2.5-flash", "b"),
+    ]
+
+
+# Kullanıcı kaydında API anahtarının tutulmamasını sınayan fonksiyon
+def test_user_entry_holds_fingerprint_not_key(monkeypatch):
+    reads = []
+
+    def read_key(user_id):
+        reads.append(user_id)
+        return "AIza-gizli"
+
+    monkeypatch.setattr(model_cache, "get_user_gemini_api_key", read_key)
+    monkeypatch.setattr(model_cache, "get_user_settings",
+                        lambda user_id: {"gemini_model": "gemini-2.5-pro"})
+    monkeypatch.setattr(model_cache, "build_isolated_model",
+                        lambda api_key, model_name: object())
+
+    cache = ModelCache()
+    model, fingerprint = cache.get_user_model(7)
+    again, _ = cache.get_user_model(7)
+
+    assert fingerprint == key_fingerprint("AIza-gizli")
+    # Dönen model sınırlayıcıyla sarmalanır; altındaki istemci paylaşılır
+    assert isinstance(model, RateLimitedModel)
+    assert again._model is model._model
+    assert reads == [7]
+    assert cache.resolved.get(7) == (fingerprint, "gemini-2.5-pro")
+
+    # Model önbellekten atılınca anahtar yeniden okunur
+    cache.models.clear()
+    cache.get_user_model(7)
+    assert reads == [7, 7]
@@ -0,0 +1,127 @@
+"""
+BTK Hackathon 2025 - İmleç Tabanlı Sayfalama Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya imleç kodlamasını ve limit + 1 satır okuyarak sonraki sayfanın
+bulunmasını veri tabanına bağlanmadan sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from database import pagination  # noqa: E402
+from database.pagination import (  # noqa: E402
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+# Sorguları kaydeden sahte veri tabanı sınıfı
+class FakeDatabase:
+    """Sorguları kaydeden sahte veri tabanı sınıfı"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def execute_query(self, query, params=None):
+        self.calls.append((query, params))
+        limit = params[-1]
+        return list(self.rows[:limit])
+
+
+# Sıralı geçmiş satırları üreten fonksiyon
+def make_rows(count):
+    start = datetime(2025, 9, 1, 12, 0, 0)
+    return [
+        {"id": count - index, "evaluated_at": start - timedelta(minutes=index)}
+        for index in range(count)
+    ]
+
+
+# Sahte veri tabanıyla sayfa getiren fonksiyon
+def fetch_page(monkeypatch, rows, limit, cursor=None):
+    database = FakeDatabase(rows)
+    monkeypatch.setattr(pagination, "get_db", lambda: database)
+    page = pagination.fetch_keyset_page(
+        "assignment_evaluations", "id, evaluated_at", 7, "evaluated_at",
+        limit, cursor,
+    )
+    return page, database
+
+
+# İmlecin kodlanıp çözülmesini sınayan fonksiyon
+def test_cursor_round_trip():
+    timestamp = datetime(2025, 9, 14, 8, 30, 15, 123456)
+    cursor = encode_cursor(timestamp, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (timestamp, 42)
+
+
+# Bozuk imleçlerin reddedilmesini sınayan fonksiyon
+@pytest.mark.parametrize("cursor", ["", "bozuk!", "WzFd", "eyJhIjoxfQ"])
+def test_invalid_cursor_raises(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+# Geçersiz imleç hatasının ValueError olmasını sınayan fonksiyon
+def test_invalid_cursor_is_value_error():
+    assert issubclass(InvalidCursorError, ValueError)
+
+
+# Fazladan satır varsa sonraki imlecin üretilmesini sınayan fonksiyon
+def test_extra_row_produces_next_cursor(monkeypatch):
+    rows = make_rows(6)
+    (page, next_cursor), database = fetch_page(monkeypatch, rows, 5)
+
+    assert database.calls[0][1] == (7, 6)
+    assert [row["id"] for row in page] == [6, 5, 4, 3, 2]
+    assert decode_cursor(next_cursor) == (rows[4]["evaluated_at"], 2)
+
+
+# Son sayfada imleç üretilmemesini sınayan fonksiyon
+def test_last_page_has_no_cursor(monkeypatch):
+    (page, next_cursor), _ = fetch_page(monkeypatch, make_rows(5), 5)
+
+    assert len(page) == 5
+    assert next_cursor is None
+
+
+# İmlecin sorgu koşuluna eklenmesini sınayan fonksiyon
+def test_cursor_adds_keyset_condition(monkeypatch):
+    timestamp = datetime(2025, 9, 1, 11, 0, 0)
+    cursor = encode_cursor(timestamp, 10)
+    (page, _), database = fetch_page(monkeypatch, [], 3, cursor)
+
+    query, params = database.calls[0]
+    assert page == []
+    assert "evaluated_at < %s" in query
+    assert params == (7, timestamp, timestamp, 10, 4)
+
+
+# Sayfalama parametrelerinin okunmasını sınayan fonksiyon
+def test_page_args_defaults_and_limits():
+    assert pagination.parse_page_args({}) == (10, None, True)
+    assert pagination.parse_page_args(
+        {"limit": "500", "cursor": "abc", "include_total": "false"}
+    ) == (50, "abc", False)
+    assert pagination.parse_page_args({"limit": "0"})[0] == 1
+
+
+# Eski page parametresinin sessizce yok sayılmamasını sınayan fonksiyon
+def test_page_parameter_beyond_first_page_is_rejected():
+    assert pagination.parse_page_args({"page": "1"}) == (10, None, True)
+
+    with pytest.raises(InvalidCursorError, match="next_cursor"):
+        pagination.parse_page_args({"page": "2"})
@@ -0,0 +1,105 @@
+"""
+BTK Hackathon 2025 - Gemini İstek Sınırlayıcı Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya jeton kovasının dolum ve bekleme hesabını, sınırlayıcının
+bekleyerek ve beklemeden bütçe ayırma davranışını ve kovaların dolmadan
+önbellekten düşmediğini sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+import time
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from education.rate_limiter import (  # noqa: E402
+    GeminiRateLimiter,
+    RateLimitExceededError,
+    TokenBucket,
+)
+
+
+# Yeni kovanın dolu başlamasını sınayan fonksiyon
+def test_bucket_starts_full():
+    bucket = TokenBucket(60)
+
+    assert bucket.wait_time(60, bucket.updated) == 0
+    bucket.take(60)
+    assert bucket.wait_time(1, bucket.updated) == pytest.approx(1.0)
+
+
+# Kovanın geçen süreyle dolmasını sınayan fonksiyon
+def test_bucket_refills_over_time():
+    bucket = TokenBucket(60)
+    now = bucket.updated
+    bucket.take(60)
+
+    assert bucket.wait_time(10, now + 4) == pytest.approx(6.0)
+    assert bucket.wait_time(10, now + 10) == 0
+    assert bucket.wait_time(100, now + 600) == 0
+    assert bucket.level == 60
+
+
+# Kapasiteden büyük isteğin kovanın dolmasını beklemesini sınayan fonksiyon
+def test_bucket_oversized_request_waits_for_full_bucket():
+    bucket = TokenBucket(60)
+    now = bucket.updated
+    bucket.take(30)
+
+    assert bucket.wait_time(1000, now) == pytest.approx(30.0)
+
+
+# Kova oluşturulmadan önce alınan zamanın dolumu bozmamasını sınayan
+# fonksiyon
+def test_bucket_ignores_earlier_timestamp():
+    bucket = TokenBucket(1)
+
+    assert bucket.wait_time(1, bucket.updated - 0.5) == 0
+    assert bucket.level == 1
+
+
+# Bütçe yetmeyince beklemeden reddedilmesini sınayan fonksiyon
+def test_limiter_rejects_without_wait():
+    limiter = GeminiRateLimiter(key_rpm=1, key_tpm=0, user_rpm=0,
+                                user_tpm=0, max_wait=0)
+    limiter.acquire("anahtar", 1, 100)
+
+    with pytest.raises(RateLimitExceededError) as error:
+        limiter.acquire("anahtar", 1, 100)
+    assert error.value.retry_after >= 1
+    assert limiter.stats()["rejected"] == 1
+
+
+# Beklemeden bütçe ayırmayı sınayan fonksiyon
+def test_limiter_try_acquire_takes_nothing_when_short():
+    limiter = GeminiRateLimiter(key_rpm=0, key_tpm=0, user_rpm=2,
+                                user_tpm=1000, max_wait=0)
+
+    assert limiter.try_acquire("anahtar", 1, 600) is True
+    assert limiter.try_acquire("anahtar", 1, 600) is False
+    assert limiter.try_acquire("anahtar", 1, 300) is True
+    assert limiter.stats()["admitted"] == 2
+    assert limiter.stats()["tokens"] == 900
+
+
+# Kovanın önbellekte en az dolana kadar kalmasını sınayan fonksiyon
+def test_limiter_keeps_buckets_until_refilled():
+    limiter = GeminiRateLimiter(key_rpm=0, key_tpm=0, user_rpm=0,
+                                user_tpm=600, max_wait=0, max_buckets=16)
+    limiter.acquire("anahtar", 1, 100)
+
+    # Tahminden çok harcanan jetonlar kovayı eksiye düşürür
+    limiter.settle("anahtar", 1, 1100)
+    with limiter._lock:
+        limiter._buckets_for("anahtar", 1)
+
+    # 600 jetonluk kova -600'de; dolması 120 saniye sürer
+    _, expires_at = limiter._buckets._data[("user", 1, "tpm")]
+    assert expires_at - time.monotonic() >= 60 + 120 - 1
+    assert limiter._buckets.max_size == 16
@@ -0,0 +1,136 @@
+"""
+BTK Hackathon 2025 - Kullanıcı Sayaçları Birim Sınamaları
+
+Telif Hakkı © 2025 Ercan Ersoy, Erdem Ersoy
+Tüm hakları saklıdır.
+
+Bu dosya sayaç güncellemelerinin çağıranın işleminde yapıldığını ve
+dönemsel yeniden hesaplamanın tüm kullanıcıları gruplar halinde
+dolaştığını veri tabanına bağlanmadan sınar.
+"""
+
+# Gerekli kütüphanelerin içe aktarılması
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("cryptography")
+pytest.importorskip("flask")
+
+from database import user_counters  # noqa: E402
+from database.user_counters import (  # noqa: E402
+    count_assignment,
+    count_assignments,
+    count_education,
+    reconcile_user_counters,
+)
+
+
+NOW = datetime(2025, 9, 14, 8, 30)
+
+
+# Sorguları kaydeden sahte imleç sınıfı
+class FakeCursor:
+    """Sorguları kaydeden sahte imleç sınıfı"""
+
+    def __init__(self, rowcount=1):
+        self.updated_rows = rowcount
+        self.rowcount = 0
+        self.calls = []
+
+    def execute(self, query, params=None):
+        self.calls.append((query, params))
+        updating = query.startswith("UPDATE user_counters")
+        self.rowcount = self.updated_rows if updating else 1
+
+
+# Kullanıcı kimliklerinden gruplar döndüren sahte veri tabanı sınıfı
+class FakeDatabase:
+    """Kullanıcı kimliklerinden gruplar döndüren sahte veri tabanı sınıfı"""
+
+    def __init__(self, user_ids):
+        self.user_ids = user_ids
+        self.refreshed = []
+
+    def execute_single(self, query, params=None):
+        last_id, limit = params
+        batch = [uid for uid in self.user_ids if uid > last_id][:limit]
+        return {"users": len(batch), "last_id": max(batch, default=None)}
+
+    def execute_update(self, query, params=None):
+        assert "ON DUPLICATE KEY UPDATE" in query
+        low, high = params
+        self.refreshed.append(
+            [uid for uid in self.user_ids if low < uid <= high]
+        )
+        return 2 * len(self.refreshed[-1])
+
+
+# Sayaç satırı varken tek bir UPDATE çalıştırılmasını sınayan fonksiyon
+def test_existing_row_is_updated_in_callers_transaction():
+    cursor = FakeCursor(rowcount=1)
+
+    count_assignment(cursor, 7, 85.0, NOW)
+
+    assert len(cursor.calls) == 1
+    query, params = cursor.calls[0]
+    assert query.startswith("UPDATE user_counters")
+    assert params == (85.0, 85.0, NOW, NOW, 7)
+
+
+# Sayaç satırı yoksa aynı imleçle yeniden hesaplanmasını sınayan
+# fonksiyon
+def test_missing_row_is_refreshed_on_same_cursor():
+    cursor = FakeCursor(rowcount=0)
+
+    count_education(cursor, 7, NOW)
+
+    assert len(cursor.calls) == 2
+    refresh, params = cursor.calls[1]
+    assert "INSERT INTO user_counters" in refresh
+    assert "u.id = %s" in refresh
+    assert params == (7,)
+
+
+# Toplu değerlendirmenin tek bir UPDATE ile sayılmasını sınayan fonksiyon
+def test_batch_is_counted_with_one_update():
+    cursor = FakeCursor(rowcount=1)
+
+    count_assignments(cursor, 7, [80.0, None, 60.0], NOW)
+    count_assignments(cursor, 7, [], NOW)
+
+    assert len(cursor.calls) == 1
+    _, params = cursor.calls[0]
+    assert params == (3, 140.0, 2, NOW, NOW, 7)
+
+
+# Sayaç hatasının işlemi geri aldırmak için çağırana iletilmesini sınayan
+# fonksiyon
+def test_counter_errors_propagate():
+    class BrokenCursor(FakeCursor):
+        def execute(self, query, params=None):
+            raise RuntimeError("kilit zaman aşımı")
+
+    with pytest.raises(RuntimeError):
+        count_education(BrokenCursor(), 7, NOW)
+
+
+# Yeniden hesaplamanın tüm kullanıcıları gruplar halinde dolaşmasını
+# sınayan fonksiyon
+def test_reconcile_walks_all_users_in_batches(monkeypatch):
+    database = FakeDatabase([1, 2, 5, 8, 9])
+    monkeypatch.setattr(user_counters, "get_db", lambda: database)
+
+    assert reconcile_user_counters(batch_size=2) == 5
+    assert database.refreshed == [[1, 2], [5, 8], [9]]
+
+
+# Kullanıcı yoksa yeniden hesaplamanın sorgu çalıştırmamasını sınayan
+# fonksiyon
+def test_reconcile_without_users(monkeypatch):
+    database = FakeDatabase([])
+    monkeypatch.setattr(user_counters, "get_db", lambda: database)
+
+    assert reconcile_user_counters(batch_size=2) == 0
+    assert database.refreshed == []